@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Fingerprinted, minified and pre-compressed assets for the HTML guide
+
+Every build copies the stylesheets and scripts pages link to under a name
+carrying a hash of their content (assets/css/main.1a2b3c4d5e.css), so they
+can be served with a long, immutable cache lifetime: when a file changes,
+so does its name, and the pages linking to it are rebuilt. Stylesheets are
+minified on the way. The unversioned files stay in place as the sources.
+
+minify_html() strips the whitespace and comments browsers ignore from pages
+as they are written, leaving <pre> and similar elements exactly as they are.
+
+precompress() writes .gz (and, with the brotli package, .br) siblings for
+the text files under html/, for servers that can send them as they are.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from build_files import write_atomic, write_if_changed
+
+# Brotli is optional; without it only .gz files are written
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Assets pages link to, relative to html/, and whether to minify them as CSS
+PAGE_ASSETS = {
+    "assets/css/main.css": True,
+    "assets/css/highlight.css": True,
+    "assets/js/search.js": False,
+}
+
+# Hex digits of the content hash used in fingerprinted names
+FINGERPRINT_LENGTH = 10
+
+# Files worth serving pre-compressed, and the compressed siblings written
+COMPRESS_SUFFIXES = ('.html', '.css', '.js', '.json', '.xml', '.svg')
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+# Below this, compression saves less than the extra request headers cost
+COMPRESS_MIN_BYTES = 256
+
+CSS_COMMENT_RE = re.compile(r'/\*(?!!).*?\*/', re.DOTALL)
+# Strings are matched first so nothing inside them is touched
+CSS_TOKEN_RE = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|\s*([{};,>])\s*|(:)\s+|\s+')
+CSS_EMPTY_RULE_END_RE = re.compile(r';+}')
+
+# Comments, doctypes, tags (with quoted attribute values, which may hold a
+# '>') and the text between them
+HTML_TOKEN_RE = re.compile(r'(<!--.*?-->)|(<!(?!--)[^>]*>)|(<(/?)([a-zA-Z][\w:-]*)(?:"[^"]*"|\'[^\']*\'|[^\'">])*>)'
+                           r'|([^<]+|<)', re.DOTALL)
+# Whitespace as HTML defines it; a no-break space is not collapsible
+HTML_SPACE_RE = re.compile(r'[ \t\n\r\f]+')
+# Elements whose content is kept exactly as written
+HTML_RAW_ELEMENTS = frozenset(["pre", "textarea", "script", "style"])
+# Elements that start and end a line box (or are never rendered), so
+# whitespace next to their tags is never displayed. <script> is left out:
+# it may sit between two words
+HTML_BLOCK_ELEMENTS = frozenset("""
+    html head body title meta link base
+    header footer main nav section article aside address form fieldset legend details summary
+    div p pre blockquote figure figcaption hr h1 h2 h3 h4 h5 h6
+    ul ol li dl dt dd table caption colgroup col thead tbody tfoot tr td th
+""".split())
+
+def minify_css(text):
+    """text without comments and unneeded whitespace
+
+    Only whitespace that never matters is removed: around braces, semicolons,
+    commas and child combinators, and after colons. Spaces before a colon
+    (a descendant pseudo-class selector) and around + and - (calc()) stay.
+    """
+
+    def token(match):
+        string, punctuation, colon = match.groups()
+        if string:
+            return string
+        if punctuation:
+            return punctuation
+        if colon:
+            return colon
+        return ' '
+
+    text = CSS_TOKEN_RE.sub(token, CSS_COMMENT_RE.sub('', text))
+    return CSS_EMPTY_RULE_END_RE.sub('}', text).strip() + "\n"
+
+def html_parts(text):
+    """(kind, text, is_block) parts of text, kind being 'tag', 'comment', 'raw' or 'text'
+
+    An element listed in HTML_RAW_ELEMENTS is one 'raw' part from its opening
+    tag to its closing one, or to the end of text if that is missing. So is
+    a doctype. An unterminated comment is 'text'.
+    """
+
+    parts = []
+    position = 0
+    while position < len(text):
+        match = HTML_TOKEN_RE.match(text, position)
+        comment, declaration, tag, slash, name, data = match.groups()
+        if comment:
+            parts.append(('comment', comment, False))
+        elif declaration:
+            parts.append(('raw', declaration, True))
+        elif tag:
+            name = name.lower()
+            if name in HTML_RAW_ELEMENTS and not slash:
+                close = re.compile(rf'</{name}\s*>', re.IGNORECASE).search(text, match.end())
+                end = close.end() if close else len(text)
+                parts.append(('raw', text[position:end], name in HTML_BLOCK_ELEMENTS))
+                position = end
+                continue
+            parts.append(('tag', tag, name in HTML_BLOCK_ELEMENTS))
+        else:
+            parts.append(('text', data, False))
+        position = match.end()
+    return parts
+
+def minify_html_parts(parts):
+    """HTML of html_parts() without comments and the whitespace browsers do not display
+
+    The parts should start at the beginning of a page or just after a
+    block-level tag, and end just after one or at the end of the page:
+    whitespace at either end is dropped. Runs of whitespace in text become
+    one space, or nothing next to the tag of a block-level element. Tags are
+    kept as written, and so is everything inside <pre>, <textarea>, <script>
+    and <style>.
+    """
+
+    parts = [part for part in parts if part[0] != 'comment']
+    out = []
+    for i, (kind, part, is_block) in enumerate(parts):
+        if kind != 'text':
+            out.append(part)
+            continue
+        part = HTML_SPACE_RE.sub(' ', part)
+        if i == 0 or parts[i - 1][2]:
+            part = part.lstrip(' ')
+        if i == len(parts) - 1 or parts[i + 1][2]:
+            part = part.rstrip(' ')
+        out.append(part)
+    return ''.join(out)
+
+def minify_html(chunks):
+    """Yield the HTML of chunks, a page in pieces, minified by minify_html_parts()
+
+    Pieces are cut after block-level tags, so a page can be minified as it
+    is streamed out without holding more of it than the chunk being written.
+    """
+
+    pending = ''
+    for chunk in chunks:
+        pending += chunk
+        # Nothing after a comment that may still be open can be cut yet; a
+        # raw element still open runs to the end, so no tag after it counts
+        limit = len(pending)
+        start = pending.rfind('<!--')
+        if start >= 0 and pending.find('-->', start) < 0:
+            limit = start
+        parts = html_parts(pending[:limit])
+        cut = next((i + 1 for i in range(len(parts) - 1, -1, -1)
+                    if parts[i][0] == 'tag' and parts[i][2]), 0)
+        if cut:
+            yield minify_html_parts(parts[:cut])
+            pending = pending[sum(len(part) for _, part, _ in parts[:cut]):]
+    text = minify_html_parts(html_parts(pending))
+    yield text if text.endswith("\n") else text + "\n"
+
+def fingerprinted_path(path, data):
+    """path with a hash of data inserted before its extension"""
+
+    stem, dot, suffix = path.rpartition('.')
+    digest = hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+    return f"{stem}.{digest}{dot}{suffix}"
+
+def fingerprint_pattern(path):
+    """Regex matching path and any fingerprinted name of it"""
+
+    stem, dot, suffix = path.rpartition('.')
+    return re.compile(rf'{re.escape(stem)}(?:\.[0-9a-f]{{{FINGERPRINT_LENGTH}}})?{re.escape(dot + suffix)}')
+
+def build_assets(output_dir, assets=PAGE_ASSETS):
+    """Write fingerprinted copies of the page assets under output_dir
+
+    Returns {path: fingerprinted path} for the assets that exist, relative
+    to output_dir. Older fingerprinted copies are removed.
+    """
+
+    urls = {}
+    for path, is_css in assets.items():
+        source = output_dir / path
+        try:
+            data = source.read_bytes()
+        except OSError:
+            continue
+        if is_css:
+            data = minify_css(data.decode('utf-8')).encode('utf-8')
+
+        url = urls[path] = fingerprinted_path(path, data)
+        write_if_changed(output_dir / url, data)
+
+        pattern = fingerprint_pattern(source.name)
+        for old in source.parent.iterdir():
+            if old.name not in (source.name, (output_dir / url).name) and pattern.fullmatch(old.name):
+                old.unlink()
+    return urls
+
+def rewrite_asset_urls(text, urls):
+    """text with links to the unversioned assets (or older fingerprints) pointed at urls"""
+
+    for path, url in urls.items():
+        text = fingerprint_pattern(path).sub(url, text)
+    return text
+
+def precompress(output_dir):
+    """Write .gz (and .br, if brotli is installed) siblings for text files under output_dir
+
+    A sibling is only rewritten when it is older than its file, so pages
+    the build left untouched are not compressed again. Siblings whose file
+    is gone are removed. Returns the number of files compressed.
+    """
+
+    compressed = 0
+    for directory, _, names in os.walk(output_dir):
+        present = set(names)
+        for name in names:
+            path = os.path.join(directory, name)
+            if name.endswith(COMPRESSED_SUFFIXES):
+                if name[:-3] not in present:
+                    os.unlink(path)
+                continue
+            if name.startswith('.') or not name.endswith(COMPRESS_SUFFIXES):
+                continue
+
+            stat = os.stat(path)
+            if stat.st_size < COMPRESS_MIN_BYTES:
+                continue
+            targets = [(path + '.gz', lambda data: gzip.compress(data, 9, mtime=0))]
+            if brotli is not None:
+                targets.append((path + '.br', brotli.compress))
+
+            data = None
+            for target, compress in targets:
+                try:
+                    if os.stat(target).st_mtime_ns >= stat.st_mtime_ns:
+                        continue
+                except OSError:
+                    pass
+                if data is None:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                write_atomic(Path(target), compress(data))
+            if data is not None:
+                compressed += 1
+    return compressed
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Synthetic guide corpora for the benchmark suite
+
+Scaled corpora are assembled from blocks (paragraphs, lists, headings and
+fenced code) of the real guide/ chapters, so the markup mix stays
+realistic. A corpus scaled to N times the guide is made of:
+
+- many small chapters of a few blocks each (60% of the bytes)
+- a few huge chapters (25%)
+- code-heavy chapters that are nearly all fences, thousands per file (15%)
+
+Generation is seeded, so the same guide/ always gives the same corpus.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+GUIDE_DIR = BASE_DIR / "guide"
+
+# Bump whenever the generated corpora change shape, so old baselines are not compared
+CORPUS_VERSION = 1
+SEED = 20240101
+
+# Corpus name -> size as a multiple of guide/
+SCALES = {"10x": 10, "100x": 100}
+
+SMALL_SHARE = 0.60
+HUGE_SHARE = 0.25
+HUGE_FILES = 3
+CODE_HEAVY_FILES = 2
+SMALL_BLOCKS = (4, 16)
+
+# Chapters per NN major number in generated file names
+CHAPTERS_PER_PART = 100
+
+def corpus_names():
+    """Every corpus the suite knows about, smallest first"""
+    return ["guide"] + list(SCALES)
+
+def split_blocks(text):
+    """Blank-line separated blocks of a chapter, keeping fenced code whole"""
+
+    blocks = []
+    current = []
+    in_fence = False
+    for line in text.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if current:
+                blocks.append('\n'.join(current))
+                current = []
+        else:
+            current.append(line)
+    if current:
+        blocks.append('\n'.join(current))
+    return blocks
+
+def load_blocks(guide_dir=GUIDE_DIR):
+    """(prose blocks, code blocks) from every chapter of the real guide"""
+
+    prose = []
+    code = []
+    for md_file in sorted(guide_dir.glob("*.md")):
+        for block in split_blocks(md_file.read_text(encoding='utf-8')):
+            # Chapter headings are generated per file instead
+            if block.startswith('# '):
+                continue
+            (code if block.lstrip().startswith('```') else prose).append(block)
+    return prose, code
+
+def vary_code(block, n):
+    """A code block made unique, so highlight caches cannot serve every copy"""
+    body, _, fence = block.rstrip().rpartition('\n')
+    return f"{body}\n# variant {n}\n{fence}"
+
+class CorpusWriter:
+    """Write numbered chapters into a corpus directory"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.count = 0
+        self.bytes = 0
+
+    def write(self, kind, blocks):
+        part, number = divmod(self.count, CHAPTERS_PER_PART)
+        title = f"{kind.title()} Chapter {self.count}"
+        name = f"{part + 1:02d}.{number:02d}-{kind}-{self.count}.md"
+        text = f"# Chapter {part + 1}.{number}: {title}\n\n" + "\n\n".join(blocks) + "\n"
+        (self.out_dir / name).write_text(text, encoding='utf-8')
+        self.count += 1
+        self.bytes += len(text.encode('utf-8'))
+
+def fill(rng, prose, code, target_bytes, code_share):
+    """Blocks adding up to about target_bytes, roughly code_share of them code"""
+
+    blocks = []
+    size = 0
+    while size < target_bytes:
+        if rng.random() < code_share:
+            block = vary_code(rng.choice(code), rng.randrange(1 << 30))
+        else:
+            block = rng.choice(prose)
+        blocks.append(block)
+        size += len(block) + 2
+    return blocks
+
+def generate_corpus(scale, out_dir, guide_dir=GUIDE_DIR):
+    """Write a corpus scale times the size of guide_dir into out_dir
+
+    Returns (files, bytes) written.
+    """
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(f"{SEED}-{scale}")
+    prose, code = load_blocks(guide_dir)
+    guide_bytes = sum(f.stat().st_size for f in guide_dir.glob("*.md"))
+    code_share = len(code) / (len(code) + len(prose))
+
+    total = guide_bytes * scale
+    writer = CorpusWriter(out_dir)
+
+    # Many small chapters
+    small_target = total * SMALL_SHARE
+    while writer.bytes < small_target:
+        count = rng.randint(*SMALL_BLOCKS)
+        writer.write("small", [vary_code(block, rng.randrange(1 << 30)) if block.lstrip().startswith('```')
+                               else block for block in rng.sample(prose + code, count)])
+
+    # A few huge chapters
+    for _ in range(HUGE_FILES):
+        writer.write("huge", fill(rng, prose, code, total * HUGE_SHARE / HUGE_FILES, code_share))
+
+    # Code-heavy chapters: nearly every block is a fence
+    remaining = max(total - writer.bytes, 0)
+    for _ in range(CODE_HEAVY_FILES):
+        writer.write("code", fill(rng, prose, code, remaining / CODE_HEAVY_FILES, 0.95))
+
+    return writer.count, writer.bytes
+
+def corpus_files(corpus_dir):
+    """Chapter files of a corpus directory, in name order"""
+    return sorted(corpus_dir.glob("*.md"))
+
+def main():
+    """Generate a corpus: corpus.py SCALE OUT_DIR"""
+
+    if len(sys.argv) != 3 or sys.argv[1] not in SCALES:
+        print(f"Usage: {sys.argv[0]} {{{','.join(SCALES)}}} OUT_DIR")
+        sys.exit(2)
+
+    files, size = generate_corpus(SCALES[sys.argv[1]], Path(sys.argv[2]))
+    print(f"✓ Wrote {files} chapters ({size / 1e6:.1f} MB) to {sys.argv[2]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-chapter Markdown conversion cost with a fresh
+markdown.Markdown instance per file versus one reused instance
+"""
+
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+import markdown
+
+EXTENSION_SETS = {
+    "convert_guide.py": ['fenced_code', 'tables', 'nl2br'],
+    "convert_to_html.py": ['fenced_code', 'tables', 'codehilite', 'nl2br'],
+}
+
+def load_sources(limit=None):
+    """Read the guide's markdown sources"""
+    files = sorted((BASE_DIR / "guide").glob("*.md"))[:limit]
+    return [f.read_text(encoding='utf-8') for f in files]
+
+def run_fresh(sources, extensions):
+    """Convert every source with a newly built Markdown instance"""
+    return [markdown.Markdown(extensions=extensions).convert(text) for text in sources]
+
+def run_reused(sources, extensions):
+    """Convert every source with one Markdown instance, reset between documents"""
+    md = markdown.Markdown(extensions=extensions)
+    results = []
+    for text in sources:
+        md.reset()
+        results.append(md.convert(text))
+    return results
+
+def best_of(func, sources, extensions, repeat):
+    """Best wall-clock time of repeat runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(sources, extensions)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    """Run the benchmark and print per-chapter cost"""
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    sources = load_sources()
+    # Short documents are where extension setup dominates
+    small = sorted(sources, key=len)[:len(sources) // 4]
+
+    print(f"{len(sources)} chapters, best of {repeat} runs\n")
+    for label, extensions in EXTENSION_SETS.items():
+        assert run_fresh(sources, extensions) == run_reused(sources, extensions), "output differs"
+        print(label)
+        for name, corpus in (("all chapters", sources), ("smallest quarter", small)):
+            fresh = best_of(run_fresh, corpus, extensions, repeat)
+            reused = best_of(run_reused, corpus, extensions, repeat)
+            print(f"  {name:16} fresh {fresh / len(corpus) * 1000:7.3f} ms/chapter"
+                  f"   reused {reused / len(corpus) * 1000:7.3f} ms/chapter"
+                  f"   ({fresh / reused:.2f}x)")
+        print()
+
+if __name__ == "__main__":
+    main()
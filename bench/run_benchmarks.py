@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the guide converters
+
+Measures each converter over the real guide/ and over synthetic corpora
+scaled to 10x and 100x its size (see corpus.py):
+
+  basic            convert_guide.basic_markdown_to_html
+  advanced         convert_guide.advanced_markdown_to_html
+  convert_to_html  convert_to_html.convert_markdown_to_html
+  render           convert_guide.render_chapter, a whole page from a string
+  main             convert_guide.main(), a full serial build of a copy of the repo
+
+Every run happens in a fresh child process with empty highlight caches,
+so peak RSS is per benchmark and no run is warmed by the one before it.
+Results are compared against bench/baseline.json; a regression beyond
+--tolerance is reported and makes the suite exit non-zero.
+
+  python3 bench/run_benchmarks.py                        # guide and 10x
+  python3 bench/run_benchmarks.py --corpus 100x --target main
+  python3 bench/run_benchmarks.py --update-baseline
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+
+from corpus import CORPUS_VERSION, GUIDE_DIR, SCALES, corpus_files, corpus_names, generate_corpus
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+BASELINE_VERSION = 1
+
+TARGETS = ["basic", "advanced", "convert_to_html", "render", "main"]
+DEFAULT_CORPORA = ["guide", "10x"]
+
+# Targets that need the markdown library
+MARKDOWN_TARGETS = {"advanced", "convert_to_html"}
+
+# Metrics compared against the baseline, and which direction is worse
+HIGHER_IS_BETTER = {"mb_per_s": True, "files_per_s": True, "p90_ms": False, "peak_rss_mb": False}
+
+# Files copied into the throwaway repo the main benchmark builds
+REPO_FILES = ["*.py", "html/index.html", "html/assets"]
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where unsupported"""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3
+
+def time_function(convert, files):
+    """Convert each file with convert, returning (bytes, per-file seconds)"""
+
+    total = 0
+    latencies = []
+    for md_file in files:
+        text = md_file.read_text(encoding='utf-8')
+        total += len(text.encode('utf-8'))
+        start = time.perf_counter()
+        convert(text)
+        latencies.append(time.perf_counter() - start)
+    return total, latencies
+
+def make_repo_copy(corpus_dir, repo_dir):
+    """A copy of the converter scripts whose guide/ is corpus_dir"""
+
+    for pattern in REPO_FILES:
+        for path in BASE_DIR.glob(pattern):
+            target = repo_dir / path.relative_to(BASE_DIR)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if path.is_dir():
+                shutil.copytree(path, target)
+            else:
+                shutil.copy2(path, target)
+    (repo_dir / "guide").symlink_to(corpus_dir, target_is_directory=True)
+
+def run_child(target, corpus_dir):
+    """Measure one target over one corpus in this process (the child side)"""
+
+    files = corpus_files(corpus_dir)
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        tmp = Path(tmp)
+
+        if target == "main":
+            repo_dir = tmp / "repo"
+            make_repo_copy(corpus_dir, repo_dir)
+            sys.path.insert(0, str(repo_dir))
+            import convert_guide
+
+            timings_file = tmp / "timings.json"
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                convert_guide.main(["--force", "--jobs", "1", "--timings-json", str(timings_file)])
+            elapsed = time.perf_counter() - start
+
+            # Per-chapter latency is the sum of that chapter's stage times
+            chapters = json.loads(timings_file.read_text(encoding='utf-8'))["chapters"]
+            latencies = [sum(stages.values()) for stages in chapters.values()]
+            total = sum(f.stat().st_size for f in files)
+        else:
+            sys.path.insert(0, str(BASE_DIR))
+            import convert_guide
+            if target == "basic":
+                convert = convert_guide.basic_markdown_to_html
+            elif target == "advanced":
+                convert = convert_guide.advanced_markdown_to_html
+            elif target == "render":
+                convert = convert_guide.render_chapter
+            else:
+                import convert_to_html
+                convert = convert_to_html.convert_markdown_to_html
+
+            start = time.perf_counter()
+            total, latencies = time_function(convert, files)
+            elapsed = time.perf_counter() - start
+
+    print(json.dumps({"files": len(files), "bytes": total, "seconds": elapsed,
+                      "latencies": latencies, "peak_rss_mb": peak_rss_mb()}))
+
+def measure(target, corpus_dir):
+    """Run one measurement in a fresh child process and return its raw result"""
+
+    process = subprocess.run([sys.executable, __file__, "--child", target, str(corpus_dir)],
+                             capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1] if process.stderr.strip()
+                           else f"exit status {process.returncode}")
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of values"""
+
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+def summarize(runs):
+    """Metrics for a benchmark from its repeated runs
+
+    Throughput and latencies come from the fastest run, peak RSS is the
+    highest seen in any run.
+    """
+
+    best = min(runs, key=lambda run: run["seconds"])
+    latencies = best["latencies"]
+    rss = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    return {
+        "files": best["files"],
+        "mb": best["bytes"] / 1e6,
+        "seconds": best["seconds"],
+        "mb_per_s": best["bytes"] / 1e6 / best["seconds"],
+        "files_per_s": best["files"] / best["seconds"],
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies, default=0.0) * 1000,
+        "peak_rss_mb": max(rss) if rss else None,
+    }
+
+def print_results(results):
+    """Table of every benchmark's metrics"""
+
+    print(f"{'Benchmark':<24} {'files':>6} {'MB':>7} {'MB/s':>7} {'files/s':>8} "
+          f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} {'RSS MB':>7}")
+    for name, m in results.items():
+        rss = f"{m['peak_rss_mb']:7.1f}" if m["peak_rss_mb"] is not None else f"{'-':>7}"
+        print(f"{name:<24} {m['files']:>6} {m['mb']:7.2f} {m['mb_per_s']:7.2f} {m['files_per_s']:8.1f} "
+              f"{m['p50_ms']:8.2f} {m['p90_ms']:8.2f} {m['p99_ms']:8.2f} {m['max_ms']:8.1f} {rss}")
+
+def environment():
+    """What the numbers were measured on, stored with the baseline"""
+
+    packages = {}
+    for name in ("markdown", "pygments"):
+        try:
+            packages[name] = __import__(name).__version__
+        except (ImportError, AttributeError):
+            packages[name] = None
+    return {"python": platform.python_version(), "machine": platform.machine(),
+            "system": platform.system(), "cpus": os.cpu_count(), "packages": packages,
+            "corpus_version": CORPUS_VERSION}
+
+def load_baseline():
+    """The stored baseline, or None if there isn't a usable one"""
+
+    try:
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return baseline if baseline.get("version") == BASELINE_VERSION else None
+
+def save_baseline(results):
+    """Merge results into the stored baseline"""
+
+    baseline = load_baseline() or {"version": BASELINE_VERSION, "results": {}}
+    baseline["environment"] = environment()
+    for name, metrics in results.items():
+        baseline["results"][name] = {key: round(metrics[key], 3) for key in HIGHER_IS_BETTER
+                                     if metrics[key] is not None}
+    with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def compare(results, baseline, tolerance):
+    """(name, metric, value, baseline value, change) for every regression beyond tolerance"""
+
+    regressions = []
+    for name, metrics in results.items():
+        expected = baseline["results"].get(name, {})
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            value = metrics.get(metric)
+            reference = expected.get(metric)
+            if value is None or not reference:
+                continue
+            change = (value - reference) / reference
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append((name, metric, value, reference, change))
+    return regressions
+
+def parse_args(argv=None):
+    """Parse command line options"""
+
+    parser = argparse.ArgumentParser(description="Benchmark the guide converters")
+    parser.add_argument("--corpus", nargs="+", choices=corpus_names(), default=DEFAULT_CORPORA,
+                        help=f"corpora to run (default: {' '.join(DEFAULT_CORPORA)})")
+    parser.add_argument("--target", nargs="+", choices=TARGETS, default=TARGETS,
+                        help="converters to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per benchmark; the fastest counts (default: 3)")
+    parser.add_argument("--tolerance", type=float, default=0.20,
+                        help="allowed change against the baseline before failing (default: 0.20)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline instead of comparing")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to PATH as JSON")
+    parser.add_argument("--child", nargs=2, metavar=("TARGET", "CORPUS_DIR"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the suite and compare against the baseline"""
+
+    args = parse_args(argv)
+    if args.child:
+        run_child(args.child[0], Path(args.child[1]))
+        return
+
+    targets = args.target
+    if importlib.util.find_spec("markdown") is None:
+        skipped = [target for target in targets if target in MARKDOWN_TARGETS]
+        if skipped:
+            print(f"Note: markdown library not installed, skipping {', '.join(skipped)}")
+        targets = [target for target in targets if target not in MARKDOWN_TARGETS]
+    if resource is None:
+        print("Note: peak RSS is not available on this platform")
+
+    results = {}
+    failed = False
+    with tempfile.TemporaryDirectory(prefix="bench-corpora-") as tmp:
+        for corpus in args.corpus:
+            if corpus == "guide":
+                corpus_dir = GUIDE_DIR
+            else:
+                corpus_dir = Path(tmp) / corpus
+                files, size = generate_corpus(SCALES[corpus], corpus_dir)
+                print(f"Generated {corpus} corpus: {files} chapters, {size / 1e6:.1f} MB")
+
+            for target in targets:
+                name = f"{corpus}/{target}"
+                print(f"Running {name} ...", flush=True)
+                try:
+                    runs = [measure(target, corpus_dir) for _ in range(args.repeat)]
+                except Exception as e:
+                    print(f"✗ {name} failed: {e}")
+                    failed = True
+                    continue
+                results[name] = summarize(runs)
+
+    print()
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.update_baseline:
+        save_baseline(results)
+        print(f"\n✓ Updated {BASELINE_FILE.relative_to(BASE_DIR)}")
+        sys.exit(1 if failed else 0)
+
+    baseline = load_baseline()
+    if baseline is None:
+        print("\nNote: no baseline to compare against; run with --update-baseline to record one")
+        sys.exit(1 if failed else 0)
+    if baseline.get("environment", {}).get("corpus_version") != CORPUS_VERSION:
+        print("\nNote: baseline was recorded with different synthetic corpora; re-record it")
+    elif {k: v for k, v in baseline.get("environment", {}).items() if k != "cpus"} != \
+            {k: v for k, v in environment().items() if k != "cpus"}:
+        print("\nNote: baseline was recorded on a different Python, platform or package versions")
+
+    missing = [name for name in results if name not in baseline["results"]]
+    if missing:
+        print(f"Note: no baseline yet for {', '.join(missing)}")
+
+    regressions = compare(results, baseline, args.tolerance)
+    print()
+    if regressions:
+        print("=" * 60)
+        print(f"✗ PERFORMANCE REGRESSION ({len(regressions)} beyond {args.tolerance:.0%})")
+        print("=" * 60)
+        for name, metric, value, reference, change in regressions:
+            print(f"✗ {name}: {metric} {value:.2f} vs baseline {reference:.2f} ({change:+.0%})")
+        sys.exit(1)
+
+    print(f"✓ No regressions beyond {args.tolerance:.0%} of the baseline")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
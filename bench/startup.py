@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the converter CLI
+
+Measures `import convert_guide` with python -X importtime and fails if it
+goes over IMPORT_BUDGET_MS, or if any module that should only load once a
+chapter is converted (markdown, pygments lexers, the process pool...) is
+imported up front. Also times `convert_guide.py --help` and converting one
+unchanged chapter, the path editor integrations take on every save.
+
+  python3 bench/startup.py [--repeat N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+
+from run_benchmarks import make_repo_copy
+
+# Cumulative import time allowed for convert_guide, in milliseconds
+IMPORT_BUDGET_MS = 50
+
+# Modules that must not be imported by `import convert_guide`
+DEFERRED_MODULES = [
+    "markdown",
+    "pygments.lexers",
+    "pygments.formatters",
+    "concurrent.futures.process",
+    "cProfile",
+    "argparse",
+]
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+# Any chapter works for the single-file timing; this one is short
+SINGLE_CHAPTER = "01.01-prerequisites"
+
+def python_env():
+    """Environment for child interpreters, with bytecode caching on"""
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+def import_profile(cwd):
+    """Import times of convert_guide, in microseconds
+
+    Returns (every module imported, convert_guide's own direct imports with
+    their cumulative time, convert_guide's cumulative time).
+    """
+
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import convert_guide"],
+                             cwd=cwd, env=python_env(), capture_output=True, text=True, check=True)
+    modules = set()
+    direct = {}
+    pending = {}
+    total = None
+    for line in process.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules.add(name)
+        # Children are listed before their parent, one level deeper
+        if len(indent) == 3:
+            pending[name] = int(cumulative)
+        elif len(indent) == 1:
+            if name == "convert_guide":
+                direct = pending
+                total = int(cumulative)
+            pending = {}
+    return modules, direct, total
+
+def wall_time(args, cwd, repeat):
+    """Best wall-clock seconds of running python with args"""
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=cwd, env=python_env(),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    """Run the startup benchmark and check it against the budget"""
+
+    parser = argparse.ArgumentParser(description="Benchmark converter startup")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the fastest counts")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-startup-") as tmp:
+        repo_dir = Path(tmp)
+        make_repo_copy(BASE_DIR / "guide", repo_dir)
+        # A full build first, so the single-chapter run finds everything up to date,
+        # and a run to write bytecode caches
+        subprocess.run([sys.executable, "convert_guide.py", "--jobs", "1"], cwd=repo_dir, env=python_env(),
+                       stdout=subprocess.DEVNULL, check=True)
+
+        runs = [import_profile(repo_dir) for _ in range(args.repeat)]
+        modules, direct, import_us = min(runs, key=lambda run: run[2])
+        bare = wall_time(["-c", "pass"], repo_dir, args.repeat)
+        imported = wall_time(["-c", "import convert_guide"], repo_dir, args.repeat)
+        help_time = wall_time(["convert_guide.py", "--help"], repo_dir, args.repeat)
+        single = wall_time(["convert_guide.py", f"guide/{SINGLE_CHAPTER}.md"], repo_dir, args.repeat)
+
+    timings = [
+        ("python -c pass", bare),
+        ('python -c "import convert_guide"', imported),
+        ("convert_guide.py --help", help_time),
+        (f"convert_guide.py guide/{SINGLE_CHAPTER}.md", single),
+    ]
+    for label, seconds in timings:
+        print(f"{label:<48} {seconds * 1000:8.1f} ms")
+    print()
+
+    slowest = sorted(((us, name) for name, us in direct.items()), reverse=True)
+    print("Slowest imports by convert_guide (cumulative):")
+    for us, name in slowest[:8]:
+        print(f"  {us / 1000:7.1f} ms  {name}")
+    print()
+
+    failed = False
+    loaded = [name for name in DEFERRED_MODULES if name in modules]
+    for name in loaded:
+        print(f"✗ {name} is imported by `import convert_guide`; import it where it is used")
+        failed = True
+    if import_us / 1000 > IMPORT_BUDGET_MS:
+        print(f"✗ import convert_guide took {import_us / 1000:.1f} ms, over the {IMPORT_BUDGET_MS} ms budget")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print(f"✓ import convert_guide: {import_us / 1000:.1f} ms (budget {IMPORT_BUDGET_MS} ms), "
+          f"no deferred modules loaded")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Writing the build's files without leaving half-written ones behind
+
+Everything the build writes outside of a streamed page (caches, the
+manifest, assets, the search index, the snippet tree) goes through
+write_atomic(): the data is written to a temp file next to its target,
+which is then renamed over it, so readers and later builds only ever see
+the old file or the new one. The temp name carries the process and thread,
+so parallel workers writing the same file do not trip over each other.
+"""
+
+import json
+import os
+import threading
+
+def write_atomic(path, data):
+    """Replace path with data (bytes) through a temp file in the same directory"""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, path)
+    except BaseException:
+        if tmp_file.exists():
+            os.unlink(tmp_file)
+        raise
+
+def write_if_changed(path, data):
+    """Atomically replace path with data (bytes or text) unless it holds exactly that; returns whether it did"""
+
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    write_atomic(path, data)
+    return True
+
+def load_json(path, default):
+    """Load a JSON file, returning default if it is missing or unreadable"""
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+def write_json_atomic(path, data, **kwargs):
+    """Atomically replace path with data as JSON; kwargs are passed to json.dumps()"""
+    # json.dumps() uses the C encoder; json.dump() to a file does not
+    write_atomic(path, json.dumps(data, **kwargs).encode('utf-8'))
+
+def load_versioned_json(path, version):
+    """The JSON object at path if its "version" is version, else None"""
+
+    data = load_json(path, None)
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+    return data
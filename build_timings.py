@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Stage timings for the conversion pipeline (convert_guide.py --timings)
+
+A StageTimer charges wall-clock time to one stage at a time: entering a
+nested stage pauses the enclosing one, so the stages of a chapter add up to
+its total without double counting. When timings are off, NULL_TIMER stands
+in and every call is a no-op.
+"""
+
+import json
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+# Pipeline stages in the order they are reported
+CHAPTER_STAGES = ("read", "convert", "highlight", "template", "index", "write")
+
+class StageTimer:
+    """Exclusive wall-clock seconds per stage"""
+
+    def __init__(self):
+        self.totals = {}
+        self.stack = []
+        self.mark = 0.0
+
+    def push(self, stage):
+        """Start charging time to stage, pausing the current one"""
+
+        now = perf_counter()
+        if self.stack:
+            current = self.stack[-1]
+            self.totals[current] = self.totals.get(current, 0.0) + now - self.mark
+        self.stack.append(stage)
+        self.mark = now
+
+    def pop(self):
+        """Stop charging the current stage and resume the one it interrupted"""
+
+        now = perf_counter()
+        stage = self.stack.pop()
+        self.totals[stage] = self.totals.get(stage, 0.0) + now - self.mark
+        self.mark = now
+
+    def switch(self, stage):
+        """End the current top-level stage, if any, and start the next"""
+        if self.stack:
+            self.pop()
+        self.push(stage)
+
+    def stop(self):
+        """End every open stage"""
+        while self.stack:
+            self.pop()
+
+    @contextmanager
+    def stage(self, stage):
+        self.push(stage)
+        try:
+            yield
+        finally:
+            self.pop()
+
+    def wrap(self, stage, iterable):
+        """Iterate iterable, charging the time spent producing each item to stage"""
+
+        iterator = iter(iterable)
+        while True:
+            self.push(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.pop()
+            yield item
+
+class NullTimer:
+    """Stand-in for StageTimer when timings are off"""
+
+    totals = None
+
+    def push(self, stage):
+        pass
+
+    def pop(self):
+        pass
+
+    def switch(self, stage):
+        pass
+
+    def stop(self):
+        pass
+
+    def stage(self, stage):
+        return nullcontext()
+
+    def wrap(self, stage, iterable):
+        return iterable
+
+NULL_TIMER = NullTimer()
+
+def new_report():
+    """Empty report for build() to fill in"""
+    return {"build": {}, "chapters": {}}
+
+def print_report(report, slowest=10):
+    """Print per-stage totals and the slowest chapters"""
+
+    chapters = report["chapters"]
+    totals = {}
+    for stages in chapters.values():
+        for stage, seconds in stages.items():
+            totals[stage] = totals.get(stage, 0.0) + seconds
+    chapter_total = sum(totals.values())
+
+    print()
+    print("Build phases:")
+    for phase, seconds in report["build"].items():
+        print(f"  {phase:<16} {seconds * 1000:9.1f} ms")
+
+    if not chapters:
+        print("No chapters converted.")
+        return
+
+    print()
+    print(f"Chapter stages ({len(chapters)} chapters converted):")
+    order = [stage for stage in CHAPTER_STAGES if stage in totals]
+    order += sorted(stage for stage in totals if stage not in CHAPTER_STAGES)
+    for stage in order:
+        share = totals[stage] / chapter_total * 100 if chapter_total else 0.0
+        print(f"  {stage:<16} {totals[stage] * 1000:9.1f} ms  {share:5.1f}%")
+
+    print()
+    print("Slowest chapters:")
+    ranked = sorted(chapters.items(), key=lambda item: sum(item[1].values()), reverse=True)
+    for slug, stages in ranked[:slowest]:
+        top_stage = max(stages, key=stages.get)
+        print(f"  {sum(stages.values()) * 1000:8.1f} ms  {slug}  (mostly {top_stage})")
+
+def write_report(report, path):
+    """Dump the report as JSON, e.g. for tracking build times in CI"""
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
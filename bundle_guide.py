@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Bundle the generated guide into one file for offline reading
+
+Both formats are assembled from the chapter pages already in html/, so only
+chapters the incremental build had to convert are ever converted. Chapters
+are read and written one at a time, straight into the output file. The
+contents list each chapter's sections from the outlines the build recorded
+in its manifest, so no page is parsed for its headings.
+"""
+
+import html
+import os
+import re
+import uuid
+import zipfile
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+
+import convert_guide
+from link_graph import HREF_RE, ID_ATTR_RE
+
+BUNDLE_DIR = "dist"
+BUNDLE_NAMES = {"single-html": "guide.html", "epub": "guide.epub"}
+BOOK_TITLE = "Let's Build with Elixir and Phoenix"
+BOOK_LANGUAGE = "en"
+
+# The chapter body sits between these in every generated page
+BODY_START = '<main class="wrapper text">'
+BODY_END = '</main>'
+
+CHAPTER_LINK_RE = re.compile(r'^([^/#:?]+)\.html(?:#(.*))?$')
+HTML_TAG_NAME_RE = re.compile(r'[a-z][a-z0-9-]*$')
+
+SINGLE_HTML_HEADER = """<!DOCTYPE html>
+<html lang="{language}">
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
+    <title>{title}</title>
+    <style>
+{css}
+    </style>
+</head>
+<body>
+    <main class="wrapper text">
+"""
+
+SINGLE_HTML_FOOTER = """
+    </main>
+</body>
+</html>
+"""
+
+EPUB_CONTAINER = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+EPUB_PAGE_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" lang="{language}" xml:lang="{language}">
+<head>
+  <meta charset="utf-8"/>
+  <title>{title}</title>
+  <link rel="stylesheet" type="text/css" href="css/main.css"/>
+  <link rel="stylesheet" type="text/css" href="css/highlight.css"/>
+</head>
+<body>
+<main class="wrapper text">
+"""
+
+EPUB_PAGE_FOOTER = """
+</main>
+</body>
+</html>
+"""
+
+EPUB_PACKAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="book-id" xml:lang="{language}">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:identifier id="book-id">{identifier}</dc:identifier>
+    <dc:title>{title}</dc:title>
+    <dc:language>{language}</dc:language>
+    <meta property="dcterms:modified">{modified}</meta>
+  </metadata>
+  <manifest>
+    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
+    <item id="css-main" href="css/main.css" media-type="text/css"/>
+    <item id="css-highlight" href="css/highlight.css" media-type="text/css"/>
+{items}
+  </manifest>
+  <spine>
+{itemrefs}
+  </spine>
+</package>
+"""
+
+# Elements that never have content, written as <br/> in XHTML
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                 'source', 'track', 'wbr'}
+
+def read_chapter_body(page_file):
+    """The chapter body of a generated page"""
+
+    text = page_file.read_text(encoding='utf-8')
+    start = text.find(BODY_START)
+    end = text.rfind(BODY_END)
+    if start < 0 or end < start:
+        raise ValueError(f"{page_file.name} does not look like a generated chapter page")
+    return text[start + len(BODY_START):end]
+
+def iter_chapter_bodies(output_dir, index):
+    """(slug, title, body) for each chapter in reading order, one page read at a time"""
+    for slug, title, _, _ in index.chapters:
+        yield slug, title, read_chapter_body(output_dir / f"{slug}.html")
+
+def read_stylesheets(output_dir):
+    """The guide's stylesheets as [(name, text)]"""
+
+    sheets = []
+    for path in (output_dir / "assets" / "css" / "main.css", output_dir / convert_guide.HIGHLIGHT_STYLESHEET):
+        if path.exists():
+            sheets.append((path.name, path.read_text(encoding='utf-8')))
+    return sheets
+
+def single_html_body(slug, body, slugs):
+    """A chapter body with its ids and chapter links made unique within one document"""
+
+    def rewrite_id(match):
+        # Keep whatever ID_ATTR_RE matched ahead of the value
+        prefix = match.group()[:match.start(1) - match.start()]
+        return f'{prefix}{slug}--{match.group(1)}"'
+
+    def rewrite_href(match):
+        href = match.group(2)
+        if href.startswith('#'):
+            href = f"#{slug}--{href[1:]}"
+        else:
+            link = CHAPTER_LINK_RE.match(href)
+            if link and link.group(1) in slugs:
+                target, fragment = link.groups()
+                href = f"#{target}--{fragment}" if fragment else f"#{target}"
+        return f"{match.group(1)}{href}{match.group(3)}"
+
+    return HREF_RE.sub(rewrite_href, ID_ATTR_RE.sub(rewrite_id, body))
+
+def load_outlines(base_dir):
+    """{slug: [[level, text, id], ...]} of every chapter, as recorded in the build manifest"""
+
+    manifest = convert_guide.load_manifest(base_dir / convert_guide.MANIFEST_NAME)
+    return {slug: entry.get("outline", []) for slug, entry in manifest.items()}
+
+def contents_items(index, outlines, href):
+    """(nested, link HTML) for every chapter and its top-level sections, for convert_guide.nested_list()
+
+    href(slug, anchor) is the link to a chapter, or with an anchor to one
+    of its sections.
+    """
+
+    items = []
+    for slug, title, _, _ in index.chapters:
+        items.append((False, f'<a href="{href(slug, None)}">{html.escape(title)}</a>'))
+        items += [(True, f'<a href="{href(slug, anchor)}">{html.escape(text)}</a>')
+                  for level, text, anchor in outlines.get(slug, []) if level == convert_guide.TOC_LEVELS[0]]
+    return items
+
+def single_html_href(slug, anchor):
+    """Link to a chapter or one of its sections within the single HTML file"""
+    return f"#{slug}--{anchor}" if anchor else f"#{slug}"
+
+def write_single_html(output_dir, index, bundle_file, outlines=None):
+    """Stream every chapter into one self-contained HTML file, after the contents"""
+
+    slugs = set(index.by_slug)
+    css = "\n".join(text for _, text in read_stylesheets(output_dir))
+    contents = convert_guide.nested_list(contents_items(index, outlines or {}, single_html_href))
+    with open(bundle_file, 'w', encoding='utf-8') as f:
+        f.write(SINGLE_HTML_HEADER.format(language=BOOK_LANGUAGE, title=html.escape(BOOK_TITLE), css=css))
+        f.write('<nav class="contents">\n<h1>Contents</h1>\n' + "\n".join(contents) + '\n</nav>\n')
+        for slug, title, body in iter_chapter_bodies(output_dir, index):
+            f.write(f'<section class="chapter-page" id="{slug}">\n')
+            f.write(single_html_body(slug, body, slugs))
+            f.write('</section>\n')
+        f.write(SINGLE_HTML_FOOTER)
+
+class XhtmlWriter(HTMLParser):
+    """Re-serialize an HTML fragment as well-formed XHTML"""
+
+    def __init__(self, rewrite_href=None):
+        super().__init__(convert_charrefs=True)
+        self.rewrite_href = rewrite_href
+        self.parts = []
+
+    def start_tag(self, tag, attrs, closed):
+        # Stray markup such as <int:year> in unescaped code is kept as text
+        if not HTML_TAG_NAME_RE.match(tag):
+            self.handle_data(self.get_starttag_text())
+            return
+
+        rendered = []
+        for name, value in attrs:
+            if value is None:
+                value = name
+            if name == 'href' and self.rewrite_href:
+                value = self.rewrite_href(value)
+            rendered.append(f' {name}="{html.escape(value)}"')
+        self.parts.append(f"<{tag}{''.join(rendered)}{'/' if closed else ''}>")
+
+    def handle_starttag(self, tag, attrs):
+        self.start_tag(tag, attrs, tag in VOID_ELEMENTS)
+
+    def handle_startendtag(self, tag, attrs):
+        self.start_tag(tag, attrs, True)
+
+    def handle_endtag(self, tag):
+        if not HTML_TAG_NAME_RE.match(tag):
+            self.handle_data(f"</{tag}>")
+        elif tag not in VOID_ELEMENTS:
+            self.parts.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        self.parts.append(html.escape(data, quote=False))
+
+def to_xhtml(fragment, rewrite_href=None):
+    """fragment as XHTML, with hrefs passed through rewrite_href"""
+
+    writer = XhtmlWriter(rewrite_href)
+    writer.feed(fragment)
+    writer.close()
+    return "".join(writer.parts)
+
+def epub_href(href, slugs):
+    """Chapter links point at the chapter's XHTML document inside the EPUB"""
+
+    link = CHAPTER_LINK_RE.match(href)
+    if link and link.group(1) in slugs:
+        target, fragment = link.groups()
+        return f"{target}.xhtml" + (f"#{fragment}" if fragment else "")
+    return href
+
+def epub_nav_href(slug, anchor):
+    """Link to a chapter or one of its sections from the EPUB navigation document"""
+    return f"{slug}.xhtml#{anchor}" if anchor else f"{slug}.xhtml"
+
+def epub_nav(index, outlines=None):
+    """EPUB 3 navigation document listing every chapter and its sections"""
+
+    items = "\n".join(convert_guide.nested_list(contents_items(index, outlines or {}, epub_nav_href)))
+    return (EPUB_PAGE_HEADER.format(language=BOOK_LANGUAGE, title="Contents")
+            + f'<nav epub:type="toc" id="toc">\n<h1>Contents</h1>\n{items}\n</nav>'
+            + EPUB_PAGE_FOOTER)
+
+def write_epub(output_dir, index, bundle_file, base_url=None, outlines=None):
+    """Stream every chapter into an EPUB 3 container, one entry at a time"""
+
+    slugs = set(index.by_slug)
+    identifier = f"urn:uuid:{uuid.uuid5(uuid.NAMESPACE_URL, base_url or BOOK_TITLE)}"
+    modified = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    with zipfile.ZipFile(bundle_file, 'w', zipfile.ZIP_DEFLATED) as epub:
+        # The mimetype entry must come first and be stored uncompressed
+        epub.writestr(zipfile.ZipInfo("mimetype"), "application/epub+zip", zipfile.ZIP_STORED)
+        epub.writestr("META-INF/container.xml", EPUB_CONTAINER)
+
+        for name, text in read_stylesheets(output_dir):
+            epub.writestr(f"OEBPS/css/{name}", text)
+        epub.writestr("OEBPS/nav.xhtml", epub_nav(index, outlines))
+
+        for slug, title, body in iter_chapter_bodies(output_dir, index):
+            with epub.open(f"OEBPS/{slug}.xhtml", 'w') as entry:
+                entry.write(EPUB_PAGE_HEADER.format(language=BOOK_LANGUAGE, title=html.escape(title))
+                            .encode('utf-8'))
+                entry.write(to_xhtml(body, lambda href: epub_href(href, slugs)).encode('utf-8'))
+                entry.write(EPUB_PAGE_FOOTER.encode('utf-8'))
+
+        items = "\n".join(f'    <item id="c{i}" href="{slug}.xhtml" media-type="application/xhtml+xml"/>'
+                          for i, (slug, _, _, _) in enumerate(index.chapters))
+        itemrefs = "\n".join(f'    <itemref idref="c{i}"/>' for i in range(len(index.chapters)))
+        epub.writestr("OEBPS/content.opf", EPUB_PACKAGE.format(
+            language=BOOK_LANGUAGE, identifier=identifier, title=html.escape(BOOK_TITLE),
+            modified=modified, items=items, itemrefs=itemrefs))
+
+def write_bundle(base_dir, bundle_format, base_url=None):
+    """Write the guide as a single-html or epub bundle under dist/, returning its path"""
+
+    output_dir = base_dir / "html"
+    index = convert_guide.get_chapter_index()
+    outlines = load_outlines(base_dir)
+    bundle_dir = base_dir / BUNDLE_DIR
+    bundle_dir.mkdir(exist_ok=True)
+    bundle_file = bundle_dir / BUNDLE_NAMES[bundle_format]
+
+    # Build under a temporary name so a failed run never leaves half a bundle
+    tmp_file = bundle_file.with_name(f".{bundle_file.name}.{os.getpid()}.tmp")
+    try:
+        if bundle_format == "epub":
+            write_epub(output_dir, index, tmp_file, base_url, outlines)
+        else:
+            write_single_html(output_dir, index, tmp_file, outlines)
+        os.replace(tmp_file, bundle_file)
+    except BaseException:
+        if tmp_file.exists():
+            os.unlink(tmp_file)
+        raise
+    return bundle_file
@@ -3,308 +3,693 @@
 Convert markdown guide files to HTML with proper navigation and formatting
 """
 
+import hashlib
+import html
+import importlib.util
 import os
 import re
+import threading
+from itertools import chain
 from pathlib import Path
 
-# Try to import markdown, if not available use basic conversion
-try:
-    import markdown
-    from markdown.extensions import fenced_code, tables
-    USE_MARKDOWN = True
-except ImportError:
-    USE_MARKDOWN = False
+from asset_pipeline import PAGE_ASSETS, brotli, build_assets, minify_html, precompress, rewrite_asset_urls
+from build_files import load_json, load_versioned_json, write_atomic, write_if_changed, write_json_atomic
+from build_timings import NULL_TIMER, StageTimer, new_report, print_report, write_report
+from link_graph import LinkCollector, check_links, links_still_resolve, page_links
+from markdown_blocks import FENCED_BLOCK_RE, group_blocks, split_blocks
+from search_index import (SEARCH_DIR, SEARCH_DOCS_NAME, SEARCH_INDEX_VERSION, SearchIndexer,
+                          build_search_index)
+from snippet_tree import SNIPPET_DIR, SNIPPET_MANIFEST_NAME, write_snippet_tree
+
+# Use markdown if it is installed, else basic conversion. Importing it is
+# slow, so that waits until a chapter is converted (get_markdown_converter)
+USE_MARKDOWN = importlib.util.find_spec("markdown") is not None
+if not USE_MARKDOWN:
     print("Note: markdown library not found, using basic conversion")
     print("For better formatting: pip3 install markdown")
 
-# Chapter navigation mapping
-CHAPTERS = [
-    # Front matter
-    ("00.00-front-matter", "Front Matter", None, "00.01-contents"),
-    ("00.01-contents", "Contents", "00.00-front-matter", "01.00-introduction"),
-
-    # Chapter 1: Introduction
-    ("01.00-introduction", "Introduction", "00.01-contents", "01.01-prerequisites"),
-    ("01.01-prerequisites", "Prerequisites", "01.00-introduction", "02.00-foundations"),
-
-    # Chapter 2: Foundations
-    ("02.00-foundations", "Foundations", "01.01-prerequisites", "02.01-project-setup"),
-    ("02.01-project-setup", "Project Setup", "02.00-foundations", "02.02-web-application-basics"),
-    ("02.02-web-application-basics", "Web Application Basics", "02.01-project-setup", "02.03-routing-requests"),
-    ("02.03-routing-requests", "Routing Requests", "02.02-web-application-basics", "02.04-customizing-http-headers"),
-    ("02.04-customizing-http-headers", "Customizing HTTP Headers", "02.03-routing-requests", "02.05-url-query-strings"),
-    ("02.05-url-query-strings", "URL Query Strings", "02.04-customizing-http-headers", "02.06-project-structure"),
-    ("02.06-project-structure", "Project Structure", "02.05-url-query-strings", "02.07-html-templating"),
-    ("02.07-html-templating", "HTML Templating", "02.06-project-structure", "02.08-serving-static-files"),
-    ("02.08-serving-static-files", "Serving Static Files", "02.07-html-templating", "02.09-the-controller-pattern"),
-    ("02.09-the-controller-pattern", "The Controller Pattern", "02.08-serving-static-files", "03.00-configuration-and-error-handling"),
-
-    # Chapter 3: Configuration and Error Handling
-    ("03.00-configuration-and-error-handling", "Configuration and Error Handling", "02.09-the-controller-pattern", "03.01-managing-configuration"),
-    ("03.01-managing-configuration", "Managing Configuration", "03.00-configuration-and-error-handling", "03.02-environment-variables"),
-    ("03.02-environment-variables", "Environment Variables", "03.01-managing-configuration", "03.03-custom-error-responses"),
-    ("03.03-custom-error-responses", "Custom Error Responses", "03.02-environment-variables", "03.04-error-pages"),
-    ("03.04-error-pages", "Error Pages", "03.03-custom-error-responses", "03.05-logging"),
-    ("03.05-logging", "Logging", "03.04-error-pages", "04.00-database-driven-responses"),
-
-    # Chapter 4: Database with Ecto
-    ("04.00-database-driven-responses", "Database-Driven Responses", "03.05-logging", "04.01-setting-up-postgresql"),
-    ("04.01-setting-up-postgresql", "Setting Up PostgreSQL", "04.00-database-driven-responses", "04.02-creating-database-migrations"),
-    ("04.02-creating-database-migrations", "Database Migrations", "04.01-setting-up-postgresql", "04.03-ecto-schemas"),
-    ("04.03-ecto-schemas", "Ecto Schemas", "04.02-creating-database-migrations", "04.04-changesets-and-validations"),
-    ("04.04-changesets-and-validations", "Changesets and Validations", "04.03-ecto-schemas", "04.05-crud-operations"),
-    ("04.05-crud-operations", "CRUD Operations", "04.04-changesets-and-validations", "04.06-ecto-queries"),
-    ("04.06-ecto-queries", "Ecto Queries", "04.05-crud-operations", "04.07-associations"),
-    ("04.07-associations", "Associations", "04.06-ecto-queries", "04.08-transactions"),
-    ("04.08-transactions", "Transactions", "04.07-associations", "04.09-database-best-practices"),
-    ("04.09-database-best-practices", "Database Best Practices", "04.08-transactions", "05.00-dynamic-templates"),
-
-    # Chapter 5: Dynamic Templates
-    ("05.00-dynamic-templates", "Dynamic Templates", "04.09-database-best-practices", "05.01-displaying-data"),
-    ("05.01-displaying-data", "Displaying Data", "05.00-dynamic-templates", "05.02-template-actions"),
-    ("05.02-template-actions", "Template Actions", "05.01-displaying-data", "05.03-iterating-collections"),
-    ("05.03-iterating-collections", "Iterating Collections", "05.02-template-actions", "05.04-components"),
-    ("05.04-components", "Components", "05.03-iterating-collections", "05.05-layouts"),
-    ("05.05-layouts", "Layouts", "05.04-components", "05.06-helpers-and-formatting"),
-    ("05.06-helpers-and-formatting", "Helpers and Formatting", "05.05-layouts", "06.00-plugs-and-middleware"),
-
-    # Chapter 6: Plugs and Middleware
-    ("06.00-plugs-and-middleware", "Plugs and Middleware", "05.06-helpers-and-formatting", "06.01-understanding-plugs"),
-    ("06.01-understanding-plugs", "Understanding Plugs", "06.00-plugs-and-middleware", "06.02-phoenix-pipelines"),
-    ("06.02-phoenix-pipelines", "Phoenix Pipelines", "06.01-understanding-plugs", "06.03-creating-custom-plugs"),
-    ("06.03-creating-custom-plugs", "Creating Custom Plugs", "06.02-phoenix-pipelines", "06.04-common-plug-patterns"),
-    ("06.04-common-plug-patterns", "Common Plug Patterns", "06.03-creating-custom-plugs", "06.05-testing-plugs"),
-    ("06.05-testing-plugs", "Testing Plugs", "06.04-common-plug-patterns", "07.00-advanced-routing"),
-
-    # Chapter 7: Advanced Routing
-    ("07.00-advanced-routing", "Advanced Routing", "06.05-testing-plugs", "07.01-nested-resources"),
-    ("07.01-nested-resources", "Nested Resources", "07.00-advanced-routing", "07.02-scopes-and-namespaces"),
-    ("07.02-scopes-and-namespaces", "Scopes and Namespaces", "07.01-nested-resources", "07.03-custom-routes"),
-    ("07.03-custom-routes", "Custom Routes", "07.02-scopes-and-namespaces", "08.00-processing-forms"),
-
-    # Chapter 8: Processing Forms
-    ("08.00-processing-forms", "Processing Forms", "07.03-custom-routes", "08.01-form-basics"),
-    ("08.01-form-basics", "Form Basics", "08.00-processing-forms", "08.02-phoenix-forms"),
-    ("08.02-phoenix-forms", "Phoenix Forms", "08.01-form-basics", "08.03-changesets-in-forms"),
-    ("08.03-changesets-in-forms", "Changesets in Forms", "08.02-phoenix-forms", "08.04-file-uploads"),
-    ("08.04-file-uploads", "File Uploads", "08.03-changesets-in-forms", "08.05-form-validation"),
-    ("08.05-form-validation", "Form Validation", "08.04-file-uploads", "08.06-form-security"),
-    ("08.06-form-security", "Form Security", "08.05-form-validation", "09.00-sessions-and-state"),
-
-    # Chapter 9: Sessions and State
-    ("09.00-sessions-and-state", "Sessions and State", "08.06-form-security", "09.01-session-management"),
-    ("09.01-session-management", "Session Management", "09.00-sessions-and-state", "09.02-flash-messages"),
-    ("09.02-flash-messages", "Flash Messages", "09.01-session-management", "09.03-cookies"),
-    ("09.03-cookies", "Cookies", "09.02-flash-messages", "09.04-ets-and-caching"),
-    ("09.04-ets-and-caching", "ETS and Caching", "09.03-cookies", "10.00-security"),
-
-    # Chapter 10: Security
-    ("10.00-security", "Security", "09.04-ets-and-caching", "10.01-https-and-tls"),
-    ("10.01-https-and-tls", "HTTPS and TLS", "10.00-security", "10.02-csrf-protection"),
-    ("10.02-csrf-protection", "CSRF Protection", "10.01-https-and-tls", "10.03-sql-injection"),
-    ("10.03-sql-injection", "SQL Injection", "10.02-csrf-protection", "10.04-xss-prevention"),
-    ("10.04-xss-prevention", "XSS Prevention", "10.03-sql-injection", "10.05-security-headers"),
-    ("10.05-security-headers", "Security Headers", "10.04-xss-prevention", "10.06-common-vulnerabilities"),
-    ("10.06-common-vulnerabilities", "Common Vulnerabilities", "10.05-security-headers", "11.00-authentication"),
-
-    # Chapter 11: Authentication
-    ("11.00-authentication", "Authentication", "10.06-common-vulnerabilities", "11.01-password-hashing"),
-    ("11.01-password-hashing", "Password Hashing", "11.00-authentication", "11.02-user-registration"),
-    ("11.02-user-registration", "User Registration", "11.01-password-hashing", "11.03-login-logout"),
-    ("11.03-login-logout", "Login and Logout", "11.02-user-registration", "11.04-remember-me"),
-    ("11.04-remember-me", "Remember Me", "11.03-login-logout", "11.05-password-reset"),
-    ("11.05-password-reset", "Password Reset", "11.04-remember-me", "11.06-email-verification"),
-    ("11.06-email-verification", "Email Verification", "11.05-password-reset", "11.07-oauth"),
-    ("11.07-oauth", "OAuth Integration", "11.06-email-verification", "12.00-liveview"),
-
-    # Chapter 12: LiveView
-    ("12.00-liveview", "Phoenix LiveView", "11.07-oauth", "12.01-liveview-basics"),
-    ("12.01-liveview-basics", "LiveView Basics", "12.00-liveview", "12.02-liveview-forms"),
-    ("12.02-liveview-forms", "LiveView Forms", "12.01-liveview-basics", "12.03-live-components"),
-    ("12.03-live-components", "Live Components", "12.02-liveview-forms", "12.04-real-time-features"),
-    ("12.04-real-time-features", "Real-Time Features", "12.03-live-components", "13.00-testing"),
-
-    # Chapter 13: Testing
-    ("13.00-testing", "Testing", "12.04-real-time-features", "13.01-unit-testing"),
-    ("13.01-unit-testing", "Unit Testing", "13.00-testing", "13.02-controller-testing"),
-    ("13.02-controller-testing", "Controller Testing", "13.01-unit-testing", "13.03-integration-testing"),
-    ("13.03-integration-testing", "Integration Testing", "13.02-controller-testing", "13.04-liveview-testing"),
-    ("13.04-liveview-testing", "LiveView Testing", "13.03-integration-testing", "13.05-database-testing"),
-    ("13.05-database-testing", "Database Testing", "13.04-liveview-testing", "13.06-test-best-practices"),
-    ("13.06-test-best-practices", "Test Best Practices", "13.05-database-testing", "14.00-deployment"),
-
-    # Chapter 14: Deployment
-    ("14.00-deployment", "Deployment", "13.06-test-best-practices", "14.01-releases"),
-    ("14.01-releases", "Elixir Releases", "14.00-deployment", "14.02-docker"),
-    ("14.02-docker", "Docker Deployment", "14.01-releases", "14.03-fly-io"),
-    ("14.03-fly-io", "Fly.io Deployment", "14.02-docker", "14.04-production-config"),
-    ("14.04-production-config", "Production Config", "14.03-fly-io", "14.05-monitoring"),
-    ("14.05-monitoring", "Monitoring", "14.04-production-config", "15.00-conclusion"),
-
-    # Conclusion and Appendix
-    ("15.00-conclusion", "Conclusion", "14.05-monitoring", "16.00-further-reading"),
-    ("16.00-further-reading", "Further Reading", "15.00-conclusion", "17.00-guided-exercises"),
-
-    # Chapter 17: Exercises
-    ("17.00-guided-exercises", "Guided Exercises", "16.00-further-reading", "17.01-foundations-exercises"),
-    ("17.01-foundations-exercises", "Foundations Exercises", "17.00-guided-exercises", "17.02-database-exercises"),
-    ("17.02-database-exercises", "Database Exercises", "17.01-foundations-exercises", "17.03-web-exercises"),
-    ("17.03-web-exercises", "Web Layer Exercises", "17.02-database-exercises", "17.04-auth-exercises"),
-    ("17.04-auth-exercises", "Authentication Exercises", "17.03-web-exercises", "17.05-liveview-exercises"),
-    ("17.05-liveview-exercises", "LiveView Exercises", "17.04-auth-exercises", "17.06-deployment-exercises"),
-    ("17.06-deployment-exercises", "Deployment Exercises", "17.05-liveview-exercises", None),
-]
-
-def basic_markdown_to_html(text):
-    """Basic markdown to HTML conversion without external libraries"""
-
-    # Code blocks with file paths
-    text = re.sub(r'```(\w+)\s*\n#\s*File:\s*([^\n]+)\n(.*?)```',
-                  r'<figure class="code"><figcaption>File: \2</figcaption><pre><code class="language-\1">\3</code></pre></figure>',
-                  text, flags=re.DOTALL)
-
-    # Code blocks without file paths
-    text = re.sub(r'```(\w+)?\s*\n(.*?)```',
-                  r'<figure class="code"><pre><code>\2</code></pre></figure>',
-                  text, flags=re.DOTALL)
+# Syntax highlighting is optional too; the lexers and formatters are
+# imported when first needed
+try:
+    import pygments
+    USE_PYGMENTS = True
+except ImportError:
+    USE_PYGMENTS = False
+    print("Note: pygments not found, code blocks will not be highlighted")
+    print("For syntax highlighting: pip3 install pygments")
+
+# Build manifest recording what each generated page was built from
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 5
+
+# Per-chapter search index data, merged into html/search/ after each build
+SEARCH_CACHE_DIR = ".search-cache"
+
+# Per-chapter "# File:" code blocks, merged into source-code/snippetbox/ after each build
+SNIPPET_CACHE_DIR = ".snippet-cache"
+SNIPPET_CACHE_VERSION = 2
+
+# Source files are hashed in chunks of this size
+HASH_CHUNK_BYTES = 1 << 20
+
+# Bump whenever the page template changes its output so pages get rebuilt
+TEMPLATE_VERSION = 8
+
+# Bump whenever the markdown conversion changes its output
+CONVERTER_VERSION = 6
+
+# Highlighted code blocks are cached on disk by (language, code) and shared
+# across chapters and builds; bump the version to invalidate the cache
+HIGHLIGHT_CACHE_DIR = ".highlight-cache"
+HIGHLIGHT_CACHE_VERSION = 1
+HIGHLIGHT_STYLE = "default"
+HIGHLIGHT_STYLESHEET = Path("assets") / "css" / "highlight.css"
+
+# Converted runs of markdown blocks (see markdown_blocks.py) are cached by
+# content hash: in memory for the life of the process, up to
+# BLOCK_MEMO_ENTRIES, and per chapter on disk between builds. Bump the
+# version to invalidate the caches
+BLOCK_CACHE_DIR = ".block-cache"
+BLOCK_CACHE_VERSION = 4
+BLOCK_MEMO_ENTRIES = 20000
+
+# Fence languages Pygments has no lexer for, mapped to the closest one it has
+LEXER_ALIASES = {
+    "heex": "html",
+    "eex": "html",
+}
+
+# Chapter discovery: guide/NN.MM-slug.md files in prefix order, titled by
+# their first heading unless overridden in guide/titles.json
+TITLE_OVERRIDES_NAME = "titles.json"
+TITLE_CACHE_NAME = ".title-cache.json"
+TITLE_READ_BYTES = 4096
+CHAPTER_FILE_RE = re.compile(r'^(\d+)\.(\d+)-.+\.md$')
+SLUG_NUMBER_RE = re.compile(r'^(\d+)\.(\d+)-')
+HEADING_TITLE_RE = re.compile(r'^#+\s*(?:Chapter\s+\d+(?:\.\d+)*:?\s*)?(.+?)\s*$', re.MULTILINE)
+
+# Pages listing the chapters are generated from the chapter index: the
+# contents chapter's list, a marked region of html/index.html and sitemap.xml
+CONTENTS_SLUG = "00.01-contents"
+LANDING_PAGE_NAME = "index.html"
+LANDING_LIST_START = "<!-- chapter-list -->"
+LANDING_LIST_END = "<!-- /chapter-list -->"
+SITEMAP_NAME = "sitemap.xml"
+
+# Each page ends with an "On this page" list of its headings at these levels,
+# taken from the outline recorded while converting it, and a sidebar of the
+# guide's parts with the current part's chapters
+TOC_LEVELS = (2, 3)
+
+def title_from_slug(slug):
+    """Fallback title built from the slug, e.g. 02.01-project-setup -> Project Setup"""
+    return slug.split('-', 1)[-1].replace('-', ' ').title()
+
+def read_heading_title(md_file):
+    """Title from the first heading, reading only the start of the file"""
+
+    with open(md_file, 'rb') as f:
+        head = f.read(TITLE_READ_BYTES).decode('utf-8', errors='ignore')
+
+    match = HEADING_TITLE_RE.search(head)
+    return match.group(1) if match else None
+
+def discover_chapters(guide_dir, title_cache=None, overrides=None):
+    """Build the (slug, title, prev, next) navigation list from guide_dir
+
+    title_cache maps slug -> [mtime_ns, size, heading title] and is updated
+    in place, so unchanged files are never opened.
+    """
+
+    if title_cache is None:
+        title_cache = {}
+    overrides = overrides or {}
+
+    found = []
+    with os.scandir(guide_dir) as entries:
+        for entry in entries:
+            match = CHAPTER_FILE_RE.match(entry.name)
+            if match and entry.is_file():
+                found.append((int(match.group(1)), int(match.group(2)), entry))
+    found.sort(key=lambda item: (item[0], item[1], item[2].name))
+
+    titles = []
+    seen = set()
+    for _, _, entry in found:
+        slug = entry.name[:-3]
+        seen.add(slug)
+        stat = entry.stat()
+        cached = title_cache.get(slug)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            heading = cached[2]
+        else:
+            heading = read_heading_title(entry.path)
+            title_cache[slug] = [stat.st_mtime_ns, stat.st_size, heading]
+        titles.append((slug, overrides.get(slug) or heading or title_from_slug(slug)))
+
+    for slug in set(title_cache) - seen:
+        del title_cache[slug]
+
+    chapters = []
+    for i, (slug, title) in enumerate(titles):
+        prev_link = titles[i - 1][0] if i > 0 else None
+        next_link = titles[i + 1][0] if i + 1 < len(titles) else None
+        chapters.append((slug, title, prev_link, next_link))
+    return chapters
+
+class ChapterIndex:
+    """Navigation lookups over a (slug, title, prev, next) list, built once"""
+
+    def __init__(self, chapters):
+        self.chapters = list(chapters)
+        self.by_slug = {chapter[0]: chapter for chapter in self.chapters}
+        self.position = {chapter[0]: i for i, chapter in enumerate(self.chapters)}
+        self.by_number = {}
+        # Numbered parts (NN.00) and the chapters of each part, for the sidebar
+        self.parts = []
+        self.sections = {}
+        for chapter in self.chapters:
+            match = SLUG_NUMBER_RE.match(chapter[0])
+            if match:
+                major, minor = int(match.group(1)), int(match.group(2))
+                self.by_number.setdefault((major, minor), chapter[0])
+                if major and minor:
+                    self.sections.setdefault(major, []).append((minor, chapter[0], chapter[1]))
+                elif major:
+                    self.parts.append((major, chapter[0], chapter[1]))
+
+    def __len__(self):
+        return len(self.chapters)
+
+    def __contains__(self, slug):
+        return slug in self.by_slug
+
+    def get(self, slug):
+        """Chapter tuple for slug, or None"""
+        return self.by_slug.get(slug)
+
+    def title(self, slug, default=None):
+        """Title of the chapter with this slug"""
+        chapter = self.by_slug.get(slug)
+        return chapter[1] if chapter else default
+
+    def resolve(self, name):
+        """Slug for a chapter file name without extension, matching by NN.MM number if renamed"""
+
+        if name in self.by_slug:
+            return name
+        match = SLUG_NUMBER_RE.match(name)
+        if match:
+            return self.by_number.get((int(match.group(1)), int(match.group(2))))
+        return None
+
+    def prev(self, slug):
+        """Slug of the chapter before this one in reading order"""
+        i = self.position.get(slug)
+        return self.chapters[i - 1][0] if i else None
+
+    def next(self, slug):
+        """Slug of the chapter after this one in reading order"""
+        i = self.position.get(slug)
+        if i is None or i + 1 >= len(self.chapters):
+            return None
+        return self.chapters[i + 1][0]
+
+# Chapter index for this process, discovered on first use
+_chapter_index = None
+_chapter_index_lock = threading.Lock()
+
+def load_chapter_index(base_dir):
+    """Discover the guide's chapters, using and refreshing the on-disk title cache"""
+    global _chapter_index
 
-    # Headers
-    text = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', text, flags=re.MULTILINE)
-    text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-    text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-    text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
+    guide_dir = base_dir / "guide"
+    cache_file = base_dir / TITLE_CACHE_NAME
+    title_cache = load_json(cache_file, {})
+    if not isinstance(title_cache, dict):
+        title_cache = {}
+    before = dict(title_cache)
+
+    overrides = load_json(guide_dir / TITLE_OVERRIDES_NAME, {})
+    _chapter_index = ChapterIndex(discover_chapters(guide_dir, title_cache, overrides))
+
+    if title_cache != before:
+        try:
+            write_json_atomic(cache_file, title_cache)
+        except OSError:
+            pass
+    return _chapter_index
+
+def get_chapter_index():
+    """Return this process's chapter index, discovering chapters on first use"""
+    if _chapter_index is None:
+        with _chapter_index_lock:
+            if _chapter_index is None:
+                return load_chapter_index(Path(__file__).parent)
+    return _chapter_index
+
+# Patterns used by process_chapter and advanced_markdown_to_html
+CHAPTER_NUM_RE = re.compile(r'^# Chapter (\d+(?:\.\d+)?):?\s*(.*)$', re.MULTILINE)
+
+# Patterns used by basic_markdown_to_html
+FENCE_RE = re.compile(r'\s*```(\w+)?')
+FILE_PATH_RE = re.compile(r'#\s*File:\s*(.+)')
+HEADER_RE = re.compile(r'(#{1,4}) (.+)$')
+UL_ITEM_RE = re.compile(r'[-*]\s+')
+OL_ITEM_RE = re.compile(r'\d+\.\s+')
+LIST_MARKERS = '-*0123456789'
+
+# Inline code, links, bold and italic; at each position the first alternative wins
+INLINE_RE = re.compile(r'`([^`]+)`|\[([^\]]+)\]\(([^\)]+)\)|\*\*(.+?)\*\*|\*(.+?)\*')
+
+# Heading anchors: lower-case words joined by hyphens
+TAG_RE = re.compile(r'<[^>]*>')
+ANCHOR_STRIP_RE = re.compile(r'[^\w\s-]')
+ANCHOR_JOIN_RE = re.compile(r'[\s_-]+')
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+HEADING_ID_RE = re.compile(r'<(h[1-6]) id="([^"]*)"')
+# A character escaped with a backslash, as the markdown library stores it until the end
+ESCAPED_CHAR_RE = re.compile('\x02(\\d+)\x03')
+
+def heading_anchor(text, used):
+    """Unique id for a heading with this visible text; records it in used"""
+
+    slug = ANCHOR_JOIN_RE.sub('-', ANCHOR_STRIP_RE.sub('', text.lower())).strip('-') or 'section'
+    anchor = slug
+    n = 2
+    while anchor in used:
+        anchor = f"{slug}-{n}"
+        n += 1
+    used.add(anchor)
+    return anchor
+
+def escape_code(text):
+    """Escape text for use inside a <code> element"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+# Per-thread conversion state: the stage timer of the chapter being
+# converted (see build_timings.py) and the thread's Markdown instance, so
+# chapters can be rendered from several threads at once
+_local = threading.local()
+
+def current_timer():
+    """Stage timer of the chapter this thread is converting"""
+    return getattr(_local, 'timer', NULL_TIMER)
+
+# Per-process lexer and highlight caches
+_lexers = {}
+_highlighted = {}
+
+def get_lexer(language):
+    """Pygments lexer for a fence language, or None if there isn't one"""
+
+    if language not in _lexers:
+        from pygments.lexers import get_lexer_by_name
+        from pygments.util import ClassNotFound
+        try:
+            _lexers[language] = get_lexer_by_name(LEXER_ALIASES.get(language, language),
+                                                  stripnl=False, ensurenl=False)
+        except ClassNotFound:
+            _lexers[language] = None
+    return _lexers[language]
+
+def highlight_code(language, code):
+    """Highlighted (or just escaped) HTML for a code block, via the shared cache"""
+
+    lexer = get_lexer(language) if USE_PYGMENTS and language else None
+    if lexer is None:
+        return escape_code(code)
+
+    key_source = f"{HIGHLIGHT_CACHE_VERSION}\0{pygments.__version__}\0{lexer.name}\0{code}"
+    key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    if key in _highlighted:
+        return _highlighted[key]
+
+    # The disk cache is that of the build process_chapter is converting for
+    cache_dir = getattr(_local, 'highlight_cache_dir', None)
+    cache_file = cache_dir / key[:2] / f"{key}.html" if cache_dir is not None else None
+    html = None
+    if cache_file is not None:
+        try:
+            html = cache_file.read_text(encoding='utf-8')
+        except OSError:
+            pass
+    if html is None:
+        from pygments.formatters import HtmlFormatter
+        html = pygments.highlight(code, lexer, HtmlFormatter(nowrap=True))
+        if cache_file is not None:
+            try:
+                write_atomic(cache_file, html.encode('utf-8'))
+            except OSError:
+                pass
 
-    # Blockquotes (FP Concept boxes)
-    lines = text.split('\n')
-    result = []
-    in_blockquote = False
-    blockquote_lines = []
+    _highlighted[key] = html
+    return html
 
-    for line in lines:
-        if line.startswith('> '):
-            if not in_blockquote:
-                in_blockquote = True
-                blockquote_lines = []
-            blockquote_lines.append(line[2:])
+def record_code_block(file_path, code):
+    """Note a code block of the chapter process_chapter is converting on this thread
+
+    The search index takes the block's words from code rather than its
+    highlighted HTML, and "# File:" blocks (file_path set) are extracted
+    into the example application's source tree.
+    """
+
+    blocks = getattr(_local, 'code_blocks', None)
+    if blocks is not None:
+        blocks.append([file_path, code])
+
+def render_code_block(language, code, file_path=None):
+    """HTML figure for a fenced code block"""
+
+    record_code_block(file_path, code)
+    caption = f'<figcaption>File: {html.escape(file_path)}</figcaption>' if file_path else ''
+    code_class = f' class="language-{language}"' if language else ''
+    with current_timer().stage("highlight"):
+        code_html = highlight_code(language, code)
+    return f'<figure class="code">{caption}<pre><code{code_class}>{code_html}</code></pre></figure>'
+
+def highlight_stylesheet():
+    """CSS for highlighted code blocks"""
+
+    if not USE_PYGMENTS:
+        return "/* Syntax highlighting is off: pygments is not installed */\n"
+    from pygments.formatters import HtmlFormatter
+    formatter = HtmlFormatter(style=HIGHLIGHT_STYLE)
+    if hasattr(formatter, 'get_token_style_defs'):
+        # Token colours only, so main.css keeps control of the block background
+        lines = formatter.get_token_style_defs('figure.code code')
+    else:
+        lines = formatter.get_style_defs('figure.code code').splitlines()
+    return "\n".join(lines) + "\n"
+
+def render_inline(text):
+    """Render inline markdown in a single left-to-right scan"""
+
+    if '`' not in text and '*' not in text and '[' not in text:
+        return text
+
+    out = []
+    pos = 0
+    for match in INLINE_RE.finditer(text):
+        out.append(text[pos:match.start()])
+        code, link_text, href, bold, italic = match.groups()
+        if code is not None:
+            out.append(f'<code>{escape_code(code)}</code>')
+        elif link_text is not None:
+            out.append(f'<a href="{href}">{render_inline(link_text)}</a>')
+        elif bold is not None:
+            out.append(f'<strong>{render_inline(bold)}</strong>')
         else:
-            if in_blockquote:
-                blockquote_content = '\n'.join(blockquote_lines)
-                # Check if it's an FP concept
-                if '**FP Concept:' in blockquote_content:
-                    result.append('<blockquote class="fp-concept">')
-                elif '**Note' in blockquote_content:
-                    result.append('<div class="note">')
-                elif '**Important' in blockquote_content:
-                    result.append('<div class="important">')
-                elif '**Hint' in blockquote_content:
-                    result.append('<div class="hint">')
-                else:
-                    result.append('<blockquote>')
+            out.append(f'<em>{render_inline(italic)}</em>')
+        pos = match.end()
+    out.append(text[pos:])
+    return ''.join(out)
+
+def blockquote_tags(lines):
+    """Opening and closing tags for a blockquote, styled by its callout type"""
+
+    content = '\n'.join(lines)
+    if '**FP Concept:' in content:
+        return '<blockquote class="fp-concept">', '</blockquote>'
+    if '**Note' in content:
+        return '<div class="note">', '</div>'
+    if '**Important' in content:
+        return '<div class="important">', '</div>'
+    if '**Hint' in content:
+        return '<div class="hint">', '</div>'
+    return '<blockquote>', '</blockquote>'
+
+def iter_block_html(lines, anchors=None, outline=None):
+    """Tokenize an iterator of markdown lines into blocks, yielding HTML lines
+
+    anchors collects the heading ids used so far in the document, and
+    outline, if given, a [level, text, id] entry for each heading.
+    """
+
+    if anchors is None:
+        anchors = set()
+    list_tag = None
+    line = next(lines, None)
+
+    while line is not None:
+        first = line[:1]
+
+        # Every block except a list item ends an open list
+        item = None
+        if first and first in LIST_MARKERS:
+            item = UL_ITEM_RE.match(line) or OL_ITEM_RE.match(line)
+        if list_tag and not item:
+            yield f'</{list_tag}>'
+            list_tag = None
+
+        # Fenced code: copied verbatim, no inline formatting
+        fence = FENCE_RE.match(line) if '```' in line else None
+        if fence:
+            language = fence.group(1)
+            code = []
+            for line in lines:
+                if '```' in line and FENCE_RE.match(line):
+                    break
+                code.append(line)
+
+            file_path = FILE_PATH_RE.match(code[0]) if language and code else None
+            if file_path:
+                code = code[1:]
+
+            body = '\n'.join(code) + '\n' if code else ''
+            yield render_code_block(language, body, file_path.group(1) if file_path else None)
+            line = next(lines, None)
+            continue
+
+        # Blockquotes (FP Concept boxes and callouts)
+        if first == '>':
+            quoted = []
+            while line is not None and line.startswith('>'):
+                quoted.append(line[2:] if line.startswith('> ') else line[1:])
+                line = next(lines, None)
+            opening, closing = blockquote_tags(quoted)
+            yield opening
+            yield from iter_block_html(iter(quoted), anchors, outline)
+            yield closing
+            continue
+
+        header = HEADER_RE.match(line) if first == '#' else None
+        if header:
+            level = len(header.group(1))
+            content = render_inline(header.group(2))
+            text = html.unescape(TAG_RE.sub('', content))
+            anchor = heading_anchor(text, anchors)
+            if outline is not None:
+                outline.append([level, text, anchor])
+            yield f'<h{level} id="{anchor}">{content}</h{level}>'
+        elif item:
+            tag = 'ul' if item.re is UL_ITEM_RE else 'ol'
+            if list_tag != tag:
+                if list_tag:
+                    yield f'</{list_tag}>'
+                yield f'<{tag}>'
+                list_tag = tag
+            yield f'<li>{render_inline(line[item.end():])}</li>'
+        elif first == '<' or not line.strip():
+            yield line
+        else:
+            yield f'<p>{render_inline(line)}</p>'
 
-                result.append(blockquote_content)
+        line = next(lines, None)
 
-                if '**Note' in blockquote_content or '**Important' in blockquote_content or '**Hint' in blockquote_content:
-                    result.append('</div>')
-                else:
-                    result.append('</blockquote>')
-                in_blockquote = False
-            result.append(line)
+    if list_tag:
+        yield f'</{list_tag}>'
 
-    text = '\n'.join(result)
+def iter_source_lines(f):
+    """Yield a text file's lines without newlines, exactly as read().split('\\n') would"""
 
-    # Bold and italic
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+    line = ''
+    for line in f:
+        yield line[:-1] if line.endswith('\n') else line
+    if not line or line.endswith('\n'):
+        yield ''
 
-    # Inline code
-    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+def basic_markdown_to_html(text):
+    """Basic markdown to HTML conversion without external libraries"""
+    return '\n'.join(iter_block_html(iter(text.split('\n'))))
 
-    # Links
-    text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', text)
+def build_markdown_converter():
+    """A Markdown instance with the guide's extensions, importing markdown now"""
 
-    # Lists
-    lines = text.split('\n')
-    result = []
-    in_ul = False
-    in_ol = False
+    import markdown
 
-    for line in lines:
-        if re.match(r'^[-*]\s+', line):
-            if not in_ul:
-                result.append('<ul>')
-                in_ul = True
-            line = re.sub(r'^[-*]\s+', '', line)
-            result.append(f'<li>{line}</li>')
-        elif re.match(r'^\d+\.\s+', line):
-            if not in_ol:
-                result.append('<ol>')
-                in_ol = True
-            line = re.sub(r'^\d+\.\s+', '', line)
-            result.append(f'<li>{line}</li>')
-        else:
-            if in_ul:
-                result.append('</ul>')
-                in_ul = False
-            if in_ol:
-                result.append('</ol>')
-                in_ol = False
-
-            # Paragraphs
-            if line.strip() and not line.startswith('<'):
-                result.append(f'<p>{line}</p>')
-            else:
-                result.append(line)
+    class CodeBlockPreprocessor(markdown.preprocessors.Preprocessor):
+        """Render fenced code blocks (file captions, highlighting) and stash the HTML
+
+        Runs just before fenced_code, so the markdown library passes our
+        blocks through untouched.
+        """
+
+        def run(self, lines):
+            text = FENCED_BLOCK_RE.sub(self.stash_block, '\n'.join(lines))
+            return text.split('\n')
+
+        def stash_block(self, match):
+            language, code = match.group(1), match.group(2)
+            file_path = FILE_PATH_RE.match(code) if language else None
+            if file_path:
+                code = code[file_path.end() + 1:]
+            html = render_code_block(language, code, file_path.group(1) if file_path else None)
+            return f"\n{self.md.htmlStash.store(html)}\n"
+
+    class HeadingAnchorTreeprocessor(markdown.treeprocessors.Treeprocessor):
+        """Give every heading an id, the same way basic_markdown_to_html does"""
+
+        def run(self, root):
+            anchors = set()
+            # [id, text, level] of each heading, for renumber_headings() and the outline
+            self.md.guide_headings = []
+            for element in root.iter():
+                if element.tag in HEADING_TAGS and 'id' not in element.attrib:
+                    text = self.visible_text(element)
+                    element.set('id', heading_anchor(text, anchors))
+                    self.md.guide_headings.append([element.get('id'), text, int(element.tag[1])])
+
+        def visible_text(self, element):
+            """Text of an element, with the library's placeholders for raw HTML,
+            entities and backslash escapes replaced by what they stand for"""
+
+            text = ''.join(element.itertext())
+            if markdown.util.STX not in text:
+                return text
+            text = markdown.util.HTML_PLACEHOLDER_RE.sub(self.stashed_text, text)
+            return ESCAPED_CHAR_RE.sub(lambda match: chr(int(match.group(1))), text)
+
+        def stashed_text(self, match):
+            stashed = self.md.htmlStash.rawHtmlBlocks[int(match.group(1))]
+            return html.unescape(TAG_RE.sub('', stashed)) if isinstance(stashed, str) else ''
 
-    if in_ul:
-        result.append('</ul>')
-    if in_ol:
-        result.append('</ol>')
+    md = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
+    md.preprocessors.register(CodeBlockPreprocessor(md), 'guide_code_blocks', 26)
+    # After inline markup has been processed
+    md.treeprocessors.register(HeadingAnchorTreeprocessor(md), 'guide_heading_anchors', 5)
+    return md
 
-    text = '\n'.join(result)
+def get_markdown_converter():
+    """Return this thread's Markdown instance, building it on first use
 
-    # Clean up empty paragraphs
-    text = re.sub(r'<p>\s*</p>', '', text)
+    A Markdown instance holds the state of the document it is converting,
+    so threads cannot share one; each keeps its own between chapters.
+    """
 
-    return text
+    md = getattr(_local, 'markdown', None)
+    if md is None:
+        md = _local.markdown = build_markdown_converter()
+    return md
 
 def advanced_markdown_to_html(text):
     """Convert markdown to HTML using the markdown library"""
-    md = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
-
-    # Pre-process code blocks with file paths
-    text = re.sub(r'```(\w+)\s*\n#\s*File:\s*([^\n]+)\n(.*?)```',
-                  r'<figure class="code"><figcaption>File: \2</figcaption><pre><code class="language-\1">\3</code></pre></figure>',
-                  text, flags=re.DOTALL)
+    md = get_markdown_converter()
+    md.reset()
 
     html = md.convert(text)
     return html
 
-def create_html_template(title, content, prev_link=None, next_link=None, chapter_num=None):
-    """Create complete HTML page with navigation"""
-
-    prev_html = ""
-    if prev_link:
-        prev_html = f'&lsaquo; <a href="{prev_link}.html">Previous</a>'
-
-    next_html = ""
-    if next_link:
-        next_html = f'<a href="{next_link}.html">Next</a> &rsaquo;'
-
-    chapter_html = ""
-    if chapter_num:
-        chapter_html = f'<div class="chapter">{chapter_num}</div>'
-
-    nav_prev = f"{prev_html} &middot;" if prev_html else ""
-    nav_next = f"&middot; {next_html}" if next_html else ""
-
-    return f"""<!DOCTYPE html>
+# Block run HTML converted in this process, by key, shared by every thread
+_blocks = {}
+
+def block_key(run):
+    """Cache key of a run of markdown blocks, covering everything its HTML depends on"""
+
+    source = f"{BLOCK_CACHE_VERSION}\0{CONVERTER_VERSION}\0{highlighter_version()}\0{run}"
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def load_block_cache(cache_file):
+    """A chapter's {key: [html, headings, code blocks]} block cache, or {} if missing or stale"""
+
+    cached = load_versioned_json(cache_file, BLOCK_CACHE_VERSION)
+    return cached.get("blocks", {}) if cached else {}
+
+def save_block_cache(cache_file, blocks):
+    """Replace a chapter's block cache"""
+    write_json_atomic(cache_file, {"version": BLOCK_CACHE_VERSION, "blocks": blocks},
+                      separators=(',', ':'))
+
+def renumber_headings(html, headings, anchors):
+    """(html, ids) of a block run with its heading ids made unique across the page
+
+    headings are the run's [id, text, level] entries as converted on its
+    own, and anchors the ids used by the page's earlier runs; it is updated.
+    """
+
+    ids = [heading_anchor(heading[1], anchors) for heading in headings]
+    if ids == [heading[0] for heading in headings]:
+        return html, ids
+
+    pending = iter(zip(headings, ids))
+    current = next(pending, None)
+
+    def rename(match):
+        nonlocal current
+        if current is None or match.group(2) != current[0][0]:
+            return match.group(0)
+        new = current[1]
+        current = next(pending, None)
+        return f'<{match.group(1)} id="{new}"'
+
+    return HEADING_ID_RE.sub(rename, html), ids
+
+def memoized_markdown_to_html(text, cache_file=None, outline=None):
+    """advanced_markdown_to_html(), converting only the block runs not seen before
+
+    Runs are looked up in this process's memo and, given a cache_file, in
+    the chapter's block cache from its last conversion. The cache file is
+    then rewritten to hold just this text's runs. Each run keeps the
+    code blocks it showed and its headings, so they are recorded
+    whether or not it was converted again: outline, if given, gets a
+    [level, text, id] entry for each heading, as from iter_block_html().
+    """
+
+    code_blocks = getattr(_local, 'code_blocks', None)
+    cached = load_block_cache(cache_file) if cache_file else {}
+    used = {}
+    anchors = set()
+    parts = []
+    for run in group_blocks(split_blocks(text)):
+        key = block_key(run)
+        entry = _blocks.get(key) or cached.get(key)
+        if entry is None:
+            _local.code_blocks = run_blocks = []
+            try:
+                html = advanced_markdown_to_html(run)
+            finally:
+                _local.code_blocks = code_blocks
+            entry = [html, get_markdown_converter().guide_headings, run_blocks]
+        if code_blocks is not None:
+            code_blocks.extend(entry[2])
+        if len(_blocks) >= BLOCK_MEMO_ENTRIES:
+            _blocks.clear()
+        _blocks[key] = used[key] = entry
+        if entry[0]:
+            html, ids = renumber_headings(entry[0], entry[1], anchors)
+            parts.append(html)
+            if outline is not None:
+                outline.extend([level, text, anchor] for (_, text, level), anchor in zip(entry[1], ids))
+
+    if cache_file and used.keys() != cached.keys():
+        try:
+            save_block_cache(cache_file, used)
+        except OSError:
+            pass
+    return '\n'.join(parts)
+
+# Page template, split around the chapter body so pages can be streamed
+PAGE_HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="utf-8">
     <meta http-equiv="x-ua-compatible" content="ie=edge">
     <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
-    <title>{title} &mdash; Let's Build with Elixir and Phoenix</title>
-    <link rel="stylesheet" type="text/css" href="assets/css/main.css">
+    <link rel="preload" href="{main_css}" as="style">
+    <title>{title} &mdash; Let's Build with Elixir and Phoenix</title>{prefetch}
+    <link rel="stylesheet" type="text/css" href="{main_css}">
+    <link rel="stylesheet" type="text/css" href="{highlight_css}">
+    <script src="{search_js}" defer></script>
 </head>
 <body>
     <header>
@@ -319,11 +704,18 @@ def create_html_template(title, content, prev_link=None, next_link=None, chapter
                 {nav_next}
             </div>
         </div>
+        <form class="wrapper search" role="search" action="#" hidden>
+            <input type="search" name="q" placeholder="Search the guide" aria-label="Search the guide" autocomplete="off">
+            <ol class="search-results"></ol>
+        </form>
     </header>
     <main class="wrapper text">
         {chapter_html}
-        {content}
+        """
+
+PAGE_FOOTER = """
     </main>
+    {navigation}
     <footer>
         <div class="wrapper">
             <div>
@@ -341,80 +733,903 @@ def create_html_template(title, content, prev_link=None, next_link=None, chapter
 </html>
 """
 
-def process_chapter(md_file, output_dir):
-    """Process a single markdown chapter"""
+def nav_links(prev_link, next_link):
+    """Previous and next link HTML for a page"""
+
+    prev_html = ""
+    if prev_link:
+        prev_html = f'&lsaquo; <a href="{prev_link}.html">Previous</a>'
+
+    next_html = ""
+    if next_link:
+        next_html = f'<a href="{next_link}.html">Next</a> &rsaquo;'
+
+    return prev_html, next_html
+
+def render_page_header(title, prev_link=None, next_link=None, chapter_num=None, assets=None):
+    """Everything in a page before the chapter body
+
+    assets maps asset paths to the fingerprinted names pages should link
+    (see asset_pipeline.py); without it the unversioned files are linked.
+    The next chapter is prefetched, so following "Next" does not wait on
+    the network.
+    """
+
+    prev_html, next_html = nav_links(prev_link, next_link)
+
+    chapter_html = ""
+    if chapter_num:
+        chapter_html = f'<div class="chapter">{chapter_num}</div>'
+
+    assets = assets or {}
+    return PAGE_HEADER.format(
+        title=title,
+        main_css=assets.get("assets/css/main.css", "assets/css/main.css"),
+        highlight_css=assets.get(HIGHLIGHT_STYLESHEET.as_posix(), HIGHLIGHT_STYLESHEET.as_posix()),
+        search_js=assets.get("assets/js/search.js", "assets/js/search.js"),
+        prefetch=f'\n    <link rel="prefetch" href="{next_link}.html">' if next_link else "",
+        nav_prev=f"{prev_html} &middot;" if prev_html else "",
+        nav_next=f"&middot; {next_html}" if next_html else "",
+        chapter_html=chapter_html,
+    )
+
+def render_page_footer(prev_link=None, next_link=None, navigation=""):
+    """Everything in a page after the chapter body, starting with the navigation HTML"""
+
+    prev_html, next_html = nav_links(prev_link, next_link)
+    return PAGE_FOOTER.format(navigation=navigation, prev_html=prev_html, next_html=next_html)
+
+def nested_list(items):
+    """<ol> lines for (nested, item HTML) pairs, nested items in a list inside the item before them
+
+    Nested items before the first top-level item have nothing to go inside,
+    so they are listed at the top level.
+    """
+
+    lines = ['<ol>']
+    in_sublist = False
+    has_parent = False
+    for nested, item in items:
+        if not nested:
+            has_parent = True
+        if nested and not in_sublist and has_parent:
+            lines[-1] = lines[-1][:-len('</li>')]
+            lines.append('<ol>')
+            in_sublist = True
+        elif not nested and in_sublist:
+            lines += ['</ol>', '</li>']
+            in_sublist = False
+        lines.append(f'<li>{item}</li>')
+    if in_sublist:
+        lines += ['</ol>', '</li>']
+    lines.append('</ol>')
+    return lines
+
+def render_page_toc(outline):
+    """"On this page" list of the TOC_LEVELS headings in a page's outline, or "" for fewer than two
+
+    outline holds [level, text, id] entries in page order, as recorded
+    while converting the page.
+    """
+
+    entries = [entry for entry in outline if entry[0] in TOC_LEVELS]
+    if len(entries) < 2:
+        return ""
+
+    items = [(level != TOC_LEVELS[0], f'<a href="#{anchor}">{html.escape(text)}</a>')
+             for level, text, anchor in entries]
+    lines = ['<nav class="toc" aria-label="On this page">', '<p class="toc-title">On this page</p>']
+    return "\n".join(lines + nested_list(items) + ['</nav>'])
+
+def sidebar_entries(index, slug):
+    """[slug, label, depth] of page slug's sidebar: every part, and the chapters of its own part"""
+
+    number = chapter_number(slug or "")
+    entries = []
+    for major, part_slug, title in index.parts:
+        entries.append([part_slug, f"{major}. {title}", 0])
+        if number and number[0] == major:
+            entries += [[section_slug, f"{major}.{minor} {section_title}", 1]
+                        for minor, section_slug, section_title in index.sections.get(major, [])]
+    return entries
+
+def render_sidebar(entries, slug):
+    """Sidebar list of sidebar_entries(), marking the page slug as current"""
+
+    if not entries:
+        return ""
+
+    items = []
+    for entry_slug, label, depth in entries:
+        current = ' aria-current="page"' if entry_slug == slug else ''
+        items.append((bool(depth), f'<a href="{entry_slug}.html"{current}>{html.escape(label)}</a>'))
+    return "\n".join(['<nav class="sidebar" aria-label="Chapters">'] + nested_list(items) + ['</nav>'])
+
+def create_html_template(title, content, prev_link=None, next_link=None, chapter_num=None, assets=None):
+    """Create complete HTML page with navigation"""
+    return (render_page_header(title, prev_link, next_link, chapter_num, assets)
+            + content
+            + render_page_footer(prev_link, next_link))
+
+def hash_file(path):
+    """SHA-256 hex digest of a file's contents, read in chunks"""
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def iter_page(header, body_chunks, footer):
+    """Yield the text of a page: header, newline-joined body chunks, footer
+
+    footer may be a function returning it, called once the body has been
+    consumed, for a footer built from what converting the body found.
+    """
+
+    yield header
+    separator = ''
+    for chunk in body_chunks:
+        yield separator + chunk
+        separator = '\n'
+    yield footer() if callable(footer) else footer
+
+def write_page(output_file, header, body_chunks, footer, previous_hash=None, minify=False):
+    """Stream a page to a temp file and move it into place only if it changed
+
+    header, newline-joined body chunks and footer are written in order (see
+    iter_page()), through asset_pipeline.minify_html() if minify is set. previous_hash is
+    the digest recorded for the existing output_file; when it is unknown the
+    existing file is hashed instead. Returns (digest, written).
+    """
+
+    tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    digest = hashlib.sha256()
+    try:
+        with open(tmp_file, 'wb') as f:
+            def emit(text):
+                data = text.encode('utf-8')
+                digest.update(data)
+                f.write(data)
+
+            pieces = iter_page(header, body_chunks, footer)
+            for text in minify_html(pieces) if minify else pieces:
+                emit(text)
+
+        new_hash = digest.hexdigest()
+        if output_file.exists():
+            if previous_hash is None:
+                previous_hash = hash_file(output_file)
+            if previous_hash == new_hash:
+                os.unlink(tmp_file)
+                return new_hash, False
+
+        os.replace(tmp_file, output_file)
+        return new_hash, True
+    except BaseException:
+        if tmp_file.exists():
+            os.unlink(tmp_file)
+        raise
+
+def find_chapter_num(lines):
+    """Chapter number from the first "# Chapter N.N" line, reading only as far as needed"""
+
+    for line in lines:
+        if line.startswith('# Chapter'):
+            match = CHAPTER_NUM_RE.match(line)
+            if match:
+                return f"Chapter {match.group(1)}"
+    return None
+
+def chapter_number(slug):
+    """(major, minor) chapter number from a slug's NN.MM prefix, or None"""
+    match = SLUG_NUMBER_RE.match(slug)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+def contents_entries(index):
+    """[slug, title] for every chapter listed on the contents page, in reading order"""
+    return [[slug, title] for slug, title, _, _ in index.chapters if slug != CONTENTS_SLUG]
+
+def render_toc(entries):
+    """Table of contents list for (slug, title, indent) entries"""
+
+    lines = ['<nav class="contents">', '<ol>']
+    for slug, title, indent in entries:
+        css_class = ' class="indent"' if indent else ''
+        lines.append(f'<li{css_class}><a href="{slug}.html">{html.escape(title)}</a></li>')
+    lines += ['</ol>', '</nav>']
+    return lines
+
+def render_contents(index):
+    """Contents page list of every chapter, numbered, sections indented"""
+
+    entries = []
+    for slug, title in contents_entries(index):
+        number = chapter_number(slug)
+        if number and number[0]:
+            title = f"{number[0]}.{number[1]} {title}"
+        entries.append((slug, title, bool(number and number[1])))
+    return render_toc(entries)
+
+def render_chapter_list(index):
+    """Landing page list of the numbered chapters, without their sections"""
+
+    entries = []
+    for slug, title, _, _ in index.chapters:
+        number = chapter_number(slug)
+        if number and number[0] and not number[1]:
+            entries.append((slug, f"{number[0]}. {title}", False))
+    return "\n".join(render_toc(entries))
+
+def chapter_body(filename, chunks, index):
+    """Body chunks of a chapter page, with the chapter list appended to the contents page"""
+    return chain(chunks, render_contents(index)) if filename == CONTENTS_SLUG else chunks
+
+def update_landing_page(landing_page, index, assets=None):
+    """Replace the marked chapter list in the hand-written landing page
+
+    Links to the guide's assets are pointed at their fingerprinted names in
+    assets, if given. Returns whether the file changed; the chapter list of
+    a page without the markers is left alone.
+    """
+
+    try:
+        text = original = landing_page.read_text(encoding='utf-8')
+    except OSError:
+        return False
+    if assets:
+        text = rewrite_asset_urls(text, assets)
+
+    start = text.find(LANDING_LIST_START)
+    end = text.find(LANDING_LIST_END, start)
+    if start >= 0 and end >= 0:
+        # Indent the list like the start marker
+        line_start = text.rfind('\n', 0, start) + 1
+        indent = text[line_start:start] if not text[line_start:start].strip() else ''
+        chapter_list = "".join(f"{indent}{line}\n" for line in render_chapter_list(index).split("\n"))
+
+        start += len(LANDING_LIST_START)
+        text = f"{text[:start]}\n{chapter_list}{indent}{text[end:]}"
+    return text != original and write_if_changed(landing_page, text)
+
+def render_sitemap(index, base_url):
+    """sitemap.xml listing the landing page and every chapter under base_url"""
+
+    base_url = base_url.rstrip('/') + '/'
+    pages = [LANDING_PAGE_NAME] + [f"{slug}.html" for slug, _, _, _ in index.chapters]
+    urls = "".join(f"  <url><loc>{html.escape(base_url + page)}</loc></url>\n" for page in pages)
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f'{urls}</urlset>\n')
+
+def chapter_page_parts(source, title, prev_link=None, next_link=None, filename=None, index=None,
+                       assets=None, timer=NULL_TIMER, block_cache=None, outline=None):
+    """(header, body chunks, footer) of a chapter page converted from source
+
+    source is markdown text or a text stream. With the basic converter, a
+    seekable stream is converted line by line as the body chunks are
+    consumed; the markdown library needs the whole document, so it reads
+    the stream up front. The contents chapter's body ends with the chapter
+    list of index. Links are left as written in source. block_cache is
+    the chapter's block cache file (see memoized_markdown_to_html).
+
+    The page's headings are collected in outline as [level, text, id]
+    entries while it is converted. The footer holds the "On this page" list
+    built from them, so it is a function to call once the body has been
+    consumed (see iter_page()).
+    """
+
+    if outline is None:
+        outline = []
+
+    if isinstance(source, str) or USE_MARKDOWN or not source.seekable():
+        if isinstance(source, str):
+            text = source
+        else:
+            with timer.stage("read"):
+                text = source.read()
+        with timer.stage("convert"):
+            chapter_match = CHAPTER_NUM_RE.search(text)
+            chapter_num = f"Chapter {chapter_match.group(1)}" if chapter_match else None
+            if USE_MARKDOWN:
+                chunks = [memoized_markdown_to_html(text, block_cache, outline)]
+            else:
+                chunks = timer.wrap("convert", iter_block_html(iter(text.split('\n')), outline=outline))
+    else:
+        # Find the chapter number for the header, then stream source lines
+        # through the converter from where the stream started
+        with timer.stage("read"):
+            start = source.tell()
+            chapter_num = find_chapter_num(source)
+            source.seek(start)
+        lines = timer.wrap("read", iter_source_lines(source))
+        chunks = timer.wrap("convert", iter_block_html(lines, outline=outline))
+
+    with timer.stage("template"):
+        header = render_page_header(title, prev_link, next_link, chapter_num, assets)
+
+    def footer():
+        with timer.stage("template"):
+            sidebar = render_sidebar(sidebar_entries(index, filename), filename) if index is not None else ""
+            navigation = "\n".join(part for part in (render_page_toc(outline), sidebar) if part)
+            return render_page_footer(prev_link, next_link, navigation)
+
+    return header, chapter_body(filename, chunks, index), footer
+
+def process_chapter(md_file, output_dir, previous_hash=None, timings=False, assets=None, minify=False,
+                    search_cache_dir=None, highlight_cache_dir=None, block_cache_dir=None):
+    """Process a single markdown chapter
+
+    Returns (output_file, output_hash, written, search_data, link_data,
+    code_files, outline, stage_times), where written is False when the page
+    on disk already had exactly this content, search_data is the page's
+    SearchIndexer.result(), link_data its LinkCollector.result(),
+    code_files its [file path, code] "# File:" blocks in order, outline
+    its [level, text, id] headings in order and stage_times seconds per
+    pipeline stage, or None unless timings is set. assets is passed on to
+    render_page_header, and minify to write_page. The page is indexed as it
+    is written; with search_cache_dir, search_data is also cached there for
+    builds that leave the page alone.
+    Highlighted code blocks are cached in highlight_cache_dir and converted
+    markdown runs in block_cache_dir, if given.
+    """
 
     filename = md_file.stem
 
     # Find chapter info
-    chapter_info = next((c for c in CHAPTERS if c[0] == filename), None)
+    index = get_chapter_index()
+    chapter_info = index.get(filename)
     if not chapter_info:
         print(f"⊗ Skipping {filename} - not in navigation map")
         return
 
     filename_base, title, prev_link, next_link = chapter_info
+    output_file = output_dir / f"{filename}.html"
+    block_cache_file = block_cache_dir / f"{filename}.json" if block_cache_dir is not None else None
+    code_blocks = _local.code_blocks = []
+    _local.highlight_cache_dir = highlight_cache_dir
+    indexer = SearchIndexer(code_blocks)
+    links = LinkCollector(index)
+    timer = _local.timer = StageTimer() if timings else NULL_TIMER
+    outline = []
+
+    try:
+        with open(md_file, 'r', encoding='utf-8') as f:
+            header, body, footer = chapter_page_parts(f, title, prev_link, next_link, filename, index,
+                                                      assets, timer, block_cache_file, outline)
+            body = timer.wrap("index", indexer.observe(links.observe(body)))
+            with timer.stage("write"):
+                output_hash, written = write_page(output_file, header, body, footer, previous_hash, minify)
+
+        with timer.stage("index"):
+            link_data = links.result()
+            search_data = indexer.result()
+            if search_cache_dir is not None:
+                save_page_data(search_cache_dir / f"{filename}.json", SEARCH_INDEX_VERSION, output_hash,
+                               search_data)
+    finally:
+        timer.stop()
+        _local.timer = NULL_TIMER
+        _local.code_blocks = None
+        _local.highlight_cache_dir = None
+
+    code_files = [[file_path, code] for file_path, code in code_blocks if file_path]
+    return output_file, output_hash, written, search_data, link_data, code_files, outline, timer.totals
+
+# Library API: render a page from markdown held in memory, without reading
+# guide/ or writing html/. Safe to call from several threads at once; the
+# compiled patterns, highlight caches and each thread's Markdown instance
+# are reused from call to call
+
+def iter_render_chapter(source, meta=None, assets=None, index=None, minify=False):
+    """Yield the HTML of a chapter page in pieces, converting as it goes
+
+    source is markdown text or a text stream. meta may give the page's
+    "slug", "title", and "prev" and "next" slugs. Whatever it leaves out is
+    taken from the chapter with that slug in index (by default the guide's
+    own chapters), and failing that the title from source's first heading.
+    Chapter links are rewritten against index, as in the built pages, and
+    assets is passed on to render_page_header. With minify, the page is
+    minified as in a build with --minify.
+    """
+
+    meta = meta or {}
+    if index is None:
+        index = get_chapter_index()
+    slug = meta.get("slug")
+    _, title, prev_link, next_link = index.get(slug) or (slug, None, None, None)
+    title = meta.get("title", title)
+    if title is None:
+        # The header comes first, so a stream has to be read to find the heading
+        if not isinstance(source, str):
+            source = source.read()
+        match = HEADING_TITLE_RE.search(source[:TITLE_READ_BYTES])
+        title = match.group(1) if match else title_from_slug(slug or "")
+
+    header, body, footer = chapter_page_parts(source, title, meta.get("prev", prev_link),
+                                              meta.get("next", next_link), slug, index, assets)
+    pieces = iter_page(header, LinkCollector(index).observe(body), footer)
+    yield from minify_html(pieces) if minify else pieces
+
+def render_chapter(source, meta=None, assets=None, index=None, minify=False):
+    """Complete HTML page for a chapter; see iter_render_chapter()"""
+    return ''.join(iter_render_chapter(source, meta, assets, index, minify))
+
+def convert_chapters(tasks, output_dir, jobs=1, timings=False, assets=None, minify=False,
+                     search_cache_dir=None, highlight_cache_dir=None, block_cache_dir=None):
+    """Run process_chapter over (md_file, previous_hash) tasks
+
+    Returns (result, error) pairs in task order.
+    """
+
+    results = []
+    if jobs <= 1 or len(tasks) <= 1:
+        for md_file, previous_hash in tasks:
+            try:
+                results.append((process_chapter(md_file, output_dir, previous_hash, timings, assets, minify,
+                                                search_cache_dir, highlight_cache_dir, block_cache_dir), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=use_converter,
+                             initargs=(USE_MARKDOWN,)) as executor:
+        futures = [executor.submit(process_chapter, md_file, output_dir, previous_hash, timings, assets, minify,
+                                   search_cache_dir, highlight_cache_dir, block_cache_dir)
+                   for md_file, previous_hash in tasks]
+        for future in futures:
+            try:
+                results.append((future.result(), None))
+            except Exception as e:
+                results.append((None, e))
+    return results
+
+def converter_mode():
+    """Name of the markdown converter in use"""
+    return "markdown" if USE_MARKDOWN else "basic"
+
+def use_converter(use_markdown):
+    """Convert with the markdown library, or with the basic converter"""
+
+    global USE_MARKDOWN
+    USE_MARKDOWN = use_markdown
+
+def highlighter_version():
+    """Identify the syntax highlighter in use, or None"""
+    return f"pygments {pygments.__version__} {HIGHLIGHT_STYLE}" if USE_PYGMENTS else None
+
+def chapter_fingerprint(md_file, chapter_info, index, assets=None, minify=False):
+    """Describe everything a chapter's generated page depends on"""
+
+    filename, title, prev_link, next_link = chapter_info
+    fingerprint = {
+        "source": hash_file(md_file),
+        "converter": converter_mode(),
+        "converter_version": CONVERTER_VERSION,
+        "highlighter": highlighter_version(),
+        "template": TEMPLATE_VERSION,
+        "assets": assets or {},
+        "minify": minify,
+        "title": title,
+        "prev": prev_link,
+        "next": next_link,
+        "sidebar": sidebar_entries(index, filename),
+    }
+    if filename == CONTENTS_SLUG:
+        # The contents page lists every chapter's title
+        fingerprint["chapters"] = contents_entries(index)
+    return fingerprint
+
+def output_stat(output_file):
+    """[size, mtime in ns] of a generated page, or None if it is missing"""
+
+    try:
+        stat = output_file.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def manifest_entry_matches(entry, fingerprint):
+    """Whether a manifest entry was built from exactly this fingerprint"""
+    return entry is not None and all(entry.get(key) == value for key, value in fingerprint.items())
+
+def load_manifest(manifest_file):
+    """Load the build manifest, returning an empty one if missing or unreadable"""
+
+    manifest = load_versioned_json(manifest_file, MANIFEST_VERSION)
+    return manifest.get("chapters", {}) if manifest else {}
+
+def save_manifest(manifest_file, chapters):
+    """Write the build manifest atomically"""
+    write_json_atomic(manifest_file, {"version": MANIFEST_VERSION, "chapters": chapters},
+                      indent=2, sort_keys=True)
+
+def load_page_data(cache_file, version, output_hash):
+    """Data cached for a page by save_page_data(), or None if missing, stale or built from other output"""
+
+    cached = load_versioned_json(cache_file, version)
+    if cached is None or cached.get("output") != output_hash:
+        return None
+    return cached.get("data")
+
+def save_page_data(cache_file, version, output_hash, data):
+    """Cache data derived from a page (search data, "# File:" blocks) with the hash of the page"""
+    # Search postings are arrays, written out as JSON lists
+    write_json_atomic(cache_file, {"version": version, "output": output_hash, "data": data},
+                      separators=(',', ':'), default=list)
+
+def search_index_current(output_dir):
+    """Whether output_dir holds a search index in the current format"""
+    return load_versioned_json(output_dir / SEARCH_DIR / SEARCH_DOCS_NAME, SEARCH_INDEX_VERSION) is not None
+
+def write_search_index(output_dir, documents):
+    """Write the merged search index under output_dir, dropping stale shards"""
+
+    files = build_search_index(documents)
+    search_dir = output_dir / SEARCH_DIR
+    search_dir.mkdir(exist_ok=True)
+    for relative_path, text in files.items():
+        write_if_changed(output_dir / relative_path, text)
+
+    current = {output_dir / relative_path for relative_path in files}
+    for stale in search_dir.glob("*.json"):
+        if stale not in current:
+            stale.unlink()
+
+def parse_args(argv=None):
+    """Parse command line options"""
+
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert the markdown guide to HTML")
+    parser.add_argument("files", nargs="*", metavar="FILE",
+                        help="only convert these chapters (guide/*.md files or slugs), "
+                             "leaving the other pages as they are")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every chapter, ignoring the build manifest")
+    parser.add_argument("--basic", action="store_true",
+                        help="use the basic converter even if the markdown library is installed")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of chapters to convert in parallel (default: number of CPUs)")
+    parser.add_argument("--watch", action="store_true",
+                        help="after building, serve html/ with live reload and rebuild on changes")
+    parser.add_argument("--host", default="127.0.0.1", help="address for --watch to serve on")
+    parser.add_argument("--port", type=int, default=8000, help="port for --watch to serve on")
+    parser.add_argument("--base-url", help="URL the guide is published at; also writes html/sitemap.xml")
+    parser.add_argument("--format", choices=["html", "single-html", "epub"], default="html",
+                        help="also bundle the built pages into dist/guide.html or dist/guide.epub")
+    parser.add_argument("--minify", action="store_true",
+                        help="strip the whitespace and comments browsers ignore from chapter pages")
+    parser.add_argument("--precompress", action="store_true",
+                        help="also write .gz (and, with brotli installed, .br) copies of html/ text files")
+    parser.add_argument("--timings", action="store_true",
+                        help="print per-stage build timings and the slowest chapters")
+    parser.add_argument("--timings-json", metavar="PATH",
+                        help="also write the timings report to PATH as JSON")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="run the build under cProfile and write pstats data to PATH")
+    return parser.parse_args(argv)
+
+def build(base_dir, force=False, jobs=1, only=None, base_url=None, report=None, compress=False,
+          minify=False):
+    """Convert the guide's chapters to HTML, skipping ones whose inputs are unchanged
+
+    only, if given, restricts the build to those slugs; other chapters keep
+    their manifest entries as they are, and force only applies to the named
+    ones. When such a partial build leaves the chapter list alone, the
+    assets of the last build are reused, only the links of the pages it
+    wrote are checked, and merging those pages into the search index and
+    snippet tree is left to the next full build. A sitemap is written when
+    base_url is given, and .gz/.br copies of the output when compress is set.
+    Chapter pages are minified when minify is set. If
+    report is a build_timings.new_report(), phase and per-chapter stage
+    timings are recorded in it. Returns (converted, unchanged, written).
+    """
+
+    timer = StageTimer() if report is not None else NULL_TIMER
+    timer.switch("plan")
 
-    # Read markdown content
-    with open(md_file, 'r', encoding='utf-8') as f:
-        md_content = f.read()
-
-    # Extract chapter number if present
-    chapter_match = re.search(r'^# Chapter (\d+(?:\.\d+)?):?\s*(.*)$', md_content, re.MULTILINE)
-    chapter_num = None
-    if chapter_match:
-        chapter_num = f"Chapter {chapter_match.group(1)}"
+    guide_dir = base_dir / "guide"
+    output_dir = base_dir / "html"
+    manifest_file = base_dir / MANIFEST_NAME
+    search_cache_dir = base_dir / SEARCH_CACHE_DIR
+    snippet_cache_dir = base_dir / SNIPPET_CACHE_DIR
+    highlight_cache_dir = base_dir / HIGHLIGHT_CACHE_DIR
+    block_cache_dir = base_dir / BLOCK_CACHE_DIR
+
+    # Only chapters still present are carried over, so removed ones drop out
+    # of the manifest and their neighbours rebuild via changed prev/next links
+    old_manifest = load_manifest(manifest_file)
+    new_manifest = {}
+
+    # Create output directory and the shared code highlighting stylesheet
+    output_dir.mkdir(exist_ok=True)
+    highlight_css = output_dir / HIGHLIGHT_STYLESHEET
+    if only is None or not highlight_css.exists():
+        write_if_changed(highlight_css, highlight_stylesheet())
+
+    # Minified, fingerprinted copies of the stylesheets and scripts pages link
+    # to; a partial build keeps those of the last build while they are there
+    assets = (old_manifest.get(CONTENTS_SLUG) or {}).get("assets") if only is not None else None
+    if not assets or not all((output_dir / url).exists() for url in assets.values()):
+        assets = build_assets(output_dir, PAGE_ASSETS)
+
+    index = load_chapter_index(base_dir)
+    search_data = {}
+    snippet_data = {}
+
+    # Work out which chapters need converting
+    plan = []
+    previous_hashes = {}
+    for chapter_info in index.chapters:
+        filename = chapter_info[0]
+        md_file = guide_dir / f"{filename}.md"
 
-    # Convert markdown to HTML
-    if USE_MARKDOWN:
-        html_content = advanced_markdown_to_html(md_content)
-    else:
-        html_content = basic_markdown_to_html(md_content)
+        # The contents page is always checked, as any chapter's title may have changed
+        if only is not None and filename not in only and filename != CONTENTS_SLUG:
+            if filename in old_manifest:
+                new_manifest[filename] = old_manifest[filename]
+            continue
+
+        try:
+            fingerprint = chapter_fingerprint(md_file, chapter_info, index, assets, minify)
+        except Exception as e:
+            plan.append((filename, "error", e))
+            continue
+
+        # A page changed since it was built (by another tool, or a git checkout)
+        # is converted again, and compared with the file rather than the manifest
+        output_file = output_dir / f"{filename}.html"
+        entry = old_manifest.get(filename)
+        stat = output_stat(output_file)
+        on_disk = entry is not None and stat is not None and entry.get("output_stat") == stat
+        previous_hashes[filename] = entry.get("output") if on_disk and not force else None
+        cached = None
+        if (not force and on_disk and manifest_entry_matches(entry, fingerprint)
+                and links_still_resolve(entry.get("links", []), index)):
+            cached = load_page_data(search_cache_dir / f"{filename}.json", SEARCH_INDEX_VERSION,
+                                    entry.get("output"))
+            snippets = load_page_data(snippet_cache_dir / f"{filename}.json", SNIPPET_CACHE_VERSION,
+                                      entry.get("output"))
+            if snippets is None:
+                cached = None
+        if cached is not None:
+            new_manifest[filename] = entry
+            search_data[filename] = cached
+            snippet_data[filename] = snippets
+            plan.append((filename, "unchanged", None))
+        else:
+            plan.append((filename, "convert", fingerprint))
 
-    # Create full HTML page
-    html_page = create_html_template(title, html_content, prev_link, next_link, chapter_num)
+    # Convert, possibly in parallel; results come back in reading order
+    tasks = [(guide_dir / f"{filename}.md", previous_hashes[filename])
+             for filename, action, _ in plan if action == "convert"]
+    timer.switch("convert")
+    results = iter(convert_chapters(tasks, output_dir, jobs, report is not None, assets, minify,
+                                    search_cache_dir, highlight_cache_dir, block_cache_dir))
 
-    # Write HTML file
-    output_file = output_dir / f"{filename}.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_page)
+    # Report in reading order
+    converted_count = 0
+    unchanged_count = 0
+    written_pages = set()
+    for filename, action, detail in plan:
+        if action == "error":
+            print(f"✗ Error processing {filename}: {detail}")
+        elif action == "unchanged":
+            unchanged_count += 1
+        else:
+            result, error = next(results)
+            if error is not None:
+                print(f"✗ Error processing {filename}: {error}")
+            elif result is not None:
+                (output_file, output_hash, written, search_data[filename], link_data, snippet_data[filename],
+                 outline, stage_times) = result
+                if report is not None:
+                    report["chapters"][filename] = stage_times
+                if written:
+                    print(f"✓ Created {output_file.name}")
+                    written_pages.add(filename)
+                else:
+                    print(f"✓ Rebuilt {output_file.name} (no changes)")
+                new_manifest[filename] = dict(detail, output=output_hash, output_stat=output_stat(output_file),
+                                              outline=outline, **link_data)
+                save_page_data(snippet_cache_dir / f"{filename}.json", SNIPPET_CACHE_VERSION, output_hash,
+                               snippet_data[filename])
+                converted_count += 1
 
-    print(f"✓ Created {output_file.name}")
+    written_count = len(written_pages)
+
+    # Pages of chapters that left the index, and what was cached for them
+    current_slugs = {filename for filename, _, _, _ in index.chapters}
+    for filename in sorted(set(old_manifest) - current_slugs):
+        for stale_file in (output_dir / f"{filename}.html", block_cache_dir / f"{filename}.json",
+                           search_cache_dir / f"{filename}.json", snippet_cache_dir / f"{filename}.json"):
+            if stale_file.exists():
+                stale_file.unlink()
+        print(f"✓ Removed {filename}.html")
+
+    # Pages a partial build wrote stay marked until a full build has merged
+    # them into the search index and snippet tree. A partial build that
+    # changed the chapter list merges, provided every chapter has been built
+    partial = only is not None and (
+        any(filename not in new_manifest for filename, _, _, _ in index.chapters)
+        or (CONTENTS_SLUG not in written_pages and set(new_manifest) == set(old_manifest)))
+    if partial:
+        for filename, entry in new_manifest.items():
+            if filename in written_pages or (old_manifest.get(filename) or {}).get("unmerged"):
+                entry["unmerged"] = True
+        merge = False
+    else:
+        merge = (written_count or set(new_manifest) != set(old_manifest)
+                 or any(entry.get("unmerged") for entry in new_manifest.values()))
+        for entry in new_manifest.values():
+            entry.pop("unmerged", None)
+
+    timer.switch("manifest")
+    save_manifest(manifest_file, new_manifest)
+
+    # Chapter lists outside the chapter pages, rendered from the same index
+    timer.switch("aggregates")
+    landing_page = output_dir / LANDING_PAGE_NAME
+    if update_landing_page(landing_page, index, assets):
+        print(f"✓ Updated {landing_page.name}")
+    if base_url and write_if_changed(output_dir / SITEMAP_NAME, render_sitemap(index, base_url)):
+        print(f"✓ Created {SITEMAP_NAME}")
+
+    # Check the link graph, counting links from the hand-written landing page
+    timer.switch("links")
+    pages = [(f"{filename}.html", new_manifest[filename].get("links", []),
+              new_manifest[filename].get("anchors", []))
+             for filename, _, _, _ in index.chapters if filename in new_manifest]
+    extra_pages = []
+    if landing_page.exists():
+        extra_pages.append((landing_page.name, page_links(landing_page.read_text(encoding='utf-8'))))
+    broken, orphans = check_links(pages, extra_pages)
+    if partial:
+        # Links elsewhere did not change, and orphans need the whole guide
+        written_files = {f"{filename}.html" for filename in written_pages}
+        broken = [link for link in broken if link[0] in written_files]
+        orphans = []
+    for page, href, problem in broken:
+        print(f"✗ Broken link in {page}: {href} ({problem})")
+    for page in orphans:
+        print(f"⊗ Orphan page {page}: no other page links to it")
+
+    # Merge every page's search data, in reading order, into the client index.
+    # Pages rebuilt byte for byte the same have the same search data, so the
+    # index only changes when a page, the set of chapters or its format does
+    if merge or (not partial and not search_index_current(output_dir)):
+        timer.switch("search index")
+        documents = []
+        for filename, title, _, _ in index.chapters:
+            data = search_data.get(filename)
+            if data is None and filename in new_manifest:
+                data = load_page_data(search_cache_dir / f"{filename}.json", SEARCH_INDEX_VERSION,
+                                      new_manifest[filename].get("output"))
+            if data is not None:
+                documents.append((filename, title, data))
+        write_search_index(output_dir, documents)
+
+    # Likewise the "# File:" blocks, into the example application's source tree
+    tree_dir = base_dir / SNIPPET_DIR
+    if merge or (not partial and (force or not (tree_dir / SNIPPET_MANIFEST_NAME).exists())):
+        timer.switch("snippets")
+        chapters = []
+        for filename, _, _, _ in index.chapters:
+            files = snippet_data.get(filename)
+            if files is None and filename in new_manifest:
+                files = load_page_data(snippet_cache_dir / f"{filename}.json", SNIPPET_CACHE_VERSION,
+                                       new_manifest[filename].get("output"))
+            if files:
+                chapters.append((filename, files))
+        written_files, removed_files, skipped = write_snippet_tree(tree_dir, chapters, force)
+        for filename, file_path in skipped:
+            print(f"⊗ Not extracting \"# File: {file_path.strip()}\" in {filename}: not a relative file path")
+        if written_files or removed_files:
+            print(f"✓ Updated {SNIPPET_DIR.as_posix()}/: {written_files} files written, "
+                  f"{removed_files} removed")
+
+    if compress:
+        timer.switch("compress")
+        compressed = precompress(output_dir)
+        if compressed:
+            print(f"✓ Compressed {compressed} files")
+
+    timer.stop()
+    if report is not None:
+        report["build"] = timer.totals
+    return converted_count, unchanged_count, written_count
+
+def chapter_slugs(names, guide_dir):
+    """Slugs of the chapters named on the command line, as files or slugs
+
+    A name with a directory must be a file in guide_dir itself; a copy of a
+    chapter elsewhere is not what the build would convert.
+    """
+
+    guide_dir = guide_dir.resolve()
+    slugs = set()
+    for name in names:
+        path = Path(name)
+        slug = path.name
+        if slug.endswith('.md'):
+            slug = slug[:-3]
+        in_guide = str(path) == path.name or path.resolve().parent == guide_dir
+        if in_guide and CHAPTER_FILE_RE.match(f"{slug}.md") and (guide_dir / f"{slug}.md").is_file():
+            slugs.add(slug)
+        elif not in_guide:
+            print(f"✗ Not a chapter of the guide: {name} (only files in {guide_dir} are converted)")
+        else:
+            print(f"✗ Not a chapter of the guide: {name}")
+    return slugs
 
-def main():
+def main(argv=None):
     """Main conversion function"""
 
+    args = parse_args(argv)
     base_dir = Path(__file__).parent
-    guide_dir = base_dir / "guide"
-    output_dir = base_dir / "html"
+
+    # Converting just the named chapters skips planning the rest
+    only = None
+    if args.files:
+        only = chapter_slugs(args.files, base_dir / "guide")
+        if not only:
+            raise SystemExit(1)
 
     print("=" * 60)
     print("Converting Markdown Guide to HTML")
     print("=" * 60)
     print()
 
-    # Create output directory
-    output_dir.mkdir(exist_ok=True)
-
-    # Process all markdown files that exist
-    converted_count = 0
-    for chapter_info in CHAPTERS:
-        filename = chapter_info[0]
-        md_file = guide_dir / f"{filename}.md"
-
-        if md_file.exists():
-            try:
-                process_chapter(md_file, output_dir)
-                converted_count += 1
-            except Exception as e:
-                print(f"✗ Error processing {filename}: {e}")
-        else:
-            print(f"⊗ Skipping {filename} (file not found)")
+    if args.basic:
+        use_converter(False)
+
+    report = new_report() if args.timings or args.timings_json or args.profile else None
+    if args.precompress and brotli is None:
+        print("Note: brotli not found, writing .gz files only")
+        print("For .br files: pip3 install brotli")
+    if args.profile:
+        # cProfile only sees this process, so profile a serial build
+        if args.jobs > 1:
+            print(f"Note: --profile converts chapters serially (ignoring --jobs {args.jobs})")
+        import cProfile
+        profiler = cProfile.Profile()
+        converted_count, unchanged_count, written_count = profiler.runcall(
+            build, base_dir, args.force, 1, only, base_url=args.base_url, report=report,
+            compress=args.precompress, minify=args.minify)
+        profiler.dump_stats(args.profile)
+    else:
+        converted_count, unchanged_count, written_count = build(base_dir, args.force, args.jobs, only,
+                                                                base_url=args.base_url, report=report,
+                                                                compress=args.precompress, minify=args.minify)
 
     print()
     print("=" * 60)
-    print(f"Conversion complete! Converted {converted_count} files.")
+    print(f"Conversion complete! Converted {converted_count} files, {unchanged_count} unchanged.")
+    print(f"Pages written: {written_count} changed, "
+          f"{converted_count + unchanged_count - written_count} left untouched.")
     print(f"Open html/index.html in your browser to view the guide.")
     print("=" * 60)
 
+    if args.timings:
+        print_report(report)
+    if args.timings_json:
+        write_report(report, args.timings_json)
+        print(f"✓ Wrote timings to {args.timings_json}")
+    if args.profile:
+        print(f"✓ Wrote profile to {args.profile} (view with: python -m pstats {args.profile})")
+
+    if args.format != "html":
+        from bundle_guide import write_bundle
+        try:
+            bundle_file = write_bundle(base_dir, args.format, args.base_url)
+            print(f"✓ Created {bundle_file.relative_to(base_dir)}")
+        except Exception as e:
+            print(f"✗ Error writing {args.format} bundle: {e}")
+
+    if args.watch:
+        from watch_guide import watch
+        watch(base_dir, args.host, args.port, args.jobs, args.minify)
+
 if __name__ == "__main__":
     main()
@@ -9,33 +9,28 @@ from pathlib import Path
 import markdown
 from markdown.extensions import fenced_code, tables, codehilite
 
-# Chapter navigation map
-CHAPTERS = [
-    ("00.00-front-matter", "Front Matter", None, "00.01-contents"),
-    ("00.01-contents", "Contents", "00.00-front-matter", "01.00-introduction"),
-    ("01.00-introduction", "Introduction", "00.01-contents", "01.01-prerequisites"),
-    ("01.01-prerequisites", "Prerequisites", "01.00-introduction", "02.00-foundations"),
-    ("02.00-foundations", "Foundations", "01.01-prerequisites", "02.01-project-setup"),
-    ("02.01-project-setup", "Project Setup", "02.00-foundations", "02.02-web-application-basics"),
-    ("02.02-web-application-basics", "Web Application Basics", "02.01-project-setup", "02.03-routing-requests"),
-    ("02.03-routing-requests", "Routing Requests", "02.02-web-application-basics", "04.00-database-driven-responses"),
-    ("04.00-database-driven-responses", "Database-Driven Responses", "02.03-routing-requests", "15.00-conclusion"),
-    ("15.00-conclusion", "Conclusion", "04.00-database-driven-responses", "16.00-further-reading"),
-    ("16.00-further-reading", "Further Reading", "15.00-conclusion", "17.00-guided-exercises"),
-    ("17.00-guided-exercises", "Guided Exercises", "16.00-further-reading", None),
-]
+from asset_pipeline import build_assets, rewrite_asset_urls
+from convert_guide import CHAPTER_NUM_RE, chapter_body, get_chapter_index
+from link_graph import rewrite_links
+
+# Patterns used during conversion, compiled once
+FILE_BLOCK_OPEN_RE = re.compile(r'```(\w+)\n# File: ([^\n]+)\n')
+FENCE_CLOSE_NEWLINE_RE = re.compile(r'```\n')
+FENCE_CLOSE_RE = re.compile(r'```')
+FP_CONCEPT_RE = re.compile(r'> \*\*FP Concept: ([^\*]+)\*\*')
+NOTE_RE = re.compile(r'> \*\*Note\*\*:')
+HINT_RE = re.compile(r'> \*\*Hint\*\*:')
+IMPORTANT_RE = re.compile(r'> \*\*Important\*\*:')
 
 def create_html_template(title, content, prev_link=None, next_link=None, chapter_num=None):
     """Create HTML page with navigation"""
 
     prev_html = ""
     if prev_link:
-        prev_title = next((c[1] for c in CHAPTERS if c[0] == prev_link), "Previous")
         prev_html = f'<a href="{prev_link}.html">Previous</a>'
 
     next_html = ""
     if next_link:
-        next_title = next((c[1] for c in CHAPTERS if c[0] == next_link), "Next")
         next_html = f'<a href="{next_link}.html">Next</a> &rsaquo;'
 
     chapter_html = ""
@@ -86,45 +81,55 @@ def create_html_template(title, content, prev_link=None, next_link=None, chapter
 </html>
 """
 
+# Markdown converter shared by every chapter converted in this process
+_markdown_converter = None
+
+def get_markdown_converter():
+    """Return this process's Markdown instance, building its extensions on first use"""
+    global _markdown_converter
+    if _markdown_converter is None:
+        _markdown_converter = markdown.Markdown(extensions=['fenced_code', 'tables', 'codehilite', 'nl2br'])
+    return _markdown_converter
+
 def convert_markdown_to_html(md_content):
     """Convert markdown to HTML with extensions"""
 
     # Process code blocks with file paths
-    md_content = re.sub(
-        r'```(\w+)\n# File: ([^\n]+)\n',
+    md_content = FILE_BLOCK_OPEN_RE.sub(
         r'<figure class="code"><figcaption>File: \2</figcaption><pre><code class="\1">',
         md_content
     )
 
     # Close code blocks
-    md_content = re.sub(r'```\n', '</code></pre></figure>\n', md_content)
-    md_content = re.sub(r'```', '</code></pre></figure>', md_content)
+    md_content = FENCE_CLOSE_NEWLINE_RE.sub('</code></pre></figure>\n', md_content)
+    md_content = FENCE_CLOSE_RE.sub('</code></pre></figure>', md_content)
 
     # Convert blockquotes with special formatting for FP concepts
-    md_content = re.sub(
-        r'> \*\*FP Concept: ([^\*]+)\*\*',
+    md_content = FP_CONCEPT_RE.sub(
         r'<blockquote class="fp-concept"><strong>FP Concept: \1</strong>',
         md_content
     )
 
     # Convert notes/hints/important blocks
-    md_content = re.sub(r'> \*\*Note\*\*:', r'<div class="note"><strong>Note:</strong>', md_content)
-    md_content = re.sub(r'> \*\*Hint\*\*:', r'<div class="hint"><strong>Hint:</strong>', md_content)
-    md_content = re.sub(r'> \*\*Important\*\*:', r'<div class="important"><strong>Important:</strong>', md_content)
+    md_content = NOTE_RE.sub(r'<div class="note"><strong>Note:</strong>', md_content)
+    md_content = HINT_RE.sub(r'<div class="hint"><strong>Hint:</strong>', md_content)
+    md_content = IMPORTANT_RE.sub(r'<div class="important"><strong>Important:</strong>', md_content)
 
     # Convert remaining markdown
-    md = markdown.Markdown(extensions=['fenced_code', 'tables', 'codehilite', 'nl2br'])
+    md = get_markdown_converter()
+    md.reset()
     html = md.convert(md_content)
 
     return html
 
-def process_chapter(md_file, output_dir):
+def process_chapter(md_file, output_dir, assets=None):
     """Process a single chapter file"""
 
     filename = md_file.stem
 
     # Find chapter info
-    chapter_info = next((c for c in CHAPTERS if c[0] == filename), None)
+    index = get_chapter_index()
+    chapter_info = index.get(filename)
     if not chapter_info:
         print(f"Skipping {filename} - not in navigation map")
         return
@@ -136,18 +141,25 @@ def process_chapter(md_file, output_dir):
         md_content = f.read()
 
     # Extract chapter number if present
-    chapter_match = re.search(r'^# Chapter (\d+[.\d]*):?(.+)$', md_content, re.MULTILINE)
+    chapter_match = CHAPTER_NUM_RE.search(md_content)
     chapter_num = None
     if chapter_match:
         chapter_num = f"Chapter {chapter_match.group(1)}"
         # Remove the chapter line from content as we'll add it separately
-        md_content = re.sub(r'^# Chapter \d+[.\d]*:?[^\n]*\n', '', md_content, count=1, flags=re.MULTILINE)
+        md_content = md_content[:chapter_match.start()] + md_content[chapter_match.end() + 1:]
 
     # Convert markdown to HTML
     html_content = convert_markdown_to_html(md_content)
 
+    # Append the generated chapter list to the contents page and point links
+    # to other chapters' markdown files at their HTML pages
+    html_content = "\n".join(chapter_body(filename, [html_content], index))
+    html_content = rewrite_links(html_content, index)
+
     # Create full HTML page
     html_page = create_html_template(title, html_content, prev_link, next_link, chapter_num)
+    if assets:
+        html_page = rewrite_asset_urls(html_page, assets)
 
     # Write HTML file
     output_file = output_dir / f"{filename}.html"
@@ -166,12 +178,15 @@ def main():
     # Create output directory
     output_dir.mkdir(exist_ok=True)
 
+    # Link the minified, fingerprinted stylesheet
+    assets = build_assets(output_dir)
+
     # Process all markdown files
     md_files = sorted(guide_dir.glob("*.md"))
 
     for md_file in md_files:
         try:
-            process_chapter(md_file, output_dir)
+            process_chapter(md_file, output_dir, assets)
         except Exception as e:
             print(f"Error processing {md_file.name}: {e}")
 
@@ -0,0 +1,177 @@
+/* Client-side search over the index written by convert_guide.py (see search_index.py)
+ *
+ * search/docs.json lists the pages and their sections; terms live in
+ * search/<first character>.json shards, fetched only when a query needs them.
+ * Stop words are left out of the index, so docs.json lists them for queries
+ * to drop too.
+ */
+(function () {
+    "use strict";
+
+    var FIELD_WEIGHT = [10, 1, 0.5];
+    var MIN_TERM_LENGTH = 2;
+    var MAX_RESULTS = 20;
+
+    // The script may be linked under a fingerprinted name (search.<hash>.js)
+    var base = document.currentScript.src.replace(/assets\/js\/search(\.[0-9a-f]+)?\.js(\?.*)?$/, "");
+    var indexPromise = null;
+    var shardPromises = {};
+
+    function fetchJSON(path) {
+        return fetch(base + path).then(function (response) {
+            if (!response.ok) throw new Error(path + ": " + response.status);
+            return response.json();
+        });
+    }
+
+    function loadIndex() {
+        if (!indexPromise) indexPromise = fetchJSON("search/docs.json");
+        return indexPromise;
+    }
+
+    function shardName(term) {
+        var first = term.charAt(0);
+        return /^[a-z0-9]$/.test(first) ? first : "_";
+    }
+
+    function loadShard(name) {
+        if (!shardPromises[name]) {
+            shardPromises[name] = fetchJSON("search/" + name + ".json").catch(function () { return {}; });
+        }
+        return shardPromises[name];
+    }
+
+    /* Index of the run containing a word position (runs are [start, section, field] triples) */
+    function findRun(runs, position) {
+        var low = 0, high = runs.length / 3 - 1;
+        while (low < high) {
+            var middle = (low + high + 1) >> 1;
+            if (runs[middle * 3] <= position) low = middle; else high = middle - 1;
+        }
+        return low * 3;
+    }
+
+    /* Expand a term's flattened, delta-encoded postings into {doc: {section: score}} */
+    function decode(flat, docs) {
+        var hits = {};
+        var doc = 0;
+        for (var i = 0; i < flat.length;) {
+            doc += flat[i];
+            var count = flat[i + 1];
+            var runs = docs[doc][3];
+            var sections = hits[doc] = {};
+            var position = 0;
+            for (i += 2; count > 0; count--, i++) {
+                position += flat[i];
+                var run = findRun(runs, position);
+                var section = runs[run + 1];
+                sections[section] = (sections[section] || 0) + FIELD_WEIGHT[runs[run + 2]];
+            }
+        }
+        return hits;
+    }
+
+    function tokenize(query, stopWords) {
+        return (query.toLowerCase().match(/\w+/g) || []).filter(function (term) {
+            return term.length >= MIN_TERM_LENGTH && stopWords.indexOf(term) < 0;
+        });
+    }
+
+    /* Pages matching the query, dropping the stop words the index left out */
+    function search(query) {
+        if (!query.trim()) return Promise.resolve([]);
+
+        return loadIndex().then(function (index) {
+            var terms = tokenize(query, index.stop_words || []);
+            if (!terms.length) return [];
+            return Promise.all(terms.map(function (term) {
+                return loadShard(shardName(term));
+            })).then(function (shards) {
+                return rank(terms, shards, index.docs);
+            });
+        });
+    }
+
+    /* Pages containing every term, best section first */
+    function rank(terms, shards, docs) {
+        var perTerm = terms.map(function (term, i) { return decode(shards[i][term] || [], docs); });
+
+        var results = [];
+        Object.keys(perTerm[0]).forEach(function (doc) {
+            if (!perTerm.every(function (hits) { return doc in hits; })) return;
+
+            var sectionScores = {};
+            var total = 0;
+            perTerm.forEach(function (hits) {
+                Object.keys(hits[doc]).forEach(function (section) {
+                    sectionScores[section] = (sectionScores[section] || 0) + hits[doc][section];
+                    total += hits[doc][section];
+                });
+            });
+            var best = Object.keys(sectionScores).sort(function (a, b) {
+                return sectionScores[b] - sectionScores[a];
+            })[0];
+
+            var page = docs[doc];
+            var section = page[2][best];
+            results.push({
+                score: total,
+                title: page[1],
+                heading: section[1],
+                href: base + page[0] + ".html" + (section[0] ? "#" + section[0] : "")
+            });
+        });
+
+        results.sort(function (a, b) { return b.score - a.score; });
+        return results.slice(0, MAX_RESULTS);
+    }
+
+    function render(list, results, query) {
+        list.textContent = "";
+        if (!results.length && query.trim()) {
+            var empty = document.createElement("li");
+            empty.textContent = "No results";
+            list.appendChild(empty);
+            return;
+        }
+        results.forEach(function (result) {
+            var item = document.createElement("li");
+            var link = document.createElement("a");
+            link.href = result.href;
+            link.textContent = result.title;
+            item.appendChild(link);
+            if (result.heading && result.heading !== result.title) {
+                var heading = document.createElement("span");
+                heading.textContent = " › " + result.heading;
+                item.appendChild(heading);
+            }
+            list.appendChild(item);
+        });
+    }
+
+    function init() {
+        var form = document.querySelector("form.search");
+        // Browsers refuse fetch() from file:// pages, so search needs the guide served over HTTP
+        if (!form || !window.fetch || location.protocol === "file:") return;
+
+        var input = form.querySelector("input[name=q]");
+        var list = form.querySelector(".search-results");
+        var latest = 0;
+
+        form.hidden = false;
+        form.addEventListener("submit", function (event) { event.preventDefault(); });
+        input.addEventListener("input", function () {
+            var query = input.value;
+            var ticket = ++latest;
+            search(query).then(function (results) {
+                if (ticket === latest) render(list, results, query);
+            });
+        });
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", init);
+    } else {
+        init();
+    }
+})();
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Cross-reference links between the guide's pages
+
+Chapters link to each other by markdown file name (02.03-routing-requests.md).
+LinkCollector rewrites those hrefs to the generated pages while a page body
+is streamed to disk, and records the page's internal links and element ids.
+check_links() then validates the whole link graph from those records in one
+pass, without reading any page again.
+"""
+
+import re
+from urllib.parse import urlsplit
+
+HREF_RE = re.compile(r'(<a\b[^>]*?\bhref=")([^"]*)(")')
+# Generated markup puts one space before each attribute; a literal prefix lets
+# the regex engine skip ahead instead of testing a word boundary at every
+# character, which made scanning a page many times slower
+ID_ATTR_RE = re.compile(r' id="([^"]*)"')
+
+# Link targets that name another page of the guide
+PAGE_SUFFIXES = ('.md', '.html')
+
+def is_internal(href):
+    """Whether href is relative to the guide rather than another site"""
+    parts = urlsplit(href)
+    return not (parts.scheme or parts.netloc or href.startswith('/'))
+
+def is_page_link(href):
+    """Whether href points at a guide page or an anchor on the same page"""
+    path = href.partition('#')[0]
+    return is_internal(href) and '/' not in path and (not path or path.endswith(PAGE_SUFFIXES))
+
+def resolve_href(href, index):
+    """href pointing at the generated page for a chapter link, or href unchanged
+
+    index is a ChapterIndex; chapters are matched by slug and, failing that,
+    by their NN.MM number so links to renamed files keep working.
+    """
+
+    path, sep, fragment = href.partition('#')
+    if not path or not is_page_link(href):
+        return href
+    slug = index.resolve(path.rsplit('.', 1)[0])
+    if slug is None:
+        return href
+    return f"{slug}.html{sep}{fragment}"
+
+class LinkCollector:
+    """Rewrite and record the links of one page body
+
+    observe() wraps a chunk iterator, yielding each chunk with its chapter
+    links rewritten (tags must not be split across chunks).
+    """
+
+    def __init__(self, index):
+        self.index = index
+        # Original href -> rewritten href, in order of first appearance
+        self.links = {}
+        self.anchors = []
+
+    def observe(self, chunks):
+        """Yield chunks with chapter links rewritten, recording links and ids"""
+        for chunk in chunks:
+            yield self.feed(chunk)
+
+    def feed(self, chunk):
+        if 'id="' in chunk:
+            self.anchors.extend(ID_ATTR_RE.findall(chunk))
+        if 'href="' not in chunk:
+            return chunk
+        return HREF_RE.sub(self.rewrite, chunk)
+
+    def rewrite(self, match):
+        href = match.group(2)
+        if not is_page_link(href):
+            return match.group(0)
+
+        resolved = self.links.get(href)
+        if resolved is None:
+            resolved = self.links[href] = resolve_href(href, self.index)
+        return f"{match.group(1)}{resolved}{match.group(3)}"
+
+    def result(self):
+        """JSON-friendly {"links": [[href, resolved]], "anchors": [id]}"""
+        return {"links": [list(link) for link in self.links.items()], "anchors": self.anchors}
+
+def rewrite_links(text, index):
+    """text with its chapter links pointed at the generated pages"""
+    return LinkCollector(index).feed(text)
+
+def links_still_resolve(links, index):
+    """Whether every recorded [href, resolved] pair resolves the same way today"""
+    return all(resolve_href(href, index) == resolved for href, resolved in links)
+
+def check_links(pages, extra_pages=()):
+    """Broken links and orphan pages of the guide
+
+    pages is a list of (page, links, anchors) with page the generated file's
+    name and links as recorded by LinkCollector. extra_pages are other files
+    whose links count but whose anchors are unknown, as (page, links).
+    Returns (broken, orphans), broken being (page, href, problem) tuples.
+    """
+
+    anchors_by_page = {page: set(anchors) for page, _, anchors in pages}
+    for page, _ in extra_pages:
+        anchors_by_page[page] = None
+
+    broken = []
+    linked = set()
+    sources = [(page, links) for page, links, _ in pages] + list(extra_pages)
+    for page, links in sources:
+        for href, resolved in links:
+            path, _, fragment = resolved.partition('#')
+            target = path or page
+            if target not in anchors_by_page:
+                broken.append((page, href, "no such page"))
+                continue
+            anchors = anchors_by_page[target]
+            if fragment and anchors is not None and fragment not in anchors:
+                broken.append((page, href, f"no #{fragment} on {target}"))
+                continue
+            if target != page:
+                linked.add(target)
+
+    orphans = [page for page, _, _ in pages if page not in linked]
+    return broken, orphans
+
+def page_links(text):
+    """[href, href] pairs for the guide links in a hand-written page"""
+    return [[href, href] for _, href, _ in HREF_RE.findall(text) if is_page_link(href)]
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Split markdown into blocks that convert the same on their own
+
+split_blocks() cuts a chapter into its top-level blocks (headings,
+paragraph runs, lists, blockquote callouts, fenced code and raw HTML) at
+blank lines where converting each piece on its own gives the same HTML as
+converting the whole: never inside a fence or a raw HTML element, and
+never where the next block would carry on the one before (an indented
+line, a list item after a list, a blockquote after a blockquote, or
+anything after raw HTML, which the markdown library follows with an extra
+blank line unless it ends the document).
+
+Every call into the markdown library costs about as much as converting a
+short paragraph, so group_blocks() joins consecutive blocks into runs of a
+few kilobytes. Where a run ends depends only on the blocks in it, so an
+edit changes the run it falls in and at most the one after.
+convert_guide.py caches each run's HTML by content hash and only converts
+runs it has not seen before.
+"""
+
+import re
+import zlib
+
+# Runs end after a block once they are at least BLOCK_RUN_MIN_BYTES long and
+# the block's checksum is divisible by BLOCK_RUN_CUT_ODDS, or at the first
+# boundary past BLOCK_RUN_MAX_BYTES
+BLOCK_RUN_MIN_BYTES = 2048
+BLOCK_RUN_MAX_BYTES = 16384
+BLOCK_RUN_CUT_ODDS = 4
+
+# Fenced code as convert_guide.py's preprocessor finds it, before the
+# markdown library sees the text
+FENCED_BLOCK_RE = re.compile(r'^[ \t]*```(\w*)[ \t]*\n(.*?)^[ \t]*```[ \t]*$', re.MULTILINE | re.DOTALL)
+# Fences left for the library's fenced_code extension (~~~, or ``` with attributes)
+OTHER_FENCE_RE = re.compile(r'^(?:`{3,}|~{3,})', re.MULTILINE)
+HTML_OPEN_RE = re.compile(r'<([a-zA-Z][\w-]*)[\s/>]')
+# An element opened and closed on one line
+HTML_CLOSED_RE = re.compile(r'<([a-zA-Z][\w-]*)[\s>].*</\1\s*>\s*$')
+LIST_ITEM_RE = re.compile(r'(?:[*+-]|\d+\.)[ \t]')
+# A reference-style link definition makes links anywhere in the document depend on it
+REFERENCE_RE = re.compile(r'^ {0,3}\[[^\]]+\]:', re.MULTILINE)
+
+# Elements without a closing tag
+VOID_ELEMENTS = frozenset("area base br col embed hr img input link meta source track wbr".split())
+
+def line_kind(line):
+    """'indented', 'quote', 'list' or 'other', for deciding whether a block continues the last"""
+
+    if line[:1] in (' ', '\t'):
+        return 'indented'
+    if line.startswith('>'):
+        return 'quote'
+    if LIST_ITEM_RE.match(line):
+        return 'list'
+    return 'other'
+
+def fenced_lines(text, lines):
+    """Indexes of the lines of text inside fenced code, fence lines included"""
+
+    starts = []
+    offset = 0
+    for line in lines:
+        starts.append(offset)
+        offset += len(line) + 1
+
+    inside = set()
+    line = 0
+    for match in FENCED_BLOCK_RE.finditer(text):
+        while starts[line] < match.start():
+            line += 1
+        while line < len(starts) and starts[line] < match.end():
+            inside.add(line)
+            line += 1
+    return inside
+
+def split_blocks(text):
+    """Top-level blocks of markdown text, without the blank lines between them"""
+
+    lines = text.split('\n')
+    fenced = fenced_lines(text, lines)
+    outside = '\n'.join(line for i, line in enumerate(lines) if i not in fenced)
+    if REFERENCE_RE.search(outside) or OTHER_FENCE_RE.search(outside):
+        return [text]
+
+    blocks = []
+    current = []
+    # Kinds of line in the paragraph since the last blank line, plus the
+    # paragraphs it continues by indentation: if it ends in a list or a
+    # blockquote, a list item or blockquote after the blank line extends it
+    kinds = set()
+    blank = False
+    # Raw HTML element the current line is inside, and how deeply it is nested
+    open_tag = None
+    depth = 0
+    # Whether the last non-blank line was, or was inside, raw HTML
+    after_html = False
+
+    for i, line in enumerate(lines):
+        if i in fenced or open_tag:
+            if i not in fenced:
+                # Inside raw HTML until the element that opened it closes
+                if open_tag == '!--':
+                    depth -= '-->' in line
+                else:
+                    depth += len(re.findall(rf'<{open_tag}[\s/>]', line)) - line.count(f'</{open_tag}')
+                if depth <= 0:
+                    if open_tag != '!--' and not line.startswith(f'</{open_tag}'):
+                        # Closed somewhere the markdown library may not agree with
+                        current.extend(lines[i:])
+                        break
+                    open_tag = None
+            elif line.strip(' \t'):
+                after_html = bool(open_tag)
+            current.append(line)
+            continue
+
+        if not line.strip(' \t'):
+            if current:
+                blank = True
+                current.append(line)
+            continue
+
+        kind = line_kind(line)
+        if blank:
+            continues = kind == 'indented' or after_html or (kind in kinds and kind != 'other')
+            if not continues:
+                while not current[-1].strip(' \t'):
+                    current.pop()
+                blocks.append('\n'.join(current))
+                current = []
+            if kind != 'indented':
+                kinds = set()
+            blank = False
+        kinds.add(kind)
+        current.append(line)
+
+        stripped = line.lstrip()
+        after_html = stripped.startswith('<')
+        if after_html and stripped != line and not HTML_CLOSED_RE.match(stripped):
+            # The markdown library's HTML parser decides where indented raw HTML
+            # ends; keep the rest of the document together rather than guess
+            current.extend(lines[i + 1:])
+            break
+        if stripped.startswith('<!--'):
+            if '-->' not in line:
+                open_tag, depth = '!--', 1
+        elif after_html:
+            tag = HTML_OPEN_RE.match(stripped)
+            if tag and tag.group(1).lower() not in VOID_ELEMENTS:
+                name = tag.group(1)
+                depth = len(re.findall(rf'<{name}[\s/>]', line)) - line.count(f'</{name}')
+                if depth > 0:
+                    open_tag = name
+
+    # Trailing blank lines are kept: inside raw HTML they reach the page
+    if current:
+        blocks.append('\n'.join(current))
+    return blocks
+
+def group_blocks(blocks):
+    """Join consecutive blocks into runs of a few kilobytes, ending where their content says"""
+
+    runs = []
+    current = []
+    size = 0
+    for block in blocks:
+        current.append(block)
+        size += len(block)
+        if size >= BLOCK_RUN_MAX_BYTES or (size >= BLOCK_RUN_MIN_BYTES and
+                                           zlib.crc32(block.encode('utf-8')) % BLOCK_RUN_CUT_ODDS == 0):
+            runs.append('\n\n'.join(current))
+            current = []
+            size = 0
+    if current:
+        runs.append('\n\n'.join(current))
+    return runs
@@ -0,0 +1,17 @@
+#!/bin/bash
+
+# Run the converter's tests (tests/test_*.py)
+#
+# Options are passed on to python -m unittest, e.g.
+#   ./run_tests.sh -v                    # list each test
+#   UPDATE_GOLDEN=1 ./run_tests.sh       # rewrite the expected HTML of the golden tests
+
+cd "$(dirname "$0")" || exit 1
+
+PYTHON="${PYTHON:-python3}"
+if ! command -v "$PYTHON" > /dev/null; then
+    echo "✗ $PYTHON not found; the tests need Python 3" >&2
+    exit 1
+fi
+
+exec "$PYTHON" -m unittest discover -s tests -t tests "$@"
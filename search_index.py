@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Build-time full-text search index for the HTML guide
+
+Each page body is tokenized, as it is streamed out, into word positions
+plus a table of runs mapping positions to sections (heading anchors) and
+fields (heading, prose, code). The words of a code block the converter
+rendered come from its source code, so its highlighted HTML is skipped
+rather than stripped of markup. build() in convert_guide.py caches that per
+chapter and merges it into a sharded index under html/search/, which
+assets/js/search.js loads lazily, one shard per query term prefix.
+
+docs.json: {"version": v, "stop_words": [word, ...], "docs": [[slug, title,
+[[anchor, heading], ...], [run_start, section, field, ...]], ...]}
+
+stop_words are the words left out of the index, which search.js also
+leaves out of queries.
+
+Shard (JSON): {"term": [doc_delta, n, pos_delta * n, doc_delta, n, ...]}
+with every posting flattened into one integer list. doc_delta is the
+document number minus that of the term's previous document, and pos_delta
+each word position minus the previous one in that document.
+"""
+
+import html
+import json
+import re
+from array import array
+
+# Bump whenever the tokenization or shard format changes
+SEARCH_INDEX_VERSION = 3
+
+SEARCH_DIR = "search"
+SEARCH_DOCS_NAME = "docs.json"
+
+# Fields a term can occur in; headings rank highest
+HEADING, PROSE, CODE = 0, 1, 2
+
+# Words shorter than this, and the commonest English words, are not indexed
+MIN_TERM_LENGTH = 2
+STOP_WORDS = frozenset("""
+    an and are as at be but by can do for from has have if in into is it its
+    of on or so that the their then there these this to was we were what when
+    which will with you your
+""".split())
+
+STRUCTURE_RE = re.compile(r'<(/?)(h[1-6]|pre|figure)\b([^>]*)>')
+TAG_RE = re.compile(r'<[^>]*>')
+ID_ATTR_RE = re.compile(r'\bid="([^"]*)"')
+WORD_RE = re.compile(r'\w+')
+# Characters, besides letters and digits, of a word or character reference
+# that may continue in the next chunk
+PARTIAL_TOKEN_CHARS = "_&#"
+
+# Runs and postings are kept in arrays of at least 32-bit unsigned integers
+POSTING_TYPECODE = 'I' if array('I').itemsize >= 4 else 'L'
+
+# Attributes of the <figure> convert_guide.render_code_block() wraps code in
+CODE_FIGURE_ATTRIBUTES = ' class="code"'
+PRE_END = '</pre>'
+
+def shard_name(term):
+    """Shard a term belongs to: its first character, or '_' for anything unusual"""
+    first = term[0]
+    return first if first.isascii() and first.isalnum() else "_"
+
+class SearchIndexer:
+    """Collect the search terms of one page body from its HTML
+
+    Feed it the body in chunks (tags must not be split across chunks), or
+    wrap the chunk iterator a page is streamed from in observe(). Each
+    chunk is tokenized as it arrives and its words go straight into the
+    postings; only a word or character reference the chunk may have cut in
+    two is carried over to the next one. Memory grows with the postings,
+    kept as compact integer arrays, never with the page itself.
+
+    code_blocks, if given, is the converter's list of [file path, code]
+    for each code block it rendered, in page order. The code of each
+    <figure class="code"> is tokenized from there, and its <pre> skipped.
+    """
+
+    def __init__(self, code_blocks=None):
+        # Section 0 is the top of the page, before any heading
+        self.sections = [["", ""]]
+        self.runs = array(POSTING_TYPECODE)
+        self.field = PROSE
+        self.heading = []
+        self.carry = ""
+        self.position = 0
+        self.postings = {}
+        self.last_position = {}
+        self.code_blocks = code_blocks
+        self.next_block = 0
+        self.in_code_figure = False
+
+    def observe(self, chunks):
+        """Yield chunks unchanged, indexing each one on the way"""
+        for chunk in chunks:
+            self.feed(chunk)
+            yield chunk
+
+    def feed(self, chunk):
+        if self.carry:
+            chunk = self.carry + chunk
+        cut = len(chunk)
+        while cut and (chunk[cut - 1].isalnum() or chunk[cut - 1] in PARTIAL_TOKEN_CHARS):
+            cut -= 1
+        self.carry = chunk[cut:]
+
+        pos = 0
+        while True:
+            match = STRUCTURE_RE.search(chunk, pos, cut)
+            if match is None:
+                break
+            self.add_text(chunk[pos:match.start()])
+            pos = match.end()
+            closing, tag, attributes = match.groups()
+            self.end_heading()
+            if tag == 'figure':
+                self.in_code_figure = not closing and attributes == CODE_FIGURE_ATTRIBUTES
+            elif tag == 'pre' and not closing:
+                pos = self.start_pre(chunk, pos, cut)
+            elif closing:
+                self.field = PROSE
+            else:
+                anchor = ID_ATTR_RE.search(attributes)
+                self.sections.append([anchor.group(1) if anchor else "", ""])
+                self.field = HEADING
+        self.add_text(chunk[pos:cut])
+
+    def start_pre(self, chunk, pos, cut):
+        """Index a <pre> starting at pos, returning where to carry on in chunk"""
+
+        self.field = CODE
+        in_code_figure, self.in_code_figure = self.in_code_figure, False
+        if not in_code_figure or self.code_blocks is None or self.next_block >= len(self.code_blocks):
+            return pos
+        code = self.code_blocks[self.next_block][1]
+        self.next_block += 1
+        end = chunk.find(PRE_END, pos, cut)
+        if end < 0:
+            return pos
+        self.add_words(code)
+        self.field = PROSE
+        return end + len(PRE_END)
+
+    def add_text(self, text):
+        """Index a piece of HTML text between structure tags"""
+
+        if '<' in text:
+            text = TAG_RE.sub(' ', text)
+        if '&' in text:
+            text = html.unescape(text)
+        if self.field == HEADING:
+            self.heading.append(text)
+        self.add_words(text)
+
+    def end_heading(self):
+        """Record the text of the heading being indexed, if any"""
+
+        if self.field == HEADING:
+            self.sections[-1][1] = " ".join("".join(self.heading).split())
+        self.heading = []
+
+    def add_words(self, text):
+        """Add the words of text to the postings, as a run of the current field and section"""
+
+        words = WORD_RE.findall(text.lower())
+        if not words:
+            return
+        section = len(self.sections) - 1
+        runs = self.runs
+        if not runs or runs[-2] != section or runs[-1] != self.field:
+            runs.extend((self.position, section, self.field))
+
+        # Each word's array is [count, first position, gaps...]
+        postings = self.postings
+        last_position = self.last_position
+        for position, word in enumerate(words, self.position):
+            flat = postings.get(word)
+            if flat is None:
+                if len(word) < MIN_TERM_LENGTH or word in STOP_WORDS:
+                    continue
+                postings[word] = array(POSTING_TYPECODE, (1, position))
+            else:
+                flat[0] += 1
+                flat.append(position - last_position[word])
+            last_position[word] = position
+        self.position += len(words)
+
+    def result(self):
+        """JSON-friendly {"sections": [[anchor, heading]], "runs": [...], "postings": {term: [n, ...]}}
+
+        runs and the postings are arrays; json.dumps() needs default=list for them.
+        """
+
+        carry, self.carry = self.carry, ""
+        self.add_text(carry)
+        self.end_heading()
+        postings = {word: self.postings[word] for word in sorted(self.postings)}
+        return {"sections": self.sections, "runs": self.runs, "postings": postings}
+
+def build_search_index(documents):
+    """Merge per-page index data into {relative path: JSON text} for html/
+
+    documents is a list of (slug, title, data) in reading order, where data
+    is a SearchIndexer.result().
+    """
+
+    docs = []
+    terms = {}
+    last_doc = {}
+    for doc_number, (slug, title, data) in enumerate(documents):
+        docs.append([slug, title, data["sections"], data["runs"]])
+        for term, postings in data["postings"].items():
+            flat = terms.get(term)
+            if flat is None:
+                flat = terms[term] = []
+            flat.append(doc_number - last_doc.get(term, 0))
+            flat.extend(postings)
+            last_doc[term] = doc_number
+
+    shards = {}
+    for term, flat in terms.items():
+        shards.setdefault(shard_name(term), {})[term] = flat
+
+    files = {f"{SEARCH_DIR}/{SEARCH_DOCS_NAME}": dump({"version": SEARCH_INDEX_VERSION,
+                                                       "stop_words": sorted(STOP_WORDS), "docs": docs})}
+    for name, encoded in shards.items():
+        files[f"{SEARCH_DIR}/{name}.json"] = dump(encoded)
+    return files
+
+def dump(data):
+    """Compact JSON text"""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, sort_keys=True, default=list)
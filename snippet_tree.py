@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+The example application's source tree, extracted from the guide
+
+Code blocks whose first line is "# File: <path>" show a file of the
+SnippetBox application as it stands at that point in the guide. While
+converting, convert_guide.py records each chapter's file blocks;
+write_snippet_tree() then merges them in reading order, so each file ends
+up as its last chapter left it, and writes the result under
+source-code/snippetbox/ next to a manifest of which chapters touch which
+file. A file is only rewritten when the hash of its content changed, and
+files the guide no longer shows are removed.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from build_files import load_versioned_json, write_if_changed
+
+SNIPPET_DIR = Path("source-code") / "snippetbox"
+SNIPPET_MANIFEST_NAME = "snippets.json"
+SNIPPET_MANIFEST_VERSION = 1
+
+# Relative paths made of ordinary names; anything else in a "# File:" line is
+# a description rather than a path
+SNIPPET_PATH_RE = re.compile(r'[\w.+-]+(?:/[\w.+-]+)*')
+
+def snippet_path(file_path):
+    """file_path from a "# File:" line as a path under the tree, or None if it is not one"""
+
+    file_path = file_path.strip()
+    if not SNIPPET_PATH_RE.fullmatch(file_path):
+        return None
+    if any(part in ('.', '..') for part in file_path.split('/')) or file_path == SNIPPET_MANIFEST_NAME:
+        return None
+    return file_path
+
+def merge_snippets(chapters):
+    """{path: (code, [slugs])} from (slug, [[file_path, code], ...]) pairs in reading order
+
+    Each file's code is the last version shown; slugs lists every chapter
+    that shows it. Also returns the "# File:" paths that were skipped.
+    """
+
+    files = {}
+    skipped = []
+    for slug, blocks in chapters:
+        for file_path, code in blocks:
+            path = snippet_path(file_path)
+            if path is None:
+                skipped.append((slug, file_path))
+                continue
+            _, slugs = files.get(path, (None, []))
+            if slug not in slugs:
+                slugs = slugs + [slug]
+            files[path] = (code, slugs)
+    return files, skipped
+
+def load_snippet_manifest(manifest_file):
+    """The files recorded by the last write_snippet_tree(), or {} if missing or unreadable"""
+
+    manifest = load_versioned_json(manifest_file, SNIPPET_MANIFEST_VERSION)
+    return manifest.get("files", {}) if manifest else {}
+
+def write_snippet_tree(tree_dir, chapters, force=False):
+    """Write the files shown in chapters under tree_dir, with their manifest
+
+    chapters are (slug, [[file_path, code], ...]) pairs in reading order. A
+    file whose hash matches the last manifest is left alone unless force is
+    set; any other file is compared with the one on disk and only rewritten
+    if it differs, so unchanged files keep their modification times. Files
+    only the last manifest lists are removed, along with the directories
+    they leave empty. Returns (written, removed, skipped paths).
+    """
+
+    manifest_file = tree_dir / SNIPPET_MANIFEST_NAME
+    old_files = load_snippet_manifest(manifest_file)
+    files, skipped = merge_snippets(chapters)
+
+    new_files = {}
+    written = 0
+    for path, (code, slugs) in sorted(files.items()):
+        data = code.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        target = tree_dir / path
+        if force or (old_files.get(path) or {}).get("sha256") != digest or not target.exists():
+            if write_if_changed(target, data):
+                written += 1
+        new_files[path] = {"sha256": digest, "chapters": slugs}
+
+    removed = 0
+    for path in sorted(set(old_files) - set(new_files)):
+        target = tree_dir / path
+        if snippet_path(path) is None or not target.is_file():
+            continue
+        target.unlink()
+        removed += 1
+        parent = target.parent
+        while parent != tree_dir and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+    manifest = json.dumps({"version": SNIPPET_MANIFEST_VERSION, "files": new_files}, indent=2, sort_keys=True)
+    write_if_changed(manifest_file, manifest + "\n")
+    return written, removed, skipped
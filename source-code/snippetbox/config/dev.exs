@@ -0,0 +1,10 @@
+
+config :snippetbox, SnippetboxWeb.Endpoint,
+  https: [
+    port: 4001,
+    cipher_suite: :strong,
+    certfile: "priv/cert/selfsigned.pem",
+    keyfile: "priv/cert/selfsigned_key.pem"
+  ]
+
+# Or use Phoenix.Endpoint.Cowboy2Adapter to auto-generate
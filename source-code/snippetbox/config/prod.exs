@@ -0,0 +1,15 @@
+
+config :snippetbox, SnippetboxWeb.Endpoint,
+  https: [
+    port: 443,
+    cipher_suite: :strong,  # Phoenix default strong ciphers
+    # Or custom ciphers:
+    ciphers: [
+      'ECDHE-ECDSA-AES256-GCM-SHA384',
+      'ECDHE-RSA-AES256-GCM-SHA384',
+      'ECDHE-ECDSA-AES128-GCM-SHA256',
+      'ECDHE-RSA-AES128-GCM-SHA256'
+    ],
+    versions: [:"tlsv1.2", :"tlsv1.3"],
+    honor_cipher_order: true
+  ]
@@ -0,0 +1,4 @@
+
+config :wallaby,
+  screenshot_on_failure: true,
+  screenshot_dir: "tmp/screenshots"
@@ -0,0 +1,20 @@
+
+defmodule Mix.Tasks.Snippetbox.Stats do
+  use Mix.Task
+
+  @shortdoc "Display snippet statistics"
+
+  @moduledoc """
+  Displays statistics about snippets in the database.
+
+  ## Usage
+
+      mix snippetbox.stats
+      mix snippetbox.stats --language elixir
+      mix snippetbox.stats --user user@example.com
+  """
+
+  def run(args) do
+    # Parse args, start app, query database, display results
+  end
+end
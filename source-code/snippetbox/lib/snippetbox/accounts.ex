@@ -0,0 +1,51 @@
+
+@doc """
+Finds or creates a user from OAuth data.
+"""
+def find_or_create_oauth_user(attrs) do
+  case get_user_by_provider(attrs.provider, attrs.provider_id) do
+    nil ->
+      # Check if email already exists
+      case get_user_by_email(attrs.email) do
+        nil ->
+          create_oauth_user(attrs)
+
+        existing_user ->
+          # Link OAuth to existing account
+          link_oauth_to_user(existing_user, attrs)
+      end
+
+    user ->
+      # Update user info from OAuth
+      update_oauth_user(user, attrs)
+  end
+end
+
+def get_user_by_provider(provider, provider_id) do
+  Repo.get_by(User, provider: provider, provider_id: provider_id)
+end
+
+defp create_oauth_user(attrs) do
+  %User{}
+  |> User.oauth_changeset(attrs)
+  |> Repo.insert()
+end
+
+defp link_oauth_to_user(user, attrs) do
+  user
+  |> User.oauth_changeset(%{
+    provider: attrs.provider,
+    provider_id: attrs.provider_id,
+    avatar_url: attrs.avatar_url
+  })
+  |> Repo.update()
+end
+
+defp update_oauth_user(user, attrs) do
+  user
+  |> User.oauth_changeset(%{
+    name: attrs.name,
+    avatar_url: attrs.avatar_url
+  })
+  |> Repo.update()
+end
@@ -0,0 +1,13 @@
+
+defmodule Snippetbox.Accounts.Lockout do
+  # Implement:
+  # - record_failed_attempt/1 - records failed login
+  # - reset_attempts/1 - clears attempts on success
+  # - locked?/1 - checks if account is locked
+  # - unlock_at/1 - returns when account unlocks
+
+  # Rules:
+  # - Lock after 5 failed attempts
+  # - Lock duration increases exponentially
+  # - Max lock duration: 24 hours
+end
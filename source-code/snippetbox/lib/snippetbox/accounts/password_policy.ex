@@ -0,0 +1,11 @@
+
+defmodule Snippetbox.Accounts.PasswordPolicy do
+  # Implement validation for:
+  # - Minimum length (default: 12)
+  # - Require uppercase
+  # - Require lowercase
+  # - Require digit
+  # - Require special character
+  # - Not in common password list
+  # - Not similar to email
+end
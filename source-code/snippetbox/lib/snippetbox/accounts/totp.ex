@@ -0,0 +1,8 @@
+
+defmodule Snippetbox.Accounts.TOTP do
+  # Implement:
+  # - generate_secret/0 - creates new TOTP secret
+  # - generate_uri/2 - creates otpauth:// URI for QR code
+  # - valid_token?/2 - validates a TOTP token
+  # - backup_codes/0 - generates backup codes
+end
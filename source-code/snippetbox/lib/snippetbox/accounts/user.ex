@@ -0,0 +1,28 @@
+
+schema "users" do
+  field :email, :string
+  field :name, :string
+  field :password, :string, virtual: true, redact: true
+  field :hashed_password, :string, redact: true
+  field :confirmed_at, :naive_datetime
+
+  # OAuth fields
+  field :provider, :string
+  field :provider_id, :string
+  field :avatar_url, :string
+
+  timestamps()
+end
+
+@doc """
+Changeset for OAuth registration.
+"""
+def oauth_changeset(user, attrs) do
+  user
+  |> cast(attrs, [:email, :name, :provider, :provider_id, :avatar_url])
+  |> validate_required([:email, :provider, :provider_id])
+  |> validate_email()
+  |> unique_constraint(:email)
+  |> unique_constraint([:provider, :provider_id])
+  |> put_change(:confirmed_at, NaiveDateTime.utc_now() |> NaiveDateTime.truncate(:second))
+end
@@ -0,0 +1,24 @@
+
+defmodule Snippetbox.Accounts.UserIdentity do
+  use Ecto.Schema
+  import Ecto.Changeset
+
+  schema "user_identities" do
+    field :provider, :string
+    field :provider_id, :string
+    field :provider_email, :string
+    field :provider_name, :string
+    field :avatar_url, :string
+
+    belongs_to :user, Snippetbox.Accounts.User
+
+    timestamps()
+  end
+
+  def changeset(identity, attrs) do
+    identity
+    |> cast(attrs, [:provider, :provider_id, :provider_email, :provider_name, :avatar_url])
+    |> validate_required([:provider, :provider_id])
+    |> unique_constraint([:provider, :provider_id])
+  end
+end
@@ -0,0 +1,17 @@
+
+@doc """
+Deliver instructions to confirm account.
+"""
+def deliver_confirmation_instructions(user, url) do
+  deliver(user.email, "Confirm your account", """
+  Hi #{user.name},
+
+  Welcome to Snippetbox! Please confirm your account by visiting the URL below:
+
+  #{url}
+
+  If you didn't create an account with us, please ignore this email.
+
+  This link will expire in 7 days.
+  """)
+end
@@ -0,0 +1,51 @@
+
+@reset_password_validity_in_days 1
+
+@doc """
+Builds a token with a hashed counter part.
+
+The non-hashed token is sent to the user email while the
+hashed part is stored in the database. The original token cannot
+be reconstructed, making it safer for storage.
+"""
+def build_email_token(user, context) do
+  build_hashed_token(user, context, user.email)
+end
+
+defp build_hashed_token(user, context, sent_to) do
+  token = :crypto.strong_rand_bytes(@rand_size)
+  hashed_token = :crypto.hash(@hash_algorithm, token)
+
+  {Base.url_encode64(token, padding: false),
+   %__MODULE__{
+     token: hashed_token,
+     context: context,
+     sent_to: sent_to,
+     user_id: user.id
+   }}
+end
+
+@doc """
+Checks if the token is valid and returns its underlying lookup query.
+"""
+def verify_email_token_query(token, context) do
+  case Base.url_decode64(token, padding: false) do
+    {:ok, decoded_token} ->
+      hashed_token = :crypto.hash(@hash_algorithm, decoded_token)
+      days = days_for_context(context)
+
+      query =
+        from token in by_token_and_context_query(hashed_token, context),
+          join: user in assoc(token, :user),
+          where: token.inserted_at > ago(^days, "day") and token.sent_to == user.email,
+          select: user
+
+      {:ok, query}
+
+    :error ->
+      :error
+  end
+end
+
+defp days_for_context("reset_password"), do: @reset_password_validity_in_days
+defp days_for_context("confirm"), do: @confirm_validity_in_days
@@ -0,0 +1,13 @@
+
+def start(_type, _args) do
+  children = [
+    # ...
+  ]
+
+  opts = [strategy: :one_for_one, name: Snippetbox.Supervisor]
+
+  # Handle shutdown signals
+  :init.notify_when_started(self())
+
+  Supervisor.start_link(children, opts)
+end
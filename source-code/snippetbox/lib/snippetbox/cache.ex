@@ -0,0 +1,48 @@
+
+defmodule Snippetbox.Cache do
+  @table :cache
+  @default_ttl 60 * 5  # 5 minutes
+
+  def get(key) do
+    case :ets.lookup(@table, key) do
+      [{^key, value, expires_at}] ->
+        if System.system_time(:second) < expires_at do
+          {:ok, value}
+        else
+          delete(key)
+          :miss
+        end
+
+      [] ->
+        :miss
+    end
+  end
+
+  def put(key, value, ttl \\ @default_ttl) do
+    expires_at = System.system_time(:second) + ttl
+    :ets.insert(@table, {key, value, expires_at})
+    :ok
+  end
+
+  def delete(key) do
+    :ets.delete(@table, key)
+    :ok
+  end
+
+  def fetch(key, ttl \\ @default_ttl, fun) do
+    case get(key) do
+      {:ok, value} ->
+        value
+
+      :miss ->
+        value = fun.()
+        put(key, value, ttl)
+        value
+    end
+  end
+
+  def clear do
+    :ets.delete_all_objects(@table)
+    :ok
+  end
+end
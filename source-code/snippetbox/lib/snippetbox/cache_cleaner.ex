@@ -0,0 +1,32 @@
+
+defmodule Snippetbox.CacheCleaner do
+  use GenServer
+
+  def start_link(_opts) do
+    GenServer.start_link(__MODULE__, %{}, name: __MODULE__)
+  end
+
+  def init(state) do
+    schedule_cleanup()
+    {:ok, state}
+  end
+
+  def handle_info(:cleanup, state) do
+    cleanup_expired()
+    schedule_cleanup()
+    {:noreply, state}
+  end
+
+  defp schedule_cleanup do
+    Process.send_after(self(), :cleanup, 60_000)  # Every minute
+  end
+
+  defp cleanup_expired do
+    now = System.system_time(:second)
+
+    # Delete expired entries
+    :ets.select_delete(:cache, [
+      {{:_, :_, :"$1"}, [{:<, :"$1", now}], [true]}
+    ])
+  end
+end
@@ -0,0 +1,41 @@
+
+defmodule Snippetbox.CacheWarmer do
+  use GenServer
+  require Logger
+
+  alias Snippetbox.{Cache, Snippets}
+
+  def start_link(_opts) do
+    GenServer.start_link(__MODULE__, %{}, name: __MODULE__)
+  end
+
+  def init(state) do
+    warm_cache()
+    schedule_refresh()
+    {:ok, state}
+  end
+
+  def handle_info(:refresh, state) do
+    warm_cache()
+    schedule_refresh()
+    {:noreply, state}
+  end
+
+  defp schedule_refresh do
+    Process.send_after(self(), :refresh, 60_000 * 5)  # Every 5 minutes
+  end
+
+  defp warm_cache do
+    Logger.info("Warming cache...")
+
+    # Pre-load popular snippets
+    popular = Snippets.list_popular_snippets()
+    Cache.put("popular_snippets", popular, 60 * 10)
+
+    # Pre-load recent snippets
+    recent = Snippets.list_recent_snippets()
+    Cache.put("recent_snippets", recent, 60 * 5)
+
+    Logger.info("Cache warmed successfully")
+  end
+end
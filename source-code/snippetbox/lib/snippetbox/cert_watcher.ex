@@ -0,0 +1,52 @@
+
+defmodule Snippetbox.CertWatcher do
+  use GenServer
+  require Logger
+
+  def start_link(_opts) do
+    GenServer.start_link(__MODULE__, %{}, name: __MODULE__)
+  end
+
+  def init(state) do
+    schedule_check()
+    {:ok, state}
+  end
+
+  def handle_info(:check_certs, state) do
+    check_certificate_expiry()
+    schedule_check()
+    {:noreply, state}
+  end
+
+  defp schedule_check do
+    # Check daily
+    Process.send_after(self(), :check_certs, 24 * 60 * 60 * 1000)
+  end
+
+  defp check_certificate_expiry do
+    cert_path = System.get_env("SSL_CERT_PATH")
+
+    case File.read(cert_path) do
+      {:ok, pem} ->
+        [cert_entry | _] = :public_key.pem_decode(pem)
+        cert = :public_key.pem_entry_decode(cert_entry)
+        validity = elem(cert, 2)
+        not_after = elem(validity, 2)
+
+        days_until_expiry = calculate_days(not_after)
+
+        if days_until_expiry < 30 do
+          Logger.warning("SSL certificate expires in #{days_until_expiry} days!")
+          # Send alert notification
+        end
+
+      {:error, reason} ->
+        Logger.error("Could not read certificate: #{reason}")
+    end
+  end
+
+  defp calculate_days(_not_after) do
+    # Calculate days until expiry
+    30  # Simplified
+  end
+end
@@ -0,0 +1,20 @@
+
+defmodule Snippetbox.Chat do
+  @pubsub Snippetbox.PubSub
+
+  def subscribe(room_id) do
+    Phoenix.PubSub.subscribe(@pubsub, "chat:#{room_id}")
+  end
+
+  def send_message(room_id, user, content) do
+    message = %{
+      id: System.unique_integer([:positive]),
+      user: user,
+      content: content,
+      sent_at: DateTime.utc_now()
+    }
+
+    Phoenix.PubSub.broadcast(@pubsub, "chat:#{room_id}", {:new_message, message})
+    {:ok, message}
+  end
+end
@@ -0,0 +1,13 @@
+
+defmodule Snippetbox.Comments.Comment do
+  use Ecto.Schema
+  import Ecto.Changeset
+
+  # Create schema with:
+  # - content (required, min 10 chars, max 1000 chars)
+  # - author_name (required if user_id is nil)
+  # - user_id (optional, foreign key)
+  # - snippet_id (required, foreign key)
+  # - approved (boolean, default false)
+  # - timestamps
+end
@@ -0,0 +1,17 @@
+
+defmodule Snippetbox.Config do
+  @doc """
+  Get a configuration value with type validation.
+
+  ## Examples
+
+      iex> Config.get(:pool_size, :integer, default: 10)
+      {:ok, 10}
+
+      iex> Config.get(:debug, :boolean, default: false)
+      {:ok, false}
+  """
+  def get(key, type, opts \\ []) do
+    # Your implementation here
+  end
+end
@@ -0,0 +1,23 @@
+
+defmodule Snippetbox.Counters do
+  @table :counters
+
+  def setup do
+    :ets.new(@table, [:set, :public, :named_table, write_concurrency: true])
+  end
+
+  def increment(key, amount \\ 1) do
+    :ets.update_counter(@table, key, {2, amount}, {key, 0})
+  end
+
+  def get(key) do
+    case :ets.lookup(@table, key) do
+      [{^key, count}] -> count
+      [] -> 0
+    end
+  end
+
+  def reset(key) do
+    :ets.insert(@table, {key, 0})
+  end
+end
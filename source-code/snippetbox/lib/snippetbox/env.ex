@@ -0,0 +1,55 @@
+
+defmodule Snippetbox.Env do
+  # ... previous functions ...
+
+  @required_vars ~w(
+    DATABASE_URL
+    SECRET_KEY_BASE
+    PHX_HOST
+  )
+
+  @optional_vars ~w(
+    PORT
+    POOL_SIZE
+    SMTP_HOST
+  )
+
+  def validate! do
+    missing =
+      @required_vars
+      |> Enum.filter(&is_nil(System.get_env(&1)))
+
+    if missing != [] do
+      raise """
+      Missing required environment variables:
+      #{Enum.join(missing, "\n")}
+
+      See .env.sample for required variables.
+      """
+    end
+
+    :ok
+  end
+
+  def print_config do
+    IO.puts("\n=== Environment Configuration ===")
+
+    for var <- @required_vars ++ @optional_vars do
+      value = System.get_env(var)
+      masked = mask_sensitive(var, value)
+      status = if value, do: "✓", else: "✗"
+      IO.puts("#{status} #{var}: #{masked}")
+    end
+
+    IO.puts("================================\n")
+  end
+
+  defp mask_sensitive(name, nil), do: "(not set)"
+  defp mask_sensitive(name, value) do
+    if String.contains?(name, ["SECRET", "PASSWORD", "KEY"]) do
+      String.slice(value, 0, 4) <> "****"
+    else
+      value
+    end
+  end
+end
@@ -0,0 +1,15 @@
+
+defmodule Snippetbox.FileProcessor do
+  @doc """
+  Process a file and return its contents transformed.
+
+  Should handle:
+  - File not found
+  - Permission denied
+  - Invalid encoding
+  - Empty file
+  """
+  def process(path) do
+    # Your implementation here
+  end
+end
@@ -0,0 +1,30 @@
+
+defmodule Snippetbox.Helpers.StringHelper do
+  @doc """
+  Truncates a string to the specified length.
+
+  ## Examples
+
+      iex> Snippetbox.Helpers.StringHelper.truncate("Hello World", 5)
+      "Hello..."
+
+      iex> Snippetbox.Helpers.StringHelper.truncate("Hi", 10)
+      "Hi"
+  """
+  def truncate(string, max_length) when byte_size(string) <= max_length do
+    string
+  end
+
+  def truncate(string, max_length) do
+    String.slice(string, 0, max_length) <> "..."
+  end
+end
+
+# File: test/snippetbox/helpers/string_helper_test.exs
+
+defmodule Snippetbox.Helpers.StringHelperTest do
+  use ExUnit.Case, async: true
+
+  # Run doctests from the module
+  doctest Snippetbox.Helpers.StringHelper
+end
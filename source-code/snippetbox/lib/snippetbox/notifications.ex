@@ -0,0 +1,16 @@
+
+defmodule Snippetbox.Notifications do
+  @pubsub Snippetbox.PubSub
+
+  def subscribe(user_id) do
+    Phoenix.PubSub.subscribe(@pubsub, "user:#{user_id}:notifications")
+  end
+
+  def notify(user_id, notification) do
+    Phoenix.PubSub.broadcast(
+      @pubsub,
+      "user:#{user_id}:notifications",
+      {:new_notification, notification}
+    )
+  end
+end
@@ -0,0 +1,30 @@
+
+defmodule Snippetbox.RateLimiter do
+  @table :rate_limits
+
+  def check(key, limit, window_seconds) do
+    now = System.system_time(:second)
+    window_start = now - window_seconds
+
+    # Clean old entries and count current
+    case :ets.lookup(@table, key) do
+      [{^key, count, timestamp}] when timestamp >= window_start ->
+        if count >= limit do
+          {:deny, limit - count}
+        else
+          :ets.update_counter(@table, key, {2, 1})
+          {:allow, limit - count - 1}
+        end
+
+      _ ->
+        # Start new window
+        :ets.insert(@table, {key, 1, now})
+        {:allow, limit - 1}
+    end
+  end
+
+  def reset(key) do
+    :ets.delete(@table, key)
+    :ok
+  end
+end
@@ -0,0 +1,6 @@
+
+defmodule Snippetbox.Repo do
+  use Ecto.Repo,
+    otp_app: :snippetbox,
+    adapter: Ecto.Adapters.Postgres
+end
@@ -0,0 +1,53 @@
+
+defmodule Snippetbox.Sanitizer do
+  @moduledoc """
+  HTML sanitization for user content.
+  """
+
+  @doc """
+  Basic HTML - allows formatting tags only.
+  """
+  def basic_html(html) do
+    HtmlSanitizeEx.basic_html(html)
+  end
+
+  @doc """
+  Markdown HTML - allows more tags for rendered markdown.
+  """
+  def markdown_html(html) do
+    HtmlSanitizeEx.markdown_html(html)
+  end
+
+  @doc """
+  Strip all HTML tags.
+  """
+  def strip_tags(html) do
+    HtmlSanitizeEx.strip_tags(html)
+  end
+
+  @doc """
+  Custom sanitization with specific allowed tags.
+  """
+  def custom_html(html) do
+    HtmlSanitizeEx.Scrubber.scrub(html, CustomScrubber)
+  end
+end
+
+# Custom scrubber
+defmodule Snippetbox.Sanitizer.CustomScrubber do
+  require HtmlSanitizeEx.Scrubber.Meta
+  alias HtmlSanitizeEx.Scrubber.Meta
+
+  # Allow specific tags
+  Meta.allow_tag_with_uri_attributes("a", ["href"], ["http", "https"])
+  Meta.allow_tag_with_these_attributes("a", ["title"])
+  Meta.allow_tag_with_these_attributes("p", [])
+  Meta.allow_tag_with_these_attributes("br", [])
+  Meta.allow_tag_with_these_attributes("strong", [])
+  Meta.allow_tag_with_these_attributes("em", [])
+  Meta.allow_tag_with_these_attributes("code", ["class"])
+  Meta.allow_tag_with_these_attributes("pre", ["class"])
+
+  # Strip everything else
+  Meta.strip_everything_not_covered()
+end
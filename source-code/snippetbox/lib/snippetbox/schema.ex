@@ -0,0 +1,16 @@
+
+defmodule Snippetbox.Schema do
+  defmacro __using__(_) do
+    quote do
+      use Ecto.Schema
+      @primary_key {:id, :binary_id, autogenerate: true}
+      @foreign_key_type :binary_id
+    end
+  end
+end
+
+# Usage in schemas
+defmodule Snippetbox.Snippets.Snippet do
+  use Snippetbox.Schema  # Instead of use Ecto.Schema
+  # ...
+end
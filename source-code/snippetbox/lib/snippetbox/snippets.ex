@@ -0,0 +1,9 @@
+
+def list_snippets_paginated(opts \\ []) do
+  # Options:
+  # - limit: number of items (default 20)
+  # - cursor: last item's id from previous page
+  # - direction: :after or :before cursor
+
+  # Return: %{items: [...], next_cursor: id, has_more: boolean}
+end
@@ -0,0 +1,9 @@
+
+def publish_changeset(snippet, attrs) do
+  # Requirements for publishing:
+  # - Title must be at least 10 characters
+  # - Content must be at least 50 characters
+  # - Must have a description
+  # - Must have at least one tag
+  # - Sets published_at to current time
+end
@@ -0,0 +1,7 @@
+
+defp html_helpers do
+  quote do
+    import SnippetboxWeb.CoreComponents
+    import SnippetboxWeb.SnippetComponents  # Custom components
+  end
+end
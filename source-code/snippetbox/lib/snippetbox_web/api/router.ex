@@ -0,0 +1,13 @@
+
+defmodule SnippetboxWeb.API.Router do
+  use SnippetboxWeb, :router
+
+  pipeline :api do
+    plug :accepts, ["json"]
+  end
+
+  scope "/v1", SnippetboxWeb.API.V1, as: :v1 do
+    pipe_through :api
+    resources "/snippets", SnippetController
+  end
+end
@@ -0,0 +1,12 @@
+
+defmodule SnippetboxWeb.Components.Card do
+  use Phoenix.Component
+
+  # Create a card component with:
+  # - Required :title attribute
+  # - Optional :subtitle attribute
+  # - Optional :class attribute
+  # - Required :inner_block slot (main content)
+  # - Optional :footer slot
+  # - Optional :actions slot (appears in header)
+end
@@ -0,0 +1,25 @@
+
+def toast(assigns) do
+  ~H"""
+  <div
+    :if={msg = Phoenix.Flash.get(@flash, @kind)}
+    id={"toast-#{@kind}"}
+    class={[
+      "fixed bottom-4 right-4 z-50 rounded-lg shadow-lg p-4 max-w-sm",
+      "transform transition-all duration-300",
+      @kind == :info && "bg-green-500 text-white",
+      @kind == :error && "bg-red-500 text-white",
+      @kind == :warning && "bg-yellow-500 text-black"
+    ]}
+    role="alert"
+    phx-click={JS.hide(to: "#toast-#{@kind}")}
+  >
+    <div class="flex items-center gap-2">
+      <.icon :if={@kind == :info} name="hero-check-circle" class="h-5 w-5" />
+      <.icon :if={@kind == :error} name="hero-x-circle" class="h-5 w-5" />
+      <.icon :if={@kind == :warning} name="hero-exclamation-triangle" class="h-5 w-5" />
+      <span><%= msg %></span>
+    </div>
+  </div>
+  """
+end
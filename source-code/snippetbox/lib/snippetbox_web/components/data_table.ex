@@ -0,0 +1,64 @@
+
+defmodule SnippetboxWeb.Components.DataTable do
+  use Phoenix.Component
+
+  attr :id, :string, required: true
+  attr :rows, :list, required: true
+  attr :row_id, :any, default: nil
+  attr :row_click, :any, default: nil
+
+  slot :col, required: true do
+    attr :label, :string
+    attr :class, :string
+  end
+
+  slot :action
+
+  def data_table(assigns) do
+    assigns =
+      with %{rows: %Phoenix.LiveView.LiveStream{}} <- assigns do
+        assign(assigns, row_id: assigns.row_id || fn {id, _item} -> id end)
+      end
+
+    ~H"""
+    <div class="overflow-x-auto">
+      <table class="w-full">
+        <thead class="text-sm text-left text-zinc-500 border-b">
+          <tr>
+            <th :for={col <- @col} class={["p-3 font-medium", col[:class]]}>
+              <%= col[:label] %>
+            </th>
+            <th :if={@action != []} class="p-3">
+              <span class="sr-only">Actions</span>
+            </th>
+          </tr>
+        </thead>
+        <tbody
+          id={@id}
+          phx-update={match?(%Phoenix.LiveView.LiveStream{}, @rows) && "stream"}
+          class="text-sm divide-y divide-zinc-100"
+        >
+          <tr
+            :for={row <- @rows}
+            id={@row_id && @row_id.(row)}
+            class="hover:bg-zinc-50"
+          >
+            <td
+              :for={{col, i} <- Enum.with_index(@col)}
+              phx-click={@row_click && @row_click.(row)}
+              class={["p-3", col[:class], @row_click && "cursor-pointer"]}
+            >
+              <%= render_slot(col, @row_id && elem(row, 1) || row) %>
+            </td>
+            <td :if={@action != []} class="p-3 text-right">
+              <span :for={action <- @action}>
+                <%= render_slot(action, @row_id && elem(row, 1) || row) %>
+              </span>
+            </td>
+          </tr>
+        </tbody>
+      </table>
+    </div>
+    """
+  end
+end
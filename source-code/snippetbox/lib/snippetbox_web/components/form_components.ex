@@ -0,0 +1,15 @@
+
+defmodule SnippetboxWeb.FormComponents do
+  use Phoenix.Component
+
+  attr :class, :string, default: nil
+  slot :inner_block, required: true
+
+  def input_group(assigns) do
+    ~H"""
+    <div class={["flex gap-4", @class]}>
+      <%= render_slot(@inner_block) %>
+    </div>
+    """
+  end
+end
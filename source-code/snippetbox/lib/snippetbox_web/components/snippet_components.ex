@@ -0,0 +1,33 @@
+
+defmodule SnippetboxWeb.SnippetComponents do
+  use Phoenix.Component
+
+  attr :snippet, :map, required: true
+
+  def snippet_card(assigns) do
+    ~H"""
+    <div class="border rounded-lg p-4 hover:shadow-lg transition">
+      <h3 class="font-bold text-lg"><%= @snippet.title %></h3>
+      <p class="text-sm text-gray-500"><%= @snippet.language %></p>
+      <pre class="mt-2 bg-gray-100 p-2 rounded overflow-auto">
+        <code><%= @snippet.content %></code>
+      </pre>
+    </div>
+    """
+  end
+
+  attr :snippets, :list, required: true
+  attr :on_click, :any, default: nil
+
+  def snippet_list(assigns) do
+    ~H"""
+    <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
+      <%= for snippet <- @snippets do %>
+        <div phx-click={@on_click && @on_click.(snippet)}>
+          <.snippet_card snippet={snippet} />
+        </div>
+      <% end %>
+    </div>
+    """
+  end
+end
@@ -0,0 +1,25 @@
+
+defmodule SnippetboxWeb.Admin.UserController do
+  use SnippetboxWeb, :controller
+
+  alias Snippetbox.Accounts
+
+  def index(conn, _params) do
+    users = Accounts.list_users()
+    render(conn, :index, users: users)
+  end
+
+  def show(conn, %{"id" => id}) do
+    user = Accounts.get_user!(id)
+    render(conn, :show, user: user)
+  end
+
+  def delete(conn, %{"id" => id}) do
+    user = Accounts.get_user!(id)
+    {:ok, _} = Accounts.delete_user(user)
+
+    conn
+    |> put_flash(:info, "User deleted successfully.")
+    |> redirect(to: ~p"/admin/users")
+  end
+end
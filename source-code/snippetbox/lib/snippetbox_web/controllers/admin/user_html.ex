@@ -0,0 +1,6 @@
+
+defmodule SnippetboxWeb.Admin.UserHTML do
+  use SnippetboxWeb, :html
+
+  embed_templates "user_html/*"
+end
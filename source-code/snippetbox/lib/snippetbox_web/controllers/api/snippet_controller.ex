@@ -0,0 +1,20 @@
+
+defmodule SnippetboxWeb.API.SnippetController do
+  use SnippetboxWeb, :controller
+
+  action_fallback SnippetboxWeb.FallbackController
+
+  def show(conn, %{"id" => id}) do
+    with {:ok, snippet} <- Snippets.fetch_snippet(id) do
+      json(conn, %{data: snippet})
+    end
+  end
+
+  def create(conn, %{"snippet" => params}) do
+    with {:ok, snippet} <- Snippets.create_snippet(params) do
+      conn
+      |> put_status(:created)
+      |> json(%{data: snippet})
+    end
+  end
+end
@@ -0,0 +1,42 @@
+
+defmodule SnippetboxWeb.AuthController do
+  use SnippetboxWeb, :controller
+  plug Ueberauth
+
+  alias Snippetbox.Accounts
+  alias SnippetboxWeb.UserAuth
+
+  def callback(%{assigns: %{ueberauth_failure: _fails}} = conn, _params) do
+    conn
+    |> put_flash(:error, "Failed to authenticate.")
+    |> redirect(to: ~p"/login")
+  end
+
+  def callback(%{assigns: %{ueberauth_auth: auth}} = conn, _params) do
+    user_params = %{
+      email: auth.info.email,
+      name: auth.info.name || auth.info.nickname,
+      provider: to_string(auth.provider),
+      provider_id: to_string(auth.uid),
+      avatar_url: auth.info.image
+    }
+
+    case Accounts.find_or_create_oauth_user(user_params) do
+      {:ok, user} ->
+        conn
+        |> put_flash(:info, "Successfully authenticated!")
+        |> UserAuth.log_in_user(user)
+
+      {:error, reason} ->
+        conn
+        |> put_flash(:error, "Error: #{reason}")
+        |> redirect(to: ~p"/login")
+    end
+  end
+
+  def delete(conn, _params) do
+    conn
+    |> put_flash(:info, "Logged out successfully.")
+    |> UserAuth.log_out_user()
+  end
+end
@@ -0,0 +1,7 @@
+
+defmodule SnippetboxWeb.CommentController do
+  use SnippetboxWeb, :controller
+
+  # Implement index, show, create, delete
+  # Each action should load the parent snippet first
+end
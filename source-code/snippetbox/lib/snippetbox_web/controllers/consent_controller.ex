@@ -0,0 +1,25 @@
+
+defmodule SnippetboxWeb.ConsentController do
+  use SnippetboxWeb, :controller
+
+  def accept(conn, _params) do
+    conn
+    |> put_resp_cookie("cookie_consent", "accepted",
+         max_age: 60 * 60 * 24 * 365,
+         http_only: false  # Allow JS to read
+       )
+    |> json(%{status: "ok"})
+  end
+end
+
+# Plug to check consent
+defmodule SnippetboxWeb.Plugs.CookieConsent do
+  import Plug.Conn
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    consent = conn.cookies["cookie_consent"] == "accepted"
+    assign(conn, :cookie_consent, consent)
+  end
+end
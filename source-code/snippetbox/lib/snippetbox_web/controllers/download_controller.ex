@@ -0,0 +1,24 @@
+
+defmodule SnippetboxWeb.DownloadController do
+  use SnippetboxWeb, :controller
+
+  def show(conn, %{"id" => id}) do
+    attachment = Attachments.get_attachment!(id)
+
+    # Check authorization
+    if authorized?(conn.assigns.current_user, attachment) do
+      send_download(conn, {:file, attachment.path},
+        filename: attachment.original_filename,
+        content_type: attachment.content_type
+      )
+    else
+      conn
+      |> put_status(:forbidden)
+      |> text("Access denied")
+    end
+  end
+
+  defp authorized?(user, attachment) do
+    attachment.user_id == user.id
+  end
+end
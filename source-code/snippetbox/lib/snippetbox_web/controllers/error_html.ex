@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.ErrorHTML do
+  use SnippetboxWeb, :html
+
+  # Implement render/2 that:
+  # - Shows "Page not found" for 404
+  # - Shows "Access denied" for 403
+  # - Shows "Something went wrong" for 500
+  # - Falls back to status message for others
+end
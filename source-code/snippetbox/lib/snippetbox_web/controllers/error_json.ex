@@ -0,0 +1,71 @@
+
+defmodule SnippetboxWeb.ErrorJSON do
+  @moduledoc """
+  JSON error responses for API endpoints.
+  """
+
+  # Customize specific errors
+  def render("404.json", _assigns) do
+    %{
+      error: %{
+        status: 404,
+        message: "Resource not found",
+        code: "not_found"
+      }
+    }
+  end
+
+  def render("422.json", %{changeset: changeset}) do
+    %{
+      error: %{
+        status: 422,
+        message: "Validation failed",
+        code: "validation_error",
+        details: format_changeset_errors(changeset)
+      }
+    }
+  end
+
+  def render("500.json", _assigns) do
+    %{
+      error: %{
+        status: 500,
+        message: "Internal server error",
+        code: "server_error"
+      }
+    }
+  end
+
+  # Fallback for any other status
+  def render(template, _assigns) do
+    status = status_from_template(template)
+    %{
+      error: %{
+        status: status,
+        message: Phoenix.Controller.status_message_from_template(template),
+        code: code_from_status(status)
+      }
+    }
+  end
+
+  defp status_from_template(template) do
+    template
+    |> String.replace(".json", "")
+    |> String.to_integer()
+  end
+
+  defp code_from_status(400), do: "bad_request"
+  defp code_from_status(401), do: "unauthorized"
+  defp code_from_status(403), do: "forbidden"
+  defp code_from_status(404), do: "not_found"
+  defp code_from_status(422), do: "unprocessable_entity"
+  defp code_from_status(_), do: "error"
+
+  defp format_changeset_errors(changeset) do
+    Ecto.Changeset.traverse_errors(changeset, fn {msg, opts} ->
+      Regex.replace(~r"%{(\w+)}", msg, fn _, key ->
+        opts |> Keyword.get(String.to_existing_atom(key), key) |> to_string()
+      end)
+    end)
+  end
+end
@@ -0,0 +1,36 @@
+
+defmodule SnippetboxWeb.FallbackController do
+  use SnippetboxWeb, :controller
+
+  # Handle Ecto changeset errors
+  def call(conn, {:error, %Ecto.Changeset{} = changeset}) do
+    conn
+    |> put_status(:unprocessable_entity)
+    |> put_view(json: SnippetboxWeb.ErrorJSON)
+    |> render("422.json", changeset: changeset)
+  end
+
+  # Handle not found
+  def call(conn, {:error, :not_found}) do
+    conn
+    |> put_status(:not_found)
+    |> put_view(json: SnippetboxWeb.ErrorJSON)
+    |> render("404.json")
+  end
+
+  # Handle unauthorized
+  def call(conn, {:error, :unauthorized}) do
+    conn
+    |> put_status(:unauthorized)
+    |> put_view(json: SnippetboxWeb.ErrorJSON)
+    |> render("401.json")
+  end
+
+  # Handle forbidden
+  def call(conn, {:error, :forbidden}) do
+    conn
+    |> put_status(:forbidden)
+    |> put_view(json: SnippetboxWeb.ErrorJSON)
+    |> render("403.json")
+  end
+end
@@ -0,0 +1,43 @@
+
+defmodule SnippetboxWeb.HealthController do
+  use SnippetboxWeb, :controller
+
+  # Liveness: Is the app running?
+  def live(conn, _params) do
+    json(conn, %{status: "ok"})
+  end
+
+  # Readiness: Can the app serve traffic?
+  def ready(conn, _params) do
+    checks = [
+      {:database, check_database()},
+      {:migrations, check_migrations()}
+    ]
+
+    if Enum.all?(checks, fn {_, status} -> status == :ok end) do
+      json(conn, %{status: "ready", checks: Map.new(checks)})
+    else
+      conn
+      |> put_status(:service_unavailable)
+      |> json(%{status: "not_ready", checks: Map.new(checks)})
+    end
+  end
+
+  defp check_database do
+    case Ecto.Adapters.SQL.query(Snippetbox.Repo, "SELECT 1", []) do
+      {:ok, _} -> :ok
+      _ -> :error
+    end
+  end
+
+  defp check_migrations do
+    repo = Snippetbox.Repo
+    migrations = Ecto.Migrator.migrations(repo)
+
+    if Enum.all?(migrations, fn {status, _, _} -> status == :up end) do
+      :ok
+    else
+      :pending
+    end
+  end
+end
@@ -0,0 +1,16 @@
+
+defmodule SnippetboxWeb.Helpers do
+  import Phoenix.Controller
+
+  def flash_success(conn, message) do
+    put_flash(conn, :info, message)
+  end
+
+  def flash_error(conn, message) do
+    put_flash(conn, :error, message)
+  end
+
+  def flash_warning(conn, message) do
+    put_flash(conn, :warning, message)
+  end
+end
@@ -0,0 +1,10 @@
+
+def home(conn, _params) do
+  # Read a specific cookie
+  theme = conn.cookies["theme"] || "light"
+
+  # Read all cookies
+  all_cookies = conn.cookies
+
+  render(conn, :home, theme: theme)
+end
@@ -0,0 +1,31 @@
+
+@cookie_signing_salt "preferences_salt"
+
+def set_user_preferences(conn, %{"prefs" => prefs}) do
+  # Encode and sign
+  signed_value = sign_cookie(conn, prefs)
+
+  conn
+  |> put_resp_cookie("user_prefs", signed_value, max_age: 60 * 60 * 24 * 30)
+  |> redirect(to: ~p"/")
+end
+
+def get_user_preferences(conn) do
+  case conn.cookies["user_prefs"] do
+    nil -> %{}
+    signed_value -> verify_cookie(conn, signed_value)
+  end
+end
+
+defp sign_cookie(conn, data) do
+  data
+  |> Jason.encode!()
+  |> Phoenix.Token.sign(conn, @cookie_signing_salt)
+end
+
+defp verify_cookie(conn, signed_value) do
+  case Phoenix.Token.verify(conn, @cookie_signing_salt, signed_value, max_age: 60 * 60 * 24 * 30) do
+    {:ok, json} -> Jason.decode!(json)
+    {:error, _} -> %{}
+  end
+end
@@ -0,0 +1,14 @@
+
+defmodule SnippetboxWeb.RedirectController do
+  use SnippetboxWeb, :controller
+
+  # Redirect old snippet URLs
+  def old_snippet(conn, %{"id" => id}) do
+    redirect(conn, to: ~p"/snippets/#{id}")
+  end
+
+  # Redirect with external URL
+  def github(conn, _params) do
+    redirect(conn, external: "https://github.com/snippetbox")
+  end
+end
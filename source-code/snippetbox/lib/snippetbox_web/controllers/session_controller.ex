@@ -0,0 +1,45 @@
+
+def create(conn, %{"email" => email, "password" => password, "remember_me" => remember}) do
+  case Accounts.authenticate(email, password) do
+    {:ok, user} ->
+      conn = put_session(conn, :user_id, user.id)
+
+      conn =
+        if remember == "true" do
+          token = Accounts.generate_remember_token(user)
+          put_resp_cookie(conn, "remember_token", token,
+            max_age: 60 * 60 * 24 * 30,  # 30 days
+            http_only: true,
+            secure: Mix.env() == :prod
+          )
+        else
+          conn
+        end
+
+      redirect(conn, to: ~p"/")
+
+    {:error, _} ->
+      render(conn, :new, error: "Invalid credentials")
+  end
+end
+
+# Plug to restore session from remember token
+def restore_session(conn, _opts) do
+  if get_session(conn, :user_id) do
+    conn
+  else
+    case conn.cookies["remember_token"] do
+      nil -> conn
+      token ->
+        case Accounts.get_user_by_remember_token(token) do
+          nil ->
+            delete_resp_cookie(conn, "remember_token")
+
+          user ->
+            conn
+            |> put_session(:user_id, user.id)
+            |> assign(:current_user, user)
+        end
+    end
+  end
+end
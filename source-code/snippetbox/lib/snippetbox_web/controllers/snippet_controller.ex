@@ -0,0 +1,50 @@
+
+def show(conn, %{"id" => id}) do
+  snippet = Snippets.get_snippet!(id)
+
+  # Increment view counter (non-blocking)
+  Task.start(fn ->
+    Counters.increment("snippet:#{id}:views")
+  end)
+
+  render(conn, :show, snippet: snippet)
+end
+
+# Periodic sync to database
+defmodule Snippetbox.CounterSync do
+  use GenServer
+
+  def start_link(_opts) do
+    GenServer.start_link(__MODULE__, %{}, name: __MODULE__)
+  end
+
+  def init(state) do
+    schedule_sync()
+    {:ok, state}
+  end
+
+  def handle_info(:sync, state) do
+    sync_counters_to_database()
+    schedule_sync()
+    {:noreply, state}
+  end
+
+  defp schedule_sync do
+    Process.send_after(self(), :sync, 60_000)  # Every minute
+  end
+
+  defp sync_counters_to_database do
+    # Get all counters and update database
+    :ets.tab2list(:counters)
+    |> Enum.each(fn {key, count} ->
+      case String.split(key, ":") do
+        ["snippet", id, "views"] ->
+          Snippets.increment_views(id, count)
+          Counters.reset(key)
+
+        _ ->
+          :ok
+      end
+    end)
+  end
+end
@@ -0,0 +1,11 @@
+
+defmodule SnippetboxWeb.SnippetHTML do
+  use SnippetboxWeb, :html
+
+  embed_templates "snippet_html/*"
+
+  # Snippet-specific helpers
+  def language_label(language) do
+    # ...
+  end
+end
@@ -0,0 +1,47 @@
+
+defmodule SnippetboxWeb.UserConfirmationController do
+  use SnippetboxWeb, :controller
+
+  alias Snippetbox.Accounts
+
+  def new(conn, _params) do
+    render(conn, :new)
+  end
+
+  def create(conn, %{"user" => %{"email" => email}}) do
+    if user = Accounts.get_user_by_email(email) do
+      Accounts.deliver_user_confirmation_instructions(
+        user,
+        &url(~p"/confirm/#{&1}")
+      )
+    end
+
+    conn
+    |> put_flash(:info, "If your email is in our system and it has not been confirmed yet, you will receive an email with instructions shortly.")
+    |> redirect(to: ~p"/")
+  end
+
+  def edit(conn, %{"token" => token}) do
+    render(conn, :edit, token: token)
+  end
+
+  def update(conn, %{"token" => token}) do
+    case Accounts.confirm_user(token) do
+      {:ok, _} ->
+        conn
+        |> put_flash(:info, "Your account has been confirmed successfully.")
+        |> redirect(to: ~p"/login")
+
+      :error ->
+        case conn.assigns do
+          %{current_user: %{confirmed_at: confirmed_at}} when not is_nil(confirmed_at) ->
+            redirect(conn, to: ~p"/")
+
+          %{} ->
+            conn
+            |> put_flash(:error, "Confirmation link is invalid or has expired.")
+            |> redirect(to: ~p"/")
+        end
+    end
+  end
+end
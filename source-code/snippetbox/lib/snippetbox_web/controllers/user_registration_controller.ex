@@ -0,0 +1,18 @@
+
+def create(conn, %{"user" => user_params}) do
+  case Accounts.register_user(user_params) do
+    {:ok, user} ->
+      {:ok, _} =
+        Accounts.deliver_user_confirmation_instructions(
+          user,
+          &url(~p"/confirm/#{&1}")
+        )
+
+      conn
+      |> put_flash(:info, "Account created! Please check your email to confirm your account.")
+      |> redirect(to: ~p"/login")
+
+    {:error, %Ecto.Changeset{} = changeset} ->
+      render(conn, :new, changeset: changeset)
+  end
+end
@@ -0,0 +1,34 @@
+
+defmodule SnippetboxWeb.UserSessionsController do
+  use SnippetboxWeb, :controller
+
+  alias Snippetbox.Accounts
+
+  def index(conn, _params) do
+    user = conn.assigns.current_user
+    sessions = Accounts.list_user_sessions(user)
+    current_token = get_session(conn, :user_token)
+
+    render(conn, :index, sessions: sessions, current_token: current_token)
+  end
+
+  def delete(conn, %{"id" => id}) do
+    user = conn.assigns.current_user
+    Accounts.delete_user_session(user, id)
+
+    conn
+    |> put_flash(:info, "Session revoked.")
+    |> redirect(to: ~p"/settings/sessions")
+  end
+
+  def delete_all(conn, _params) do
+    user = conn.assigns.current_user
+    current_token = get_session(conn, :user_token)
+
+    Accounts.delete_all_user_sessions(user, current_token)
+
+    conn
+    |> put_flash(:info, "All other sessions have been logged out.")
+    |> redirect(to: ~p"/settings/sessions")
+  end
+end
@@ -0,0 +1,42 @@
+
+defmodule SnippetboxWeb.UserSnippetController do
+  use SnippetboxWeb, :controller
+
+  alias Snippetbox.Accounts
+  alias Snippetbox.Snippets
+
+  # Plug to load and authorize user
+  plug :load_user
+
+  def index(conn, _params) do
+    snippets = Snippets.list_snippets_for_user(conn.assigns.user)
+    render(conn, :index, snippets: snippets)
+  end
+
+  def show(conn, %{"id" => id}) do
+    snippet = Snippets.get_user_snippet!(conn.assigns.user, id)
+    render(conn, :show, snippet: snippet)
+  end
+
+  def new(conn, _params) do
+    changeset = Snippets.change_snippet(%Snippet{})
+    render(conn, :new, changeset: changeset)
+  end
+
+  def create(conn, %{"snippet" => snippet_params}) do
+    case Snippets.create_snippet_for_user(conn.assigns.user, snippet_params) do
+      {:ok, snippet} ->
+        conn
+        |> put_flash(:info, "Snippet created successfully.")
+        |> redirect(to: ~p"/users/#{conn.assigns.user}/snippets/#{snippet}")
+
+      {:error, changeset} ->
+        render(conn, :new, changeset: changeset)
+    end
+  end
+
+  defp load_user(conn, _opts) do
+    user = Accounts.get_user!(conn.params["user_id"])
+    assign(conn, :user, user)
+  end
+end
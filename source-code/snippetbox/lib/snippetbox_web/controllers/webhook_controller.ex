@@ -0,0 +1,23 @@
+
+defmodule SnippetboxWeb.WebhookController do
+  use SnippetboxWeb, :controller
+
+  def stripe(conn, params) do
+    # Verify using Stripe's signature instead of CSRF
+    signature = get_req_header(conn, "stripe-signature") |> List.first()
+    payload = conn.assigns[:raw_body]
+
+    case Stripe.Webhook.construct_event(payload, signature, webhook_secret()) do
+      {:ok, event} ->
+        handle_stripe_event(event)
+        json(conn, %{status: "ok"})
+
+      {:error, reason} ->
+        conn
+        |> put_status(:bad_request)
+        |> json(%{error: reason})
+    end
+  end
+
+  defp webhook_secret, do: Application.get_env(:snippetbox, :stripe_webhook_secret)
+end
@@ -0,0 +1,8 @@
+
+plug Plug.Parsers,
+  parsers: [:urlencoded, :multipart, :json],
+  pass: ["*/*"],
+  json_decoder: Phoenix.json_library(),
+  length: 8_000_000,  # 8MB max
+  read_length: 1_000_000,  # 1MB chunks
+  read_timeout: 15_000  # 15 seconds
@@ -0,0 +1,27 @@
+
+defmodule SnippetboxWeb.NotFoundError do
+  defexception [:message, plug_status: 404]
+
+  def exception(opts) do
+    message = Keyword.get(opts, :message, "Resource not found")
+    %__MODULE__{message: message}
+  end
+end
+
+defmodule SnippetboxWeb.UnauthorizedError do
+  defexception [:message, plug_status: 401]
+
+  def exception(opts) do
+    message = Keyword.get(opts, :message, "Authentication required")
+    %__MODULE__{message: message}
+  end
+end
+
+defmodule SnippetboxWeb.ForbiddenError do
+  defexception [:message, plug_status: 403]
+
+  def exception(opts) do
+    message = Keyword.get(opts, :message, "Access denied")
+    %__MODULE__{message: message}
+  end
+end
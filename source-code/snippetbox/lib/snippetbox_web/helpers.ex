@@ -0,0 +1,42 @@
+
+defmodule SnippetboxWeb.Helpers do
+  @moduledoc """
+  View helpers for formatting and display.
+  """
+
+  import Phoenix.HTML
+
+  # Date/Time
+  def format_date(nil), do: ""
+  def format_date(dt), do: Calendar.strftime(dt, "%B %d, %Y")
+
+  def time_ago(nil), do: ""
+  def time_ago(datetime) do
+    diff = DateTime.diff(DateTime.utc_now(), datetime, :second)
+    cond do
+      diff < 60 -> "just now"
+      diff < 3600 -> "#{div(diff, 60)}m ago"
+      diff < 86400 -> "#{div(diff, 3600)}h ago"
+      diff < 604800 -> "#{div(diff, 86400)}d ago"
+      true -> format_date(datetime)
+    end
+  end
+
+  # Numbers
+  def compact_number(n) when n >= 1_000_000, do: "#{Float.round(n/1_000_000, 1)}M"
+  def compact_number(n) when n >= 1_000, do: "#{Float.round(n/1_000, 1)}K"
+  def compact_number(n), do: to_string(n)
+
+  # Text
+  def truncate(nil, _), do: ""
+  def truncate(text, len) do
+    if String.length(text) > len do
+      String.slice(text, 0, len) <> "..."
+    else
+      text
+    end
+  end
+
+  def pluralize(1, s, _), do: "1 #{s}"
+  def pluralize(n, _, p), do: "#{n} #{p}"
+end
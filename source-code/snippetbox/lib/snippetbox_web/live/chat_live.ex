@@ -0,0 +1,140 @@
+
+defmodule SnippetboxWeb.ChatLive do
+  use SnippetboxWeb, :live_view
+
+  alias Snippetbox.Chat
+  alias SnippetboxWeb.Presence
+
+  @impl true
+  def mount(%{"room_id" => room_id}, _session, socket) do
+    topic = "chat:#{room_id}"
+
+    if connected?(socket) do
+      Chat.subscribe(room_id)
+      Phoenix.PubSub.subscribe(Snippetbox.PubSub, topic)
+
+      Presence.track(self(), topic, socket.assigns.current_user.id, %{
+        name: socket.assigns.current_user.name,
+        typing: false
+      })
+    end
+
+    {:ok,
+     socket
+     |> assign(:room_id, room_id)
+     |> assign(:message, "")
+     |> assign(:presences, Presence.list(topic))
+     |> stream(:messages, [])}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div class="flex h-[600px]">
+      <%# Messages area %>
+      <div class="flex-1 flex flex-col">
+        <div
+          id="messages"
+          phx-update="stream"
+          class="flex-1 overflow-y-auto p-4 space-y-4"
+        >
+          <div
+            :for={{dom_id, message} <- @streams.messages}
+            id={dom_id}
+            class={[
+              "flex gap-3",
+              message.user.id == @current_user.id && "flex-row-reverse"
+            ]}
+          >
+            <div class="w-8 h-8 rounded-full bg-blue-500 text-white flex items-center justify-center">
+              <%= String.first(message.user.name) %>
+            </div>
+            <div class={[
+              "max-w-xs px-4 py-2 rounded-lg",
+              message.user.id == @current_user.id && "bg-blue-500 text-white",
+              message.user.id != @current_user.id && "bg-gray-200"
+            ]}>
+              <p class="text-xs font-medium mb-1"><%= message.user.name %></p>
+              <p><%= message.content %></p>
+            </div>
+          </div>
+        </div>
+
+        <%# Typing indicator %>
+        <div :if={typing_users(@presences, @current_user.id) != []} class="px-4 py-2 text-sm text-gray-500">
+          <%= Enum.join(typing_users(@presences, @current_user.id), ", ") %> typing...
+        </div>
+
+        <%# Message input %>
+        <form phx-submit="send" phx-change="typing" class="p-4 border-t">
+          <div class="flex gap-2">
+            <input
+              type="text"
+              name="message"
+              value={@message}
+              placeholder="Type a message..."
+              class="flex-1 rounded-lg border-gray-300"
+              autocomplete="off"
+            />
+            <.button type="submit">Send</.button>
+          </div>
+        </form>
+      </div>
+
+      <%# Online users sidebar %>
+      <div class="w-64 border-l p-4">
+        <h3 class="font-semibold mb-4">Online (<%= map_size(@presences) %>)</h3>
+        <ul class="space-y-2">
+          <%= for {_user_id, %{metas: [meta | _]}} <- @presences do %>
+            <li class="flex items-center gap-2">
+              <span class="w-2 h-2 bg-green-500 rounded-full"></span>
+              <%= meta.name %>
+            </li>
+          <% end %>
+        </ul>
+      </div>
+    </div>
+    """
+  end
+
+  @impl true
+  def handle_event("send", %{"message" => content}, socket) when content != "" do
+    Chat.send_message(socket.assigns.room_id, socket.assigns.current_user, content)
+    update_typing(socket, false)
+    {:noreply, assign(socket, :message, "")}
+  end
+
+  def handle_event("send", _params, socket), do: {:noreply, socket}
+
+  def handle_event("typing", %{"message" => message}, socket) do
+    is_typing = String.length(message) > 0
+    update_typing(socket, is_typing)
+    {:noreply, assign(socket, :message, message)}
+  end
+
+  @impl true
+  def handle_info({:new_message, message}, socket) do
+    {:noreply, stream_insert(socket, :messages, message)}
+  end
+
+  def handle_info(%Phoenix.Socket.Broadcast{event: "presence_diff", payload: diff}, socket) do
+    presences = Presence.sync_diff(socket.assigns.presences, diff)
+    {:noreply, assign(socket, :presences, presences)}
+  end
+
+  defp update_typing(socket, typing) do
+    topic = "chat:#{socket.assigns.room_id}"
+
+    Presence.update(self(), topic, socket.assigns.current_user.id, fn meta ->
+      Map.put(meta, :typing, typing)
+    end)
+  end
+
+  defp typing_users(presences, current_user_id) do
+    presences
+    |> Enum.filter(fn {user_id, %{metas: [meta | _]}} ->
+      user_id != to_string(current_user_id) && meta.typing
+    end)
+    |> Enum.map(fn {_, %{metas: [meta | _]}} -> meta.name end)
+  end
+end
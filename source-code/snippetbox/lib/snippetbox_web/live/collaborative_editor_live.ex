@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.CollaborativeEditorLive do
+  use SnippetboxWeb, :live_view
+
+  # Requirements:
+  # - Multiple users can edit same document
+  # - Show cursors of other users
+  # - Real-time sync (debounced)
+  # - Show list of active editors
+end
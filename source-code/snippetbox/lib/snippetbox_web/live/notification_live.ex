@@ -0,0 +1,11 @@
+
+defmodule SnippetboxWeb.NotificationLive do
+  use SnippetboxWeb, :live_view
+
+  # Requirements:
+  # - Subscribe to user-specific notifications
+  # - Show toast messages that auto-dismiss
+  # - Support different types (info, success, error)
+  # - Allow manual dismiss
+  # - Stack multiple notifications
+end
@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.PersistentCounterLive do
+  use SnippetboxWeb, :live_view
+
+  # Requirements:
+  # - Counter value stored in database
+  # - All connected clients see the same value
+  # - Updates broadcast to all viewers
+  # - Show number of viewers
+end
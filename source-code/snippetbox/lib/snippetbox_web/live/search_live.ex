@@ -0,0 +1,91 @@
+
+defmodule SnippetboxWeb.SearchLive do
+  use SnippetboxWeb, :live_view
+
+  alias Snippetbox.Snippets
+
+  @impl true
+  def mount(_params, _session, socket) do
+    {:ok,
+     socket
+     |> assign(:query, "")
+     |> assign(:results, [])
+     |> assign(:loading, false)}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div class="max-w-2xl mx-auto">
+      <form phx-change="search" phx-submit="search">
+        <div class="relative">
+          <input
+            type="text"
+            name="query"
+            value={@query}
+            placeholder="Search snippets..."
+            phx-debounce="300"
+            class="w-full pl-10 pr-4 py-3 rounded-lg border-gray-300 shadow-sm"
+          />
+          <.icon
+            name="hero-magnifying-glass"
+            class="absolute left-3 top-3.5 h-5 w-5 text-gray-400"
+          />
+          <div
+            :if={@loading}
+            class="absolute right-3 top-3"
+          >
+            <.spinner />
+          </div>
+        </div>
+      </form>
+
+      <div :if={@query != "" && @results == []} class="mt-8 text-center text-gray-500">
+        No results found for "<%= @query %>"
+      </div>
+
+      <ul :if={@results != []} class="mt-4 divide-y">
+        <li :for={snippet <- @results} class="py-4">
+          <.link navigate={~p"/snippets/#{snippet}"} class="block hover:bg-gray-50 -mx-4 px-4 py-2 rounded">
+            <h3 class="font-medium"><%= snippet.title %></h3>
+            <p class="text-sm text-gray-500 mt-1">
+              <%= String.slice(snippet.content, 0, 100) %>...
+            </p>
+            <div class="flex gap-2 mt-2">
+              <span class="text-xs bg-gray-100 px-2 py-1 rounded"><%= snippet.language %></span>
+            </div>
+          </.link>
+        </li>
+      </ul>
+    </div>
+    """
+  end
+
+  @impl true
+  def handle_event("search", %{"query" => query}, socket) when byte_size(query) >= 2 do
+    send(self(), {:search, query})
+
+    {:noreply,
+     socket
+     |> assign(:query, query)
+     |> assign(:loading, true)}
+  end
+
+  def handle_event("search", %{"query" => query}, socket) do
+    {:noreply,
+     socket
+     |> assign(:query, query)
+     |> assign(:results, [])
+     |> assign(:loading, false)}
+  end
+
+  @impl true
+  def handle_info({:search, query}, socket) do
+    results = Snippets.search(query)
+
+    {:noreply,
+     socket
+     |> assign(:results, results)
+     |> assign(:loading, false)}
+  end
+end
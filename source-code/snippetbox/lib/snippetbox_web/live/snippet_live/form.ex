@@ -0,0 +1,57 @@
+
+defmodule SnippetboxWeb.SnippetLive.Form do
+  use SnippetboxWeb, :live_view
+
+  alias Snippetbox.Snippets
+  alias Snippetbox.Snippets.Snippet
+
+  @impl true
+  def mount(_params, _session, socket) do
+    changeset = Snippets.change_snippet(%Snippet{})
+
+    {:ok,
+     socket
+     |> assign(:changeset, changeset)
+     |> assign(:check_errors, false)}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <.form
+      for={@changeset}
+      phx-change="validate"
+      phx-submit="save"
+    >
+      <.input field={@form[:title]} label="Title" phx-debounce="300" />
+      <.input field={@form[:content]} type="textarea" label="Content" phx-debounce="500" />
+
+      <.button phx-disable-with="Saving...">Save</.button>
+    </.form>
+    """
+  end
+
+  @impl true
+  def handle_event("validate", %{"snippet" => params}, socket) do
+    changeset =
+      %Snippet{}
+      |> Snippets.change_snippet(params)
+      |> Map.put(:action, :validate)
+
+    {:noreply, assign(socket, :changeset, changeset)}
+  end
+
+  @impl true
+  def handle_event("save", %{"snippet" => params}, socket) do
+    case Snippets.create_snippet(params) do
+      {:ok, snippet} ->
+        {:noreply,
+         socket
+         |> put_flash(:info, "Snippet created!")
+         |> push_navigate(to: ~p"/snippets/#{snippet}")}
+
+      {:error, changeset} ->
+        {:noreply, assign(socket, :changeset, changeset)}
+    end
+  end
+end
@@ -0,0 +1,101 @@
+
+defmodule SnippetboxWeb.SnippetLive.FormComponent do
+  use SnippetboxWeb, :live_component
+
+  alias Snippetbox.Snippets
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div>
+      <.header>
+        <%= @title %>
+        <:subtitle>Manage snippet details</:subtitle>
+      </.header>
+
+      <.simple_form
+        for={@form}
+        id="snippet-form"
+        phx-target={@myself}
+        phx-change="validate"
+        phx-submit="save"
+      >
+        <.input field={@form[:title]} type="text" label="Title" />
+        <.input field={@form[:content]} type="textarea" label="Content" />
+        <.input
+          field={@form[:language]}
+          type="select"
+          label="Language"
+          prompt="Select language"
+          options={~w(elixir javascript python ruby go rust)}
+        />
+        <.input field={@form[:public]} type="checkbox" label="Public" />
+
+        <:actions>
+          <.button phx-disable-with="Saving...">Save Snippet</.button>
+        </:actions>
+      </.simple_form>
+    </div>
+    """
+  end
+
+  @impl true
+  def update(%{snippet: snippet} = assigns, socket) do
+    changeset = Snippets.change_snippet(snippet)
+
+    {:ok,
+     socket
+     |> assign(assigns)
+     |> assign_form(changeset)}
+  end
+
+  @impl true
+  def handle_event("validate", %{"snippet" => snippet_params}, socket) do
+    changeset =
+      socket.assigns.snippet
+      |> Snippets.change_snippet(snippet_params)
+      |> Map.put(:action, :validate)
+
+    {:noreply, assign_form(socket, changeset)}
+  end
+
+  def handle_event("save", %{"snippet" => snippet_params}, socket) do
+    save_snippet(socket, socket.assigns.action, snippet_params)
+  end
+
+  defp save_snippet(socket, :edit, snippet_params) do
+    case Snippets.update_snippet(socket.assigns.snippet, snippet_params) do
+      {:ok, snippet} ->
+        notify_parent({:saved, snippet})
+
+        {:noreply,
+         socket
+         |> put_flash(:info, "Snippet updated successfully")
+         |> push_patch(to: socket.assigns.patch)}
+
+      {:error, %Ecto.Changeset{} = changeset} ->
+        {:noreply, assign_form(socket, changeset)}
+    end
+  end
+
+  defp save_snippet(socket, :new, snippet_params) do
+    case Snippets.create_snippet(snippet_params) do
+      {:ok, snippet} ->
+        notify_parent({:saved, snippet})
+
+        {:noreply,
+         socket
+         |> put_flash(:info, "Snippet created successfully")
+         |> push_patch(to: socket.assigns.patch)}
+
+      {:error, %Ecto.Changeset{} = changeset} ->
+        {:noreply, assign_form(socket, changeset)}
+    end
+  end
+
+  defp assign_form(socket, %Ecto.Changeset{} = changeset) do
+    assign(socket, :form, to_form(changeset))
+  end
+
+  defp notify_parent(msg), do: send(self(), {__MODULE__, msg})
+end
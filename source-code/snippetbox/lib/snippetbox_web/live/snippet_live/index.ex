@@ -0,0 +1,30 @@
+
+defmodule SnippetboxWeb.SnippetLive.Index do
+  use SnippetboxWeb, :live_view
+
+  alias Snippetbox.Snippets
+
+  @impl true
+  def mount(_params, _session, socket) do
+    if connected?(socket) do
+      Snippets.subscribe()
+    end
+
+    {:ok, stream(socket, :snippets, Snippets.list_snippets())}
+  end
+
+  @impl true
+  def handle_info({:snippet_created, snippet}, socket) do
+    {:noreply, stream_insert(socket, :snippets, snippet, at: 0)}
+  end
+
+  @impl true
+  def handle_info({:snippet_updated, snippet}, socket) do
+    {:noreply, stream_insert(socket, :snippets, snippet)}
+  end
+
+  @impl true
+  def handle_info({:snippet_deleted, snippet}, socket) do
+    {:noreply, stream_delete(socket, :snippets, snippet)}
+  end
+end
@@ -0,0 +1,72 @@
+
+defmodule SnippetboxWeb.SnippetLive.Show do
+  use SnippetboxWeb, :live_view
+
+  alias Snippetbox.Snippets
+  alias SnippetboxWeb.Presence
+
+  @impl true
+  def mount(%{"id" => id}, _session, socket) do
+    snippet = Snippets.get_snippet!(id)
+    topic = "snippet:#{id}"
+
+    if connected?(socket) do
+      # Subscribe to presence changes
+      Phoenix.PubSub.subscribe(Snippetbox.PubSub, topic)
+
+      # Track this user's presence
+      Presence.track(self(), topic, socket.assigns.current_user.id, %{
+        name: socket.assigns.current_user.name,
+        joined_at: DateTime.utc_now()
+      })
+    end
+
+    presences = Presence.list(topic)
+
+    {:ok,
+     socket
+     |> assign(:snippet, snippet)
+     |> assign(:presences, presences)}
+  end
+
+  @impl true
+  def render(assigns) do
+    ~H"""
+    <div>
+      <.header>
+        <%= @snippet.title %>
+        <:subtitle>
+          <span class="flex items-center gap-2">
+            <span class="inline-block w-2 h-2 bg-green-500 rounded-full"></span>
+            <%= map_size(@presences) %> viewing
+          </span>
+        </:subtitle>
+      </.header>
+
+      <div class="mt-4 flex -space-x-2">
+        <%= for {_user_id, %{metas: [meta | _]}} <- @presences do %>
+          <div
+            class="w-8 h-8 rounded-full bg-blue-500 text-white flex items-center justify-center text-sm border-2 border-white"
+            title={meta.name}
+          >
+            <%= String.first(meta.name) %>
+          </div>
+        <% end %>
+      </div>
+
+      <pre class="mt-6 bg-gray-100 p-4 rounded-lg overflow-auto">
+        <code><%= @snippet.content %></code>
+      </pre>
+    </div>
+    """
+  end
+
+  @impl true
+  def handle_info(%Phoenix.Socket.Broadcast{event: "presence_diff", payload: diff}, socket) do
+    presences =
+      socket.assigns.presences
+      |> Presence.sync_diff(diff)
+
+    {:noreply, assign(socket, :presences, presences)}
+  end
+end
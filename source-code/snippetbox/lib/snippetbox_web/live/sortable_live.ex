@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.SortableLive do
+  use SnippetboxWeb, :live_view
+
+  # Requirements:
+  # - Drag items to reorder
+  # - Persist order to database
+  # - Optimistic updates
+  # - Handle errors gracefully
+end
@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.UploadLive do
+  use SnippetboxWeb, :live_view
+
+  # Implement:
+  # 1. File upload configuration (accept .ex, .exs, .txt)
+  # 2. Preview showing file content
+  # 3. Syntax highlighting for code files
+  # 4. Error handling for invalid files
+end
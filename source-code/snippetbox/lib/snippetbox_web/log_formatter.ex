@@ -0,0 +1,20 @@
+
+defmodule SnippetboxWeb.LogFormatter do
+  def format(level, message, timestamp, metadata) do
+    %{
+      timestamp: format_timestamp(timestamp),
+      level: level,
+      message: IO.iodata_to_binary(message),
+      metadata: Map.new(metadata)
+    }
+    |> Jason.encode!()
+    |> Kernel.<>("\n")
+  rescue
+    _ -> "#{inspect({level, message, metadata})}\n"
+  end
+
+  defp format_timestamp({date, {hour, min, sec, _ms}}) do
+    NaiveDateTime.from_erl!({date, {hour, min, sec}})
+    |> NaiveDateTime.to_iso8601()
+  end
+end
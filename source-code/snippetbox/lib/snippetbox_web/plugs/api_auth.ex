@@ -0,0 +1,9 @@
+
+defmodule SnippetboxWeb.Plugs.APIAuth do
+  # Implement:
+  # - Extract token from Authorization header
+  # - Validate token format (Bearer scheme)
+  # - Verify token signature
+  # - Load user from token
+  # - Handle expiration
+end
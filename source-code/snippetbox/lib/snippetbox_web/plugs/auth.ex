@@ -0,0 +1,22 @@
+
+defmodule SnippetboxWeb.Plugs.Auth do
+  import Plug.Conn
+  alias Snippetbox.Accounts
+
+  def fetch_current_user(conn, _opts) do
+    user_token = get_session(conn, :user_token)
+    user = user_token && Accounts.get_user_by_session_token(user_token)
+    assign(conn, :current_user, user)
+  end
+
+  def require_authenticated_user(conn, _opts) do
+    if conn.assigns[:current_user] do
+      conn
+    else
+      conn
+      |> Phoenix.Controller.put_flash(:error, "You must log in to access this page.")
+      |> Phoenix.Controller.redirect(to: "/login")
+      |> halt()
+    end
+  end
+end
@@ -0,0 +1,38 @@
+
+defmodule SnippetboxWeb.Plugs.Authorize do
+  import Plug.Conn
+  import Phoenix.Controller
+
+  @doc """
+  Requires user to have specific role.
+  """
+  def require_role(conn, roles) when is_list(roles) do
+    user = conn.assigns[:current_user]
+
+    if user && user.role in roles do
+      conn
+    else
+      conn
+      |> put_status(:forbidden)
+      |> put_view(SnippetboxWeb.ErrorHTML)
+      |> render("403.html")
+      |> halt()
+    end
+  end
+
+  def require_role(conn, role), do: require_role(conn, [role])
+
+  @doc """
+  Requires admin role.
+  """
+  def require_admin(conn, _opts) do
+    require_role(conn, [:admin])
+  end
+
+  @doc """
+  Requires moderator or admin role.
+  """
+  def require_moderator(conn, _opts) do
+    require_role(conn, [:admin, :moderator])
+  end
+end
@@ -0,0 +1,35 @@
+
+defmodule SnippetboxWeb.Plugs.CORS do
+  import Plug.Conn
+
+  @allowed_origins Application.compile_env(:snippetbox, :cors_origins, ["*"])
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    origin = get_req_header(conn, "origin") |> List.first()
+
+    if allowed_origin?(origin) do
+      conn
+      |> put_resp_header("access-control-allow-origin", origin || "*")
+      |> put_resp_header("access-control-allow-methods", "GET, POST, PUT, DELETE, OPTIONS")
+      |> put_resp_header("access-control-allow-headers", "content-type, authorization")
+      |> put_resp_header("access-control-max-age", "86400")
+      |> handle_preflight()
+    else
+      conn
+    end
+  end
+
+  defp allowed_origin?(nil), do: false
+  defp allowed_origin?(origin) do
+    "*" in @allowed_origins || origin in @allowed_origins
+  end
+
+  defp handle_preflight(%{method: "OPTIONS"} = conn) do
+    conn
+    |> send_resp(204, "")
+    |> halt()
+  end
+  defp handle_preflight(conn), do: conn
+end
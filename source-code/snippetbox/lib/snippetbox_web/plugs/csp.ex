@@ -0,0 +1,23 @@
+
+defmodule SnippetboxWeb.Plugs.CSP do
+  import Plug.Conn
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    put_resp_header(conn, "content-security-policy", csp_policy())
+  end
+
+  defp csp_policy do
+    [
+      "default-src 'self'",
+      "script-src 'self'",           # No inline scripts
+      "style-src 'self' 'unsafe-inline'",  # Allow inline styles
+      "img-src 'self' data: https:",
+      "font-src 'self'",
+      "connect-src 'self' wss:",
+      "frame-ancestors 'none'"
+    ]
+    |> Enum.join("; ")
+  end
+end
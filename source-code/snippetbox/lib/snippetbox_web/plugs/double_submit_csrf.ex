@@ -0,0 +1,47 @@
+
+defmodule SnippetboxWeb.Plugs.DoubleSubmitCSRF do
+  import Plug.Conn
+
+  @cookie_name "_csrf_double"
+  @header_name "x-csrf-token"
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    if safe_method?(conn.method) do
+      ensure_token_cookie(conn)
+    else
+      validate_token(conn)
+    end
+  end
+
+  defp safe_method?(method) when method in ["GET", "HEAD", "OPTIONS"], do: true
+  defp safe_method?(_), do: false
+
+  defp ensure_token_cookie(conn) do
+    if conn.cookies[@cookie_name] do
+      conn
+    else
+      token = generate_token()
+      put_resp_cookie(conn, @cookie_name, token, http_only: false)
+    end
+  end
+
+  defp validate_token(conn) do
+    cookie_token = conn.cookies[@cookie_name]
+    header_token = get_req_header(conn, @header_name) |> List.first()
+
+    if cookie_token && cookie_token == header_token do
+      conn
+    else
+      conn
+      |> put_status(:forbidden)
+      |> Phoenix.Controller.json(%{error: "Invalid CSRF token"})
+      |> halt()
+    end
+  end
+
+  defp generate_token do
+    :crypto.strong_rand_bytes(32) |> Base.url_encode64()
+  end
+end
@@ -0,0 +1,26 @@
+
+defmodule SnippetboxWeb.Plugs.ForceSSL do
+  import Plug.Conn
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    if secure?(conn) do
+      conn
+    else
+      conn
+      |> put_resp_header("location", redirect_url(conn))
+      |> send_resp(301, "")
+      |> halt()
+    end
+  end
+
+  defp secure?(conn) do
+    conn.scheme == :https ||
+      get_req_header(conn, "x-forwarded-proto") == ["https"]
+  end
+
+  defp redirect_url(conn) do
+    "https://#{conn.host}#{conn.request_path}"
+  end
+end
@@ -0,0 +1,47 @@
+
+defmodule SnippetboxWeb.Plugs.Locale do
+  @behaviour Plug
+  import Plug.Conn
+
+  @locales ~w(en es fr de ja)
+  @default_locale "en"
+
+  @impl true
+  def init(opts) do
+    Keyword.get(opts, :default, @default_locale)
+  end
+
+  @impl true
+  def call(conn, default) do
+    locale = fetch_locale(conn, default)
+    Gettext.put_locale(SnippetboxWeb.Gettext, locale)
+    assign(conn, :locale, locale)
+  end
+
+  defp fetch_locale(conn, default) do
+    # Check query param first
+    conn.params["locale"]
+    # Then session
+    |> check_or(&get_session(conn, :locale))
+    # Then Accept-Language header
+    |> check_or(&parse_accept_language(conn))
+    # Default
+    |> check_or(fn -> default end)
+    # Validate
+    |> validate_locale(default)
+  end
+
+  defp check_or(nil, func), do: func.()
+  defp check_or(value, _), do: value
+
+  defp parse_accept_language(conn) do
+    case get_req_header(conn, "accept-language") do
+      [header | _] -> header |> String.split(",") |> hd() |> String.slice(0, 2)
+      _ -> nil
+    end
+  end
+
+  defp validate_locale(locale, default) do
+    if locale in @locales, do: locale, else: default
+  end
+end
@@ -0,0 +1,26 @@
+
+defmodule SnippetboxWeb.Plugs.LoggerMetadata do
+  @behaviour Plug
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    Logger.metadata(
+      request_id: conn.assigns[:request_id],
+      remote_ip: format_ip(conn.remote_ip),
+      user_agent: get_user_agent(conn)
+    )
+
+    conn
+  end
+
+  defp format_ip({a, b, c, d}), do: "#{a}.#{b}.#{c}.#{d}"
+  defp format_ip(ip), do: inspect(ip)
+
+  defp get_user_agent(conn) do
+    case Plug.Conn.get_req_header(conn, "user-agent") do
+      [ua | _] -> ua
+      _ -> "unknown"
+    end
+  end
+end
@@ -0,0 +1,35 @@
+
+defmodule SnippetboxWeb.Plugs.Maintenance do
+  @behaviour Plug
+  import Plug.Conn
+  import Phoenix.Controller
+
+  @impl true
+  def init(opts) do
+    %{
+      enabled: Keyword.get(opts, :enabled, false),
+      allowed_ips: Keyword.get(opts, :allowed_ips, []),
+      message: Keyword.get(opts, :message, "We're performing maintenance. Please try again later.")
+    }
+  end
+
+  @impl true
+  def call(conn, %{enabled: false}), do: conn
+
+  def call(conn, opts) do
+    if allowed?(conn, opts) do
+      conn
+    else
+      conn
+      |> put_status(:service_unavailable)
+      |> put_view(SnippetboxWeb.ErrorHTML)
+      |> render("503.html", message: opts.message)
+      |> halt()
+    end
+  end
+
+  defp allowed?(conn, %{allowed_ips: ips}) do
+    ip = to_string(:inet.ntoa(conn.remote_ip))
+    ip in ips
+  end
+end
@@ -0,0 +1,43 @@
+
+defmodule SnippetboxWeb.Plugs.Preferences do
+  import Plug.Conn
+
+  @defaults %{
+    "theme" => "light",
+    "language" => "en",
+    "timezone" => "UTC",
+    "items_per_page" => "20"
+  }
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    preferences =
+      @defaults
+      |> Enum.map(fn {key, default} ->
+        {key, conn.cookies["pref_#{key}"] || default}
+      end)
+      |> Map.new()
+
+    assign(conn, :preferences, preferences)
+  end
+end
+
+# Controller to update preferences
+defmodule SnippetboxWeb.PreferencesController do
+  use SnippetboxWeb, :controller
+
+  def update(conn, %{"preferences" => prefs}) do
+    conn =
+      Enum.reduce(prefs, conn, fn {key, value}, conn ->
+        put_resp_cookie(conn, "pref_#{key}", value,
+          max_age: 60 * 60 * 24 * 365,
+          http_only: true
+        )
+      end)
+
+    conn
+    |> put_flash(:info, "Preferences saved!")
+    |> redirect(to: ~p"/settings")
+  end
+end
@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.Plugs.RateLimit do
+  import Plug.Conn
+
+  # Implement rate limiting:
+  # - 100 requests per minute per IP
+  # - Return 429 Too Many Requests when exceeded
+  # - Include Retry-After header
+  # - Use ETS for storage
+end
@@ -0,0 +1,28 @@
+
+defmodule SnippetboxWeb.Plugs.RateLimiter do
+  import Plug.Conn
+
+  @max_requests 100
+  @window_ms 60_000
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    key = rate_limit_key(conn)
+
+    case ExRated.check_rate(key, @window_ms, @max_requests) do
+      {:ok, _count} ->
+        conn
+      {:error, _limit} ->
+        conn
+        |> put_status(:too_many_requests)
+        |> Phoenix.Controller.json(%{error: "Rate limit exceeded"})
+        |> halt()
+    end
+  end
+
+  defp rate_limit_key(conn) do
+    ip = conn.remote_ip |> :inet.ntoa() |> to_string()
+    "rate_limit:#{ip}"
+  end
+end
@@ -0,0 +1,12 @@
+
+defmodule SnippetboxWeb.Redirect do
+  @behaviour Plug
+
+  def init(opts), do: opts
+
+  def call(conn, opts) do
+    conn
+    |> Phoenix.Controller.redirect(to: opts[:to])
+    |> Plug.Conn.halt()
+  end
+end
@@ -0,0 +1,25 @@
+
+defmodule SnippetboxWeb.Plugs.RequestLogger do
+  require Logger
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    start = System.monotonic_time()
+
+    Plug.Conn.register_before_send(conn, fn conn ->
+      stop = System.monotonic_time()
+      duration = System.convert_time_unit(stop - start, :native, :millisecond)
+
+      Logger.info("Request completed",
+        method: conn.method,
+        path: conn.request_path,
+        status: conn.status,
+        duration_ms: duration,
+        user_id: get_in(conn.assigns, [:current_user, :id])
+      )
+
+      conn
+    end)
+  end
+end
@@ -0,0 +1,12 @@
+
+defmodule SnippetboxWeb.Plugs.RequestTimer do
+  import Plug.Conn
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    # 1. Record start time
+    # 2. Register callback to run before response is sent
+    # 3. Calculate duration and add X-Request-Time header
+  end
+end
@@ -0,0 +1,11 @@
+
+defmodule SnippetboxWeb.Plugs.RequireScope do
+  # Implement:
+  # - Check if token has required scopes
+  # - Support multiple scope requirements (any/all)
+  # - Return 403 with missing scopes info
+
+  # Usage:
+  # plug RequireScope, scopes: ["snippets:read"]
+  # plug RequireScope, scopes: ["snippets:write", "snippets:delete"], match: :any
+end
@@ -0,0 +1,33 @@
+
+defmodule SnippetboxWeb.Plugs.ResourceAuth do
+  import Plug.Conn
+  import Phoenix.Controller
+
+  @doc """
+  Loads resource and checks ownership.
+  """
+  def authorize_snippet(conn, _opts) do
+    snippet_id = conn.params["id"]
+    user = conn.assigns.current_user
+
+    case Snippetbox.Snippets.get_snippet(snippet_id) do
+      nil ->
+        conn
+        |> put_status(:not_found)
+        |> put_view(SnippetboxWeb.ErrorHTML)
+        |> render("404.html")
+        |> halt()
+
+      snippet ->
+        if snippet.user_id == user.id || user.role == :admin do
+          assign(conn, :snippet, snippet)
+        else
+          conn
+          |> put_status(:forbidden)
+          |> put_view(SnippetboxWeb.ErrorHTML)
+          |> render("403.html")
+          |> halt()
+        end
+    end
+  end
+end
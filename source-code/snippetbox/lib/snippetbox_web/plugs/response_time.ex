@@ -0,0 +1,19 @@
+
+defmodule SnippetboxWeb.Plugs.ResponseTime do
+  @behaviour Plug
+  import Plug.Conn
+
+  @impl true
+  def init(opts), do: Keyword.get(opts, :header, "x-response-time")
+
+  @impl true
+  def call(conn, header) do
+    start = System.monotonic_time()
+
+    register_before_send(conn, fn conn ->
+      stop = System.monotonic_time()
+      diff = System.convert_time_unit(stop - start, :native, :millisecond)
+      put_resp_header(conn, header, "#{diff}ms")
+    end)
+  end
+end
@@ -0,0 +1,49 @@
+
+defmodule SnippetboxWeb.Plugs.SecurityHeaders do
+  import Plug.Conn
+
+  @env Mix.env()
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    conn
+    |> put_csp_header()
+    |> put_common_headers()
+  end
+
+  defp put_csp_header(conn) do
+    csp = if @env == :dev, do: dev_csp(), else: prod_csp(conn)
+    put_resp_header(conn, "content-security-policy", csp)
+  end
+
+  defp dev_csp do
+    # More permissive for development
+    [
+      "default-src 'self' 'unsafe-inline' 'unsafe-eval'",
+      "connect-src 'self' ws://localhost:* wss://localhost:*",
+      "img-src 'self' data: blob:"
+    ]
+    |> Enum.join("; ")
+  end
+
+  defp prod_csp(conn) do
+    [
+      "default-src 'self'",
+      "script-src 'self'",
+      "style-src 'self' 'unsafe-inline'",
+      "img-src 'self' data: https:",
+      "connect-src 'self' wss://#{conn.host}",
+      "frame-ancestors 'none'",
+      "upgrade-insecure-requests"
+    ]
+    |> Enum.join("; ")
+  end
+
+  defp put_common_headers(conn) do
+    conn
+    |> put_resp_header("x-frame-options", "DENY")
+    |> put_resp_header("x-content-type-options", "nosniff")
+    |> put_resp_header("referrer-policy", "strict-origin-when-cross-origin")
+  end
+end
@@ -0,0 +1,11 @@
+
+defmodule SnippetboxWeb.Plugs.Theme do
+  import Plug.Conn
+
+  def init(opts), do: opts
+
+  def call(conn, _opts) do
+    theme = conn.cookies["theme"] || "light"
+    assign(conn, :theme, theme)
+  end
+end
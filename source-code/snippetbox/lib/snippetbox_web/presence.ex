@@ -0,0 +1,6 @@
+
+defmodule SnippetboxWeb.Presence do
+  use Phoenix.Presence,
+    otp_app: :snippetbox,
+    pubsub_server: Snippetbox.PubSub
+end
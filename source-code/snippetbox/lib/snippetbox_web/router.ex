@@ -0,0 +1,6 @@
+
+# Create routes for:
+# GET    /snippets/:snippet_id/comments          -> index
+# GET    /snippets/:snippet_id/comments/:id      -> show
+# POST   /snippets/:snippet_id/comments          -> create
+# DELETE /snippets/:snippet_id/comments/:id      -> delete
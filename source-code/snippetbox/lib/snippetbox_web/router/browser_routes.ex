@@ -0,0 +1,14 @@
+
+defmodule SnippetboxWeb.Router.BrowserRoutes do
+  defmacro browser_routes do
+    quote do
+      scope "/", SnippetboxWeb do
+        pipe_through :browser
+
+        get "/", PageController, :home
+        resources "/snippets", SnippetController
+        # ... more routes
+      end
+    end
+  end
+end
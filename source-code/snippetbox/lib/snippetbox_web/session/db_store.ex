@@ -0,0 +1,15 @@
+
+defmodule SnippetboxWeb.Session.DBStore do
+  @behaviour Plug.Session.Store
+
+  # Implement:
+  # - init/1
+  # - get/3
+  # - put/4
+  # - delete/3
+
+  # Sessions stored in sessions table with:
+  # - id (UUID)
+  # - data (binary/JSON)
+  # - expires_at (datetime)
+end
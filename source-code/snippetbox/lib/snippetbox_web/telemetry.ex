@@ -0,0 +1,87 @@
+
+defmodule SnippetboxWeb.Telemetry do
+  use Supervisor
+  import Telemetry.Metrics
+
+  def start_link(arg) do
+    Supervisor.start_link(__MODULE__, arg, name: __MODULE__)
+  end
+
+  @impl true
+  def init(_arg) do
+    children = [
+      {:telemetry_poller, measurements: periodic_measurements(), period: 10_000}
+    ]
+
+    Supervisor.init(children, strategy: :one_for_one)
+  end
+
+  def metrics do
+    [
+      # Phoenix Metrics
+      summary("phoenix.endpoint.start.system_time",
+        unit: {:native, :millisecond}
+      ),
+      summary("phoenix.endpoint.stop.duration",
+        unit: {:native, :millisecond}
+      ),
+      summary("phoenix.router_dispatch.stop.duration",
+        tags: [:route],
+        unit: {:native, :millisecond}
+      ),
+
+      # LiveView Metrics
+      summary("phoenix.live_view.mount.stop.duration",
+        unit: {:native, :millisecond},
+        tags: [:view]
+      ),
+      summary("phoenix.live_view.handle_event.stop.duration",
+        unit: {:native, :millisecond},
+        tags: [:view, :event]
+      ),
+
+      # Database Metrics
+      summary("snippetbox.repo.query.total_time",
+        unit: {:native, :millisecond},
+        description: "Total query time"
+      ),
+      summary("snippetbox.repo.query.decode_time",
+        unit: {:native, :millisecond}
+      ),
+      summary("snippetbox.repo.query.queue_time",
+        unit: {:native, :millisecond}
+      ),
+      counter("snippetbox.repo.query.count"),
+
+      # VM Metrics
+      summary("vm.memory.total", unit: {:byte, :megabyte}),
+      summary("vm.total_run_queue_lengths.total"),
+      summary("vm.total_run_queue_lengths.cpu"),
+      summary("vm.total_run_queue_lengths.io"),
+
+      # Custom Business Metrics
+      counter("snippetbox.snippets.created.count"),
+      counter("snippetbox.users.registered.count"),
+      summary("snippetbox.snippets.view_duration",
+        unit: {:native, :millisecond}
+      )
+    ]
+  end
+
+  defp periodic_measurements do
+    [
+      {__MODULE__, :measure_users_online, []},
+      {__MODULE__, :measure_snippets_count, []}
+    ]
+  end
+
+  def measure_users_online do
+    count = SnippetboxWeb.Presence.list("users:online") |> map_size()
+    :telemetry.execute([:snippetbox, :users, :online], %{count: count}, %{})
+  end
+
+  def measure_snippets_count do
+    count = Snippetbox.Snippets.count_snippets()
+    :telemetry.execute([:snippetbox, :snippets, :total], %{count: count}, %{})
+  end
+end
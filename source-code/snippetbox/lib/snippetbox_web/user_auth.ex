@@ -0,0 +1,16 @@
+
+@doc """
+Requires the user to have confirmed their email.
+"""
+def require_confirmed_user(conn, _opts) do
+  user = conn.assigns[:current_user]
+
+  if user && user.confirmed_at do
+    conn
+  else
+    conn
+    |> put_flash(:error, "Please confirm your email to continue.")
+    |> redirect(to: ~p"/confirm")
+    |> halt()
+  end
+end
@@ -0,0 +1,11 @@
+{:sentry, "~> 10.0"}
+
+# config/runtime.exs
+config :sentry,
+  dsn: System.get_env("SENTRY_DSN"),
+  environment_name: config_env(),
+  enable_source_code_context: true,
+  root_source_code_paths: [File.cwd!()]
+
+# lib/snippetbox_web/endpoint.ex
+use Sentry.PlugCapture
@@ -0,0 +1,12 @@
+
+def change do
+  create table(:snippets) do
+    add :title, :string, null: false
+    add :content, :text, null: false
+    add :user_id, references(:users, on_delete: :delete_all), null: false
+
+    timestamps()
+  end
+
+  create index(:snippets, [:user_id])
+end
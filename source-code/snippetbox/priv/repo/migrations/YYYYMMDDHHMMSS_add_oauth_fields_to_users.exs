@@ -0,0 +1,15 @@
+
+defmodule Snippetbox.Repo.Migrations.AddOauthFieldsToUsers do
+  use Ecto.Migration
+
+  def change do
+    alter table(:users) do
+      add :provider, :string
+      add :provider_id, :string
+      add :avatar_url, :string
+      modify :hashed_password, :string, null: true  # OAuth users don't have passwords
+    end
+
+    create unique_index(:users, [:provider, :provider_id])
+  end
+end
@@ -0,0 +1,16 @@
+
+defmodule Snippetbox.Repo.Migrations.CreateUsers do
+  use Ecto.Migration
+
+  def change do
+    create table(:users) do
+      add :email, :citext, null: false
+      add :name, :string, null: false
+      add :hashed_password, :string, null: false
+
+      timestamps()
+    end
+
+    create unique_index(:users, [:email])
+  end
+end
@@ -0,0 +1,18 @@
+
+defmodule Snippetbox.Repo.Migrations.CreateUsersTokens do
+  use Ecto.Migration
+
+  def change do
+    create table(:users_tokens) do
+      add :user_id, references(:users, on_delete: :delete_all), null: false
+      add :token, :binary, null: false
+      add :context, :string, null: false
+      add :sent_to, :string
+
+      timestamps(updated_at: false)
+    end
+
+    create index(:users_tokens, [:user_id])
+    create unique_index(:users_tokens, [:context, :token])
+  end
+end
@@ -0,0 +1,47 @@
+
+defmodule Snippetbox.Accounts.UserTest do
+  use Snippetbox.DataCase
+
+  alias Snippetbox.Accounts.User
+
+  describe "registration_changeset/2" do
+    test "hashes password" do
+      changeset = User.registration_changeset(%User{}, %{
+        email: "test@example.com",
+        name: "Test",
+        password: "ValidPass123!"
+      })
+
+      assert changeset.valid?
+      assert changeset.changes.hashed_password
+      refute Map.has_key?(changeset.changes, :password)
+    end
+
+    test "requires minimum password length" do
+      changeset = User.registration_changeset(%User{}, %{
+        email: "test@example.com",
+        password: "short"
+      })
+
+      refute changeset.valid?
+      assert "should be at least 12 character(s)" in errors_on(changeset).password
+    end
+  end
+
+  describe "valid_password?/2" do
+    test "validates correct password" do
+      user = user_fixture()
+      assert User.valid_password?(user, "ValidPass123!")
+    end
+
+    test "rejects incorrect password" do
+      user = user_fixture()
+      refute User.valid_password?(user, "wrong")
+    end
+
+    test "rejects empty password" do
+      user = user_fixture()
+      refute User.valid_password?(user, "")
+    end
+  end
+end
@@ -0,0 +1,38 @@
+
+defmodule Snippetbox.AccountsTest do
+  use Snippetbox.DataCase, async: true
+
+  alias Snippetbox.Accounts
+  alias Snippetbox.Accounts.User
+
+  import Snippetbox.AccountsFixtures
+
+  # Shared setup for all tests in describe block
+  describe "users" do
+    setup do
+      %{user: user_fixture()}
+    end
+
+    test "get_user!/1 returns the user", %{user: user} do
+      assert Accounts.get_user!(user.id) == user
+    end
+
+    test "get_user_by_email/1 returns the user", %{user: user} do
+      assert Accounts.get_user_by_email(user.email) == user
+    end
+  end
+
+  # Setup that returns multiple values
+  describe "user relationships" do
+    setup do
+      user = user_fixture()
+      snippet = Snippetbox.SnippetsFixtures.snippet_fixture(%{user_id: user.id})
+      %{user: user, snippet: snippet}
+    end
+
+    test "user has snippets", %{user: user, snippet: snippet} do
+      user = Accounts.get_user_with_snippets(user.id)
+      assert snippet in user.snippets
+    end
+  end
+end
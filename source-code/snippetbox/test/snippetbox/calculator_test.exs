@@ -0,0 +1,30 @@
+
+defmodule Snippetbox.CalculatorTest do
+  use ExUnit.Case, async: true
+
+  alias Snippetbox.Calculator
+
+  describe "add/2" do
+    test "adds two positive numbers" do
+      assert Calculator.add(1, 2) == 3
+    end
+
+    test "adds negative numbers" do
+      assert Calculator.add(-1, -2) == -3
+    end
+
+    test "adds zero" do
+      assert Calculator.add(5, 0) == 5
+    end
+  end
+
+  describe "divide/2" do
+    test "divides two numbers" do
+      assert Calculator.divide(10, 2) == {:ok, 5.0}
+    end
+
+    test "returns error for division by zero" do
+      assert Calculator.divide(10, 0) == {:error, :division_by_zero}
+    end
+  end
+end
@@ -0,0 +1,56 @@
+
+defmodule Snippetbox.Helpers.StringHelperTest do
+  use ExUnit.Case, async: true
+
+  alias Snippetbox.Helpers.StringHelper
+
+  describe "truncate/2" do
+    test "truncates long strings" do
+      assert StringHelper.truncate("Hello World", 5) == "Hello..."
+    end
+
+    test "leaves short strings unchanged" do
+      assert StringHelper.truncate("Hi", 10) == "Hi"
+    end
+
+    test "handles empty string" do
+      assert StringHelper.truncate("", 5) == ""
+    end
+
+    test "handles exact length" do
+      assert StringHelper.truncate("Hello", 5) == "Hello"
+    end
+  end
+
+  describe "slugify/1" do
+    test "converts to lowercase" do
+      assert StringHelper.slugify("Hello World") == "hello-world"
+    end
+
+    test "replaces spaces with hyphens" do
+      assert StringHelper.slugify("foo bar baz") == "foo-bar-baz"
+    end
+
+    test "removes special characters" do
+      assert StringHelper.slugify("Hello! @World#") == "hello-world"
+    end
+
+    test "handles multiple spaces" do
+      assert StringHelper.slugify("foo   bar") == "foo-bar"
+    end
+  end
+
+  describe "word_count/1" do
+    test "counts words" do
+      assert StringHelper.word_count("Hello World") == 2
+    end
+
+    test "handles empty string" do
+      assert StringHelper.word_count("") == 0
+    end
+
+    test "handles multiple spaces" do
+      assert StringHelper.word_count("foo   bar   baz") == 3
+    end
+  end
+end
@@ -0,0 +1,39 @@
+
+defmodule Snippetbox.ParserTest do
+  use ExUnit.Case, async: true
+
+  alias Snippetbox.Parser
+
+  describe "parse_language/1" do
+    test "parses elixir files" do
+      assert {:ok, "elixir"} = Parser.parse_language("example.ex")
+      assert {:ok, "elixir"} = Parser.parse_language("example.exs")
+    end
+
+    test "parses javascript files" do
+      assert {:ok, "javascript"} = Parser.parse_language("app.js")
+      assert {:ok, "javascript"} = Parser.parse_language("component.jsx")
+    end
+
+    test "returns error for unknown extensions" do
+      assert {:error, :unknown_language} = Parser.parse_language("file.xyz")
+    end
+  end
+
+  describe "parse_metadata/1" do
+    test "extracts title from first line comment" do
+      code = """
+      # Title: My Snippet
+      defmodule Test do
+      end
+      """
+
+      assert %{title: "My Snippet"} = Parser.parse_metadata(code)
+    end
+
+    test "returns nil for missing metadata" do
+      code = "defmodule Test do\nend"
+      assert %{title: nil} = Parser.parse_metadata(code)
+    end
+  end
+end
@@ -0,0 +1,29 @@
+
+defmodule Snippetbox.RepoTest do
+  use Snippetbox.DataCase, async: false
+
+  describe "migrations" do
+    test "all migrations run successfully" do
+      # This test verifies that the test database was migrated
+      assert {:ok, _} = Ecto.Adapters.SQL.query(Repo, "SELECT 1")
+    end
+
+    test "snippets table exists with expected columns" do
+      {:ok, result} = Ecto.Adapters.SQL.query(Repo, """
+        SELECT column_name, data_type
+        FROM information_schema.columns
+        WHERE table_name = 'snippets'
+        ORDER BY ordinal_position
+      """)
+
+      columns = Enum.map(result.rows, fn [name, _type] -> name end)
+
+      assert "id" in columns
+      assert "title" in columns
+      assert "content" in columns
+      assert "language" in columns
+      assert "inserted_at" in columns
+      assert "updated_at" in columns
+    end
+  end
+end
@@ -0,0 +1,52 @@
+
+defmodule Snippetbox.Snippets.SnippetTest do
+  use Snippetbox.DataCase, async: true
+
+  alias Snippetbox.Snippets.Snippet
+
+  describe "changeset/2" do
+    test "valid changeset" do
+      attrs = %{title: "Test", content: "code", language: "elixir"}
+      changeset = Snippet.changeset(%Snippet{}, attrs)
+
+      assert changeset.valid?
+    end
+
+    test "requires title" do
+      changeset = Snippet.changeset(%Snippet{}, %{})
+      refute changeset.valid?
+      assert "can't be blank" in errors_on(changeset).title
+    end
+
+    test "requires content" do
+      changeset = Snippet.changeset(%Snippet{}, %{title: "Test"})
+      refute changeset.valid?
+      assert "can't be blank" in errors_on(changeset).content
+    end
+
+    test "validates language inclusion" do
+      attrs = %{title: "Test", content: "code", language: "invalid"}
+      changeset = Snippet.changeset(%Snippet{}, attrs)
+
+      refute changeset.valid?
+      assert "is invalid" in errors_on(changeset).language
+    end
+
+    test "trims whitespace from title" do
+      attrs = %{title: "  Test  ", content: "code", language: "elixir"}
+      changeset = Snippet.changeset(%Snippet{}, attrs)
+
+      assert get_change(changeset, :title) == "Test"
+    end
+  end
+
+  describe "expiration_changeset/2" do
+    test "sets expires_at" do
+      snippet = %Snippet{id: 1}
+      changeset = Snippet.expiration_changeset(snippet, %{expires_in: 3600})
+
+      expires_at = get_change(changeset, :expires_at)
+      assert DateTime.diff(expires_at, DateTime.utc_now()) >= 3599
+    end
+  end
+end
@@ -0,0 +1,90 @@
+
+defmodule Snippetbox.SnippetsTest do
+  use Snippetbox.DataCase, async: true
+
+  alias Snippetbox.Snippets
+  alias Snippetbox.Snippets.Snippet
+
+  import Snippetbox.SnippetsFixtures
+  import Snippetbox.AccountsFixtures
+
+  describe "list_snippets/1" do
+    test "returns empty list when no snippets" do
+      assert Snippets.list_snippets() == []
+    end
+
+    test "returns all snippets" do
+      snippet1 = snippet_fixture()
+      snippet2 = snippet_fixture()
+
+      assert Snippets.list_snippets() == [snippet1, snippet2]
+    end
+
+    test "filters by language" do
+      elixir = snippet_fixture(%{language: "elixir"})
+      _python = snippet_fixture(%{language: "python"})
+
+      assert Snippets.list_snippets(language: "elixir") == [elixir]
+    end
+
+    test "filters by user" do
+      user1 = user_fixture()
+      user2 = user_fixture()
+
+      snippet1 = snippet_fixture(%{user_id: user1.id})
+      _snippet2 = snippet_fixture(%{user_id: user2.id})
+
+      assert Snippets.list_snippets(user_id: user1.id) == [snippet1]
+    end
+
+    test "orders by inserted_at desc" do
+      old = snippet_fixture()
+      # Ensure different timestamp
+      Process.sleep(10)
+      new = snippet_fixture()
+
+      [first, second] = Snippets.list_snippets(order_by: [desc: :inserted_at])
+      assert first.id == new.id
+      assert second.id == old.id
+    end
+
+    test "paginates results" do
+      for _ <- 1..15, do: snippet_fixture()
+
+      page1 = Snippets.list_snippets(page: 1, per_page: 10)
+      page2 = Snippets.list_snippets(page: 2, per_page: 10)
+
+      assert length(page1) == 10
+      assert length(page2) == 5
+    end
+  end
+
+  describe "search_snippets/1" do
+    test "searches title" do
+      match = snippet_fixture(%{title: "Elixir GenServer"})
+      _nomatch = snippet_fixture(%{title: "Python Script"})
+
+      assert Snippets.search_snippets("genserver") == [match]
+    end
+
+    test "searches content" do
+      match = snippet_fixture(%{content: "defmodule GenServer do"})
+      _nomatch = snippet_fixture(%{content: "print('hello')"})
+
+      assert Snippets.search_snippets("defmodule") == [match]
+    end
+
+    test "is case insensitive" do
+      snippet = snippet_fixture(%{title: "UPPERCASE TITLE"})
+
+      assert Snippets.search_snippets("uppercase") == [snippet]
+      assert Snippets.search_snippets("UPPERCASE") == [snippet]
+    end
+
+    test "returns empty for no match" do
+      snippet_fixture()
+
+      assert Snippets.search_snippets("nonexistent") == []
+    end
+  end
+end
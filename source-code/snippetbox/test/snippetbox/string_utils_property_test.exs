@@ -0,0 +1,10 @@
+
+defmodule Snippetbox.StringUtilsPropertyTest do
+  use ExUnit.Case
+  use ExUnitProperties
+
+  # Test properties:
+  # 1. slugify always produces valid slugs
+  # 2. truncate never exceeds max length
+  # 3. split and join are inverse operations
+end
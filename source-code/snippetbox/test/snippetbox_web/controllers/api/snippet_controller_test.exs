@@ -0,0 +1,89 @@
+
+defmodule SnippetboxWeb.Api.SnippetControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  import Snippetbox.SnippetsFixtures
+
+  @create_attrs %{title: "API Snippet", content: "code", language: "elixir"}
+  @invalid_attrs %{title: nil}
+
+  setup %{conn: conn} do
+    {:ok, conn: put_req_header(conn, "accept", "application/json")}
+  end
+
+  describe "index" do
+    test "lists all snippets", %{conn: conn} do
+      conn = get(conn, ~p"/api/snippets")
+      assert json_response(conn, 200)["data"] == []
+    end
+
+    test "returns snippets", %{conn: conn} do
+      snippet = snippet_fixture()
+      conn = get(conn, ~p"/api/snippets")
+
+      assert [%{"id" => id, "title" => title}] = json_response(conn, 200)["data"]
+      assert id == snippet.id
+      assert title == snippet.title
+    end
+  end
+
+  describe "show" do
+    test "returns snippet", %{conn: conn} do
+      snippet = snippet_fixture()
+      conn = get(conn, ~p"/api/snippets/#{snippet}")
+
+      assert %{
+               "id" => id,
+               "title" => title,
+               "content" => content,
+               "language" => language
+             } = json_response(conn, 200)["data"]
+
+      assert id == snippet.id
+      assert title == snippet.title
+      assert content == snippet.content
+      assert language == snippet.language
+    end
+
+    test "returns 404 for invalid id", %{conn: conn} do
+      conn = get(conn, ~p"/api/snippets/999999")
+      assert json_response(conn, 404)["errors"] != %{}
+    end
+  end
+
+  describe "create" do
+    setup [:authenticate_api]
+
+    test "creates snippet when data is valid", %{conn: conn} do
+      conn = post(conn, ~p"/api/snippets", snippet: @create_attrs)
+
+      assert %{"id" => id} = json_response(conn, 201)["data"]
+
+      conn = get(conn, ~p"/api/snippets/#{id}")
+      assert json_response(conn, 200)["data"]["title"] == "API Snippet"
+    end
+
+    test "returns errors when data is invalid", %{conn: conn} do
+      conn = post(conn, ~p"/api/snippets", snippet: @invalid_attrs)
+      assert json_response(conn, 422)["errors"] != %{}
+    end
+  end
+
+  describe "create (unauthenticated)" do
+    test "returns 401", %{conn: conn} do
+      conn = post(conn, ~p"/api/snippets", snippet: @create_attrs)
+      assert json_response(conn, 401)["errors"]["detail"] =~ "unauthenticated"
+    end
+  end
+
+  defp authenticate_api(%{conn: conn}) do
+    user = Snippetbox.AccountsFixtures.user_fixture()
+    token = Snippetbox.Accounts.generate_api_token(user)
+
+    conn =
+      conn
+      |> put_req_header("authorization", "Bearer #{token}")
+
+    %{conn: conn, user: user}
+  end
+end
@@ -0,0 +1,69 @@
+
+defmodule SnippetboxWeb.AuthControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  describe "callback/2" do
+    test "creates new user from OAuth", %{conn: conn} do
+      auth = %Ueberauth.Auth{
+        provider: :github,
+        uid: "12345",
+        info: %Ueberauth.Auth.Info{
+          email: "oauth@example.com",
+          name: "OAuth User",
+          image: "https://example.com/avatar.png"
+        }
+      }
+
+      conn =
+        conn
+        |> assign(:ueberauth_auth, auth)
+        |> get(~p"/auth/github/callback")
+
+      assert redirected_to(conn) == ~p"/"
+      assert get_session(conn, :user_token)
+
+      user = Snippetbox.Accounts.get_user_by_email("oauth@example.com")
+      assert user.provider == "github"
+      assert user.provider_id == "12345"
+    end
+
+    test "logs in existing OAuth user", %{conn: conn} do
+      {:ok, existing} = Snippetbox.Accounts.create_oauth_user(%{
+        email: "existing@example.com",
+        name: "Existing",
+        provider: "github",
+        provider_id: "12345"
+      })
+
+      auth = %Ueberauth.Auth{
+        provider: :github,
+        uid: "12345",
+        info: %Ueberauth.Auth.Info{
+          email: "existing@example.com",
+          name: "Updated Name"
+        }
+      }
+
+      conn =
+        conn
+        |> assign(:ueberauth_auth, auth)
+        |> get(~p"/auth/github/callback")
+
+      assert redirected_to(conn) == ~p"/"
+
+      # Name should be updated
+      user = Snippetbox.Accounts.get_user!(existing.id)
+      assert user.name == "Updated Name"
+    end
+
+    test "handles OAuth failure", %{conn: conn} do
+      conn =
+        conn
+        |> assign(:ueberauth_failure, %Ueberauth.Failure{})
+        |> get(~p"/auth/github/callback")
+
+      assert redirected_to(conn) == ~p"/login"
+      assert Phoenix.Flash.get(conn.assigns.flash, :error) =~ "Failed"
+    end
+  end
+end
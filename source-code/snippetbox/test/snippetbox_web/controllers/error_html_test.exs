@@ -0,0 +1,31 @@
+
+defmodule SnippetboxWeb.ErrorHTMLTest do
+  use SnippetboxWeb.ConnCase, async: true
+
+  import Phoenix.Template
+
+  test "renders 404.html" do
+    html = render_to_string(SnippetboxWeb.ErrorHTML, "404", "html", [])
+    assert html =~ "404"
+    assert html =~ "Page Not Found"
+    assert html =~ "Back to Home"
+  end
+
+  test "renders 500.html" do
+    html = render_to_string(SnippetboxWeb.ErrorHTML, "500", "html", [])
+    assert html =~ "500"
+    assert html =~ "Something Went Wrong"
+  end
+
+  test "renders 403.html" do
+    html = render_to_string(SnippetboxWeb.ErrorHTML, "403", "html", [])
+    assert html =~ "403"
+    assert html =~ "Access Denied"
+  end
+
+  test "renders 401.html" do
+    html = render_to_string(SnippetboxWeb.ErrorHTML, "401", "html", [])
+    assert html =~ "401"
+    assert html =~ "Login Required"
+  end
+end
@@ -0,0 +1,15 @@
+
+defmodule SnippetboxWeb.ErrorIntegrationTest do
+  use SnippetboxWeb.ConnCase
+
+  test "404 for non-existent route", %{conn: conn} do
+    conn = get(conn, "/this-route-does-not-exist")
+    assert html_response(conn, 404) =~ "Page Not Found"
+  end
+
+  test "404 for non-existent snippet", %{conn: conn} do
+    assert_error_sent 404, fn ->
+      get(conn, ~p"/snippets/999999999")
+    end
+  end
+end
@@ -0,0 +1,10 @@
+
+defmodule SnippetboxWeb.GithubImportControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  # Test the import flow:
+  # 1. Mock GitHub API responses
+  # 2. Test success case
+  # 3. Test API error handling
+  # 4. Test rate limiting
+end
@@ -0,0 +1,22 @@
+
+defmodule SnippetboxWeb.PageControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  test "GET /", %{conn: conn} do
+    conn = get(conn, ~p"/")
+
+    assert html_response(conn, 200) =~ "Welcome to Snippetbox"
+  end
+
+  test "GET /about", %{conn: conn} do
+    conn = get(conn, ~p"/about")
+
+    assert html_response(conn, 200) =~ "About"
+  end
+
+  test "returns 404 for unknown routes", %{conn: conn} do
+    assert_raise Phoenix.Router.NoRouteError, fn ->
+      get(conn, "/nonexistent")
+    end
+  end
+end
@@ -0,0 +1,133 @@
+
+defmodule SnippetboxWeb.SnippetControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  import Snippetbox.SnippetsFixtures
+  import Snippetbox.AccountsFixtures
+
+  @create_attrs %{title: "Test Snippet", content: "code", language: "elixir"}
+  @update_attrs %{title: "Updated Snippet"}
+  @invalid_attrs %{title: nil, content: nil}
+
+  describe "index" do
+    test "lists all snippets", %{conn: conn} do
+      conn = get(conn, ~p"/snippets")
+      assert html_response(conn, 200) =~ "Snippets"
+    end
+
+    test "displays snippets", %{conn: conn} do
+      snippet = snippet_fixture()
+      conn = get(conn, ~p"/snippets")
+
+      assert html_response(conn, 200) =~ snippet.title
+    end
+  end
+
+  describe "show" do
+    test "shows snippet", %{conn: conn} do
+      snippet = snippet_fixture()
+      conn = get(conn, ~p"/snippets/#{snippet}")
+
+      assert html_response(conn, 200) =~ snippet.title
+    end
+
+    test "returns 404 for invalid id", %{conn: conn} do
+      assert_raise Ecto.NoResultsError, fn ->
+        get(conn, ~p"/snippets/999999")
+      end
+    end
+  end
+
+  describe "new" do
+    setup [:register_and_log_in_user]
+
+    test "renders form", %{conn: conn} do
+      conn = get(conn, ~p"/snippets/new")
+      assert html_response(conn, 200) =~ "New Snippet"
+    end
+  end
+
+  describe "new (unauthenticated)" do
+    test "redirects to login", %{conn: conn} do
+      conn = get(conn, ~p"/snippets/new")
+
+      assert redirected_to(conn) == ~p"/login"
+    end
+  end
+
+  describe "create" do
+    setup [:register_and_log_in_user]
+
+    test "redirects to show when data is valid", %{conn: conn} do
+      conn = post(conn, ~p"/snippets", snippet: @create_attrs)
+
+      assert %{id: id} = redirected_params(conn)
+      assert redirected_to(conn) == ~p"/snippets/#{id}"
+
+      conn = get(conn, ~p"/snippets/#{id}")
+      assert html_response(conn, 200) =~ @create_attrs.title
+    end
+
+    test "renders errors when data is invalid", %{conn: conn} do
+      conn = post(conn, ~p"/snippets", snippet: @invalid_attrs)
+
+      assert html_response(conn, 200) =~ "can&#39;t be blank"
+    end
+  end
+
+  describe "edit" do
+    setup [:register_and_log_in_user]
+
+    test "renders form for editing chosen snippet", %{conn: conn, user: user} do
+      snippet = snippet_fixture(%{user_id: user.id})
+      conn = get(conn, ~p"/snippets/#{snippet}/edit")
+
+      assert html_response(conn, 200) =~ "Edit Snippet"
+    end
+
+    test "returns 403 for other user's snippet", %{conn: conn} do
+      other_user = user_fixture()
+      snippet = snippet_fixture(%{user_id: other_user.id})
+
+      conn = get(conn, ~p"/snippets/#{snippet}/edit")
+
+      assert response(conn, 403) =~ "Forbidden"
+    end
+  end
+
+  describe "update" do
+    setup [:register_and_log_in_user]
+
+    test "redirects when data is valid", %{conn: conn, user: user} do
+      snippet = snippet_fixture(%{user_id: user.id})
+      conn = put(conn, ~p"/snippets/#{snippet}", snippet: @update_attrs)
+
+      assert redirected_to(conn) == ~p"/snippets/#{snippet}"
+
+      conn = get(conn, ~p"/snippets/#{snippet}")
+      assert html_response(conn, 200) =~ "Updated Snippet"
+    end
+
+    test "renders errors when data is invalid", %{conn: conn, user: user} do
+      snippet = snippet_fixture(%{user_id: user.id})
+      conn = put(conn, ~p"/snippets/#{snippet}", snippet: @invalid_attrs)
+
+      assert html_response(conn, 200) =~ "can&#39;t be blank"
+    end
+  end
+
+  describe "delete" do
+    setup [:register_and_log_in_user]
+
+    test "deletes chosen snippet", %{conn: conn, user: user} do
+      snippet = snippet_fixture(%{user_id: user.id})
+      conn = delete(conn, ~p"/snippets/#{snippet}")
+
+      assert redirected_to(conn) == ~p"/snippets"
+
+      assert_raise Ecto.NoResultsError, fn ->
+        get(conn, ~p"/snippets/#{snippet}")
+      end
+    end
+  end
+end
@@ -0,0 +1,55 @@
+
+defmodule SnippetboxWeb.UserConfirmationControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  alias Snippetbox.Accounts
+  import Snippetbox.AccountsFixtures
+
+  setup do
+    %{user: user_fixture()}
+  end
+
+  describe "GET /confirm/:token" do
+    test "renders confirmation page", %{conn: conn, user: user} do
+      token = extract_user_token(fn url ->
+        Accounts.deliver_user_confirmation_instructions(user, fn t -> url <> t end)
+      end)
+
+      conn = get(conn, ~p"/confirm/#{token}")
+      assert html_response(conn, 200) =~ "Confirm Account"
+    end
+  end
+
+  describe "PUT /confirm/:token" do
+    test "confirms the user", %{conn: conn, user: user} do
+      token = extract_user_token(fn url ->
+        Accounts.deliver_user_confirmation_instructions(user, fn t -> url <> t end)
+      end)
+
+      conn = put(conn, ~p"/confirm/#{token}")
+
+      assert redirected_to(conn) == ~p"/login"
+      assert Phoenix.Flash.get(conn.assigns.flash, :info) =~ "confirmed"
+      assert Accounts.get_user!(user.id).confirmed_at
+    end
+
+    test "does not confirm with invalid token", %{conn: conn} do
+      conn = put(conn, ~p"/confirm/invalid")
+
+      assert redirected_to(conn) == ~p"/"
+      assert Phoenix.Flash.get(conn.assigns.flash, :error) =~ "invalid"
+    end
+
+    test "does not confirm already confirmed user", %{conn: conn, user: user} do
+      Accounts.confirm_user(extract_token(user))
+
+      token = extract_user_token(fn url ->
+        Accounts.deliver_user_confirmation_instructions(user, fn t -> url <> t end)
+      end)
+
+      # Second confirmation should fail gracefully
+      conn = put(conn, ~p"/confirm/#{token}")
+      assert redirected_to(conn) == ~p"/"
+    end
+  end
+end
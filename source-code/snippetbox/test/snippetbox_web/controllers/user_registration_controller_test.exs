@@ -0,0 +1,68 @@
+
+defmodule SnippetboxWeb.UserRegistrationControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  describe "GET /register" do
+    test "renders registration page", %{conn: conn} do
+      conn = get(conn, ~p"/register")
+      html = html_response(conn, 200)
+
+      assert html =~ "Create Account"
+      assert html =~ "Email"
+      assert html =~ "Password"
+    end
+
+    test "redirects if already logged in", %{conn: conn} do
+      conn = conn |> log_in_user(user_fixture()) |> get(~p"/register")
+      assert redirected_to(conn) == ~p"/"
+    end
+  end
+
+  describe "POST /register" do
+    test "creates account and logs in", %{conn: conn} do
+      email = unique_user_email()
+
+      conn =
+        post(conn, ~p"/register", %{
+          "user" => %{
+            "name" => "Test User",
+            "email" => email,
+            "password" => "ValidPass123!",
+            "password_confirmation" => "ValidPass123!"
+          }
+        })
+
+      assert get_session(conn, :user_token)
+      assert redirected_to(conn) == ~p"/"
+
+      # Verify user created
+      assert Snippetbox.Accounts.get_user_by_email(email)
+    end
+
+    test "renders errors for invalid data", %{conn: conn} do
+      conn =
+        post(conn, ~p"/register", %{
+          "user" => %{
+            "email" => "invalid",
+            "password" => "short"
+          }
+        })
+
+      html = html_response(conn, 200)
+      assert html =~ "must be a valid email"
+      assert html =~ "should be at least 12 character"
+    end
+
+    test "renders errors for duplicate email", %{conn: conn} do
+      user = user_fixture()
+
+      conn =
+        post(conn, ~p"/register", %{
+          "user" => valid_user_attributes(email: user.email)
+        })
+
+      html = html_response(conn, 200)
+      assert html =~ "has already been taken"
+    end
+  end
+end
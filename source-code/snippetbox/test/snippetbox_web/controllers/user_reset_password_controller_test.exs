@@ -0,0 +1,87 @@
+
+defmodule SnippetboxWeb.UserResetPasswordControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  alias Snippetbox.Accounts
+  import Snippetbox.AccountsFixtures
+
+  setup do
+    %{user: user_fixture()}
+  end
+
+  describe "POST /forgot-password" do
+    test "sends reset email for valid email", %{conn: conn, user: user} do
+      conn =
+        post(conn, ~p"/forgot-password", %{
+          "user" => %{"email" => user.email}
+        })
+
+      assert redirected_to(conn) == ~p"/"
+      assert Phoenix.Flash.get(conn.assigns.flash, :info) =~ "If your email"
+      assert Repo.get_by!(UserToken, user_id: user.id)
+    end
+
+    test "does not reveal if email exists", %{conn: conn} do
+      conn =
+        post(conn, ~p"/forgot-password", %{
+          "user" => %{"email" => "unknown@example.com"}
+        })
+
+      assert redirected_to(conn) == ~p"/"
+      assert Phoenix.Flash.get(conn.assigns.flash, :info) =~ "If your email"
+    end
+  end
+
+  describe "GET /reset-password/:token" do
+    test "renders reset password page", %{conn: conn, user: user} do
+      token = extract_reset_token(user)
+      conn = get(conn, ~p"/reset-password/#{token}")
+
+      assert html_response(conn, 200) =~ "Reset Password"
+    end
+
+    test "redirects for invalid token", %{conn: conn} do
+      conn = get(conn, ~p"/reset-password/invalid")
+
+      assert redirected_to(conn) == ~p"/"
+      assert Phoenix.Flash.get(conn.assigns.flash, :error) =~ "invalid"
+    end
+  end
+
+  describe "PUT /reset-password/:token" do
+    test "resets password for valid token", %{conn: conn, user: user} do
+      token = extract_reset_token(user)
+
+      conn =
+        put(conn, ~p"/reset-password/#{token}", %{
+          "user" => %{
+            "password" => "NewValidPass123!",
+            "password_confirmation" => "NewValidPass123!"
+          }
+        })
+
+      assert redirected_to(conn) == ~p"/login"
+      assert Accounts.get_user_by_email_and_password(user.email, "NewValidPass123!")
+    end
+
+    test "invalidates token after use", %{conn: conn, user: user} do
+      token = extract_reset_token(user)
+
+      put(conn, ~p"/reset-password/#{token}", %{
+        "user" => %{
+          "password" => "NewValidPass123!",
+          "password_confirmation" => "NewValidPass123!"
+        }
+      })
+
+      # Token should no longer work
+      conn = get(conn, ~p"/reset-password/#{token}")
+      assert redirected_to(conn) == ~p"/"
+    end
+  end
+
+  defp extract_reset_token(user) do
+    {token, _} = Accounts.UserToken.build_email_token(user, "reset_password")
+    token
+  end
+end
@@ -0,0 +1,77 @@
+
+defmodule SnippetboxWeb.UserSessionControllerTest do
+  use SnippetboxWeb.ConnCase
+
+  import Snippetbox.AccountsFixtures
+
+  setup do
+    %{user: user_fixture()}
+  end
+
+  describe "new" do
+    test "renders login page", %{conn: conn} do
+      conn = get(conn, ~p"/login")
+      assert html_response(conn, 200) =~ "Log In"
+    end
+
+    test "redirects if already logged in", %{conn: conn, user: user} do
+      conn = conn |> log_in_user(user) |> get(~p"/login")
+      assert redirected_to(conn) == ~p"/"
+    end
+  end
+
+  describe "create" do
+    test "logs in the user with valid credentials", %{conn: conn, user: user} do
+      conn =
+        post(conn, ~p"/login", %{
+          "user" => %{"email" => user.email, "password" => valid_user_password()}
+        })
+
+      assert get_session(conn, :user_token)
+      assert redirected_to(conn) == ~p"/"
+
+      # Now do a request with the session
+      conn = get(conn, ~p"/")
+      response = html_response(conn, 200)
+      assert response =~ user.email
+    end
+
+    test "logs in with remember me", %{conn: conn, user: user} do
+      conn =
+        post(conn, ~p"/login", %{
+          "user" => %{
+            "email" => user.email,
+            "password" => valid_user_password(),
+            "remember_me" => "true"
+          }
+        })
+
+      assert conn.resp_cookies["_snippetbox_web_user_remember_me"]
+    end
+
+    test "renders errors with invalid credentials", %{conn: conn} do
+      conn =
+        post(conn, ~p"/login", %{
+          "user" => %{"email" => "invalid@example.com", "password" => "invalid"}
+        })
+
+      response = html_response(conn, 200)
+      assert response =~ "Log In"
+      assert response =~ "Invalid email or password"
+    end
+  end
+
+  describe "delete" do
+    test "logs out the user", %{conn: conn, user: user} do
+      conn = conn |> log_in_user(user) |> delete(~p"/logout")
+
+      assert redirected_to(conn) == ~p"/"
+      refute get_session(conn, :user_token)
+    end
+
+    test "succeeds even if user not logged in", %{conn: conn} do
+      conn = delete(conn, ~p"/logout")
+      assert redirected_to(conn) == ~p"/"
+    end
+  end
+end
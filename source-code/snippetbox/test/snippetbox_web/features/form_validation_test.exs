@@ -0,0 +1,28 @@
+
+defmodule SnippetboxWeb.Features.FormValidationTest do
+  use SnippetboxWeb.FeatureCase
+
+  setup %{session: session} do
+    user = user_fixture()
+    session = login(session, user)
+    {:ok, session: session}
+  end
+
+  feature "real-time validation shows errors", %{session: session} do
+    session
+    |> visit("/snippets/new")
+    |> fill_in(Query.text_field("Title"), with: "")
+    |> click(Query.css("body"))  # Trigger blur
+    |> assert_has(Query.css(".phx-form-error", text: "can't be blank"))
+  end
+
+  feature "validation clears on valid input", %{session: session} do
+    session
+    |> visit("/snippets/new")
+    |> fill_in(Query.text_field("Title"), with: "")
+    |> click(Query.css("body"))
+    |> assert_has(Query.css(".phx-form-error"))
+    |> fill_in(Query.text_field("Title"), with: "Valid Title")
+    |> refute_has(Query.css(".phx-form-error"))
+  end
+end
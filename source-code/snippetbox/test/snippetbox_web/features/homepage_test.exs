@@ -0,0 +1,18 @@
+
+defmodule SnippetboxWeb.Features.HomepageTest do
+  use SnippetboxWeb.FeatureCase
+
+  feature "user visits homepage", %{session: session} do
+    session
+    |> visit("/")
+    |> assert_has(Query.css("h1", text: "Welcome to Snippetbox"))
+    |> assert_has(Query.link("Browse Snippets"))
+  end
+
+  feature "user can navigate to snippets", %{session: session} do
+    session
+    |> visit("/")
+    |> click(Query.link("Browse Snippets"))
+    |> assert_has(Query.css("h1", text: "Snippets"))
+  end
+end
@@ -0,0 +1,34 @@
+
+defmodule SnippetboxWeb.Features.JavaScriptTest do
+  use SnippetboxWeb.FeatureCase
+
+  feature "modal opens and closes", %{session: session} do
+    session
+    |> visit("/snippets")
+    |> click(Query.button("New Snippet"))
+    |> assert_has(Query.css("#snippet-modal", visible: true))
+    |> click(Query.css("[data-close-modal]"))
+    |> assert_has(Query.css("#snippet-modal", visible: false))
+  end
+
+  feature "dropdown menu works", %{session: session} do
+    user = user_fixture()
+
+    session
+    |> login(user)
+    |> visit("/")
+    |> click(Query.css("[data-dropdown-toggle]"))
+    |> assert_has(Query.css("[data-dropdown-menu]", visible: true))
+    |> click(Query.link("Profile"))
+    |> assert_has(Query.css("h1", text: "Profile"))
+  end
+
+  feature "copy to clipboard shows feedback", %{session: session} do
+    snippet = snippet_fixture()
+
+    session
+    |> visit("/snippets/#{snippet.id}")
+    |> click(Query.button("Copy"))
+    |> assert_has(Query.text("Copied!"))
+  end
+end
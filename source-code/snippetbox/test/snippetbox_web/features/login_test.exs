@@ -0,0 +1,42 @@
+
+defmodule SnippetboxWeb.Features.LoginTest do
+  use SnippetboxWeb.FeatureCase
+
+  feature "user can login", %{session: session} do
+    user = user_fixture()
+
+    session
+    |> visit("/login")
+    |> fill_in(Query.text_field("Email"), with: user.email)
+    |> fill_in(Query.text_field("Password"), with: valid_user_password())
+    |> click(Query.button("Log in"))
+    |> assert_has(Query.css(".alert-info", text: "Welcome back"))
+    |> assert_has(Query.text(user.email))
+  end
+
+  feature "shows error for invalid credentials", %{session: session} do
+    session
+    |> visit("/login")
+    |> fill_in(Query.text_field("Email"), with: "wrong@example.com")
+    |> fill_in(Query.text_field("Password"), with: "wrongpassword")
+    |> click(Query.button("Log in"))
+    |> assert_has(Query.css(".alert-error", text: "Invalid email or password"))
+  end
+
+  feature "user can logout", %{session: session} do
+    user = user_fixture()
+
+    session
+    |> login(user)
+    |> click(Query.link("Log out"))
+    |> assert_has(Query.link("Log in"))
+  end
+
+  defp login(session, user) do
+    session
+    |> visit("/login")
+    |> fill_in(Query.text_field("Email"), with: user.email)
+    |> fill_in(Query.text_field("Password"), with: valid_user_password())
+    |> click(Query.button("Log in"))
+  end
+end
@@ -0,0 +1,23 @@
+
+defmodule SnippetboxWeb.Features.RegistrationTest do
+  use SnippetboxWeb.FeatureCase
+
+  feature "user can register", %{session: session} do
+    session
+    |> visit("/register")
+    |> fill_in(Query.text_field("Email"), with: "new@example.com")
+    |> fill_in(Query.text_field("Password"), with: "password123456")
+    |> click(Query.button("Create Account"))
+    |> assert_has(Query.css(".alert-info", text: "Account created"))
+  end
+
+  feature "shows validation errors", %{session: session} do
+    session
+    |> visit("/register")
+    |> fill_in(Query.text_field("Email"), with: "invalid")
+    |> fill_in(Query.text_field("Password"), with: "short")
+    |> click(Query.button("Create Account"))
+    |> assert_has(Query.css(".phx-form-error", text: "must have the @ sign"))
+    |> assert_has(Query.css(".phx-form-error", text: "should be at least"))
+  end
+end
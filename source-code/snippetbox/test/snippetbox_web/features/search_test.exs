@@ -0,0 +1,24 @@
+
+defmodule SnippetboxWeb.Features.SearchTest do
+  use SnippetboxWeb.FeatureCase
+
+  feature "user searches snippets", %{session: session} do
+    snippet_fixture(%{title: "Elixir GenServer Example"})
+    snippet_fixture(%{title: "Python Script"})
+
+    session
+    |> visit("/snippets")
+    |> fill_in(Query.text_field("Search"), with: "GenServer")
+    |> click(Query.button("Search"))
+    |> assert_has(Query.text("Elixir GenServer Example"))
+    |> refute_has(Query.text("Python Script"))
+  end
+
+  feature "search with no results", %{session: session} do
+    session
+    |> visit("/snippets")
+    |> fill_in(Query.text_field("Search"), with: "nonexistent")
+    |> click(Query.button("Search"))
+    |> assert_has(Query.text("No snippets found"))
+  end
+end
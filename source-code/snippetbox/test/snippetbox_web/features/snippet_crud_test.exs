@@ -0,0 +1,60 @@
+
+defmodule SnippetboxWeb.Features.SnippetCRUDTest do
+  use SnippetboxWeb.FeatureCase
+
+  setup %{session: session} do
+    user = user_fixture()
+    session = login(session, user)
+    {:ok, session: session, user: user}
+  end
+
+  feature "user creates a snippet", %{session: session} do
+    session
+    |> visit("/snippets/new")
+    |> fill_in(Query.text_field("Title"), with: "My Test Snippet")
+    |> fill_in(Query.css("textarea[name='snippet[content]']"), with: "defmodule Test do\nend")
+    |> select(Query.select("Language"), option: "elixir")
+    |> click(Query.button("Save Snippet"))
+    |> assert_has(Query.css(".alert-info", text: "created"))
+    |> assert_has(Query.css("h1", text: "My Test Snippet"))
+  end
+
+  feature "user views a snippet", %{session: session, user: user} do
+    snippet = snippet_fixture(%{user_id: user.id, title: "View Test"})
+
+    session
+    |> visit("/snippets/#{snippet.id}")
+    |> assert_has(Query.css("h1", text: "View Test"))
+    |> assert_has(Query.css("code", text: snippet.content))
+  end
+
+  feature "user edits a snippet", %{session: session, user: user} do
+    snippet = snippet_fixture(%{user_id: user.id})
+
+    session
+    |> visit("/snippets/#{snippet.id}/edit")
+    |> clear(Query.text_field("Title"))
+    |> fill_in(Query.text_field("Title"), with: "Updated Title")
+    |> click(Query.button("Save Snippet"))
+    |> assert_has(Query.css(".alert-info", text: "updated"))
+    |> assert_has(Query.css("h1", text: "Updated Title"))
+  end
+
+  feature "user deletes a snippet", %{session: session, user: user} do
+    snippet = snippet_fixture(%{user_id: user.id, title: "Delete Me"})
+
+    session
+    |> visit("/snippets/#{snippet.id}")
+    |> accept_confirm(fn s -> click(s, Query.button("Delete")) end)
+    |> assert_has(Query.css(".alert-info", text: "deleted"))
+    |> refute_has(Query.text("Delete Me"))
+  end
+
+  defp login(session, user) do
+    session
+    |> visit("/login")
+    |> fill_in(Query.text_field("Email"), with: user.email)
+    |> fill_in(Query.text_field("Password"), with: valid_user_password())
+    |> click(Query.button("Log in"))
+  end
+end
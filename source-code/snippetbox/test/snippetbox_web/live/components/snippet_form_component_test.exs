@@ -0,0 +1,51 @@
+
+defmodule SnippetboxWeb.SnippetLive.FormComponentTest do
+  use SnippetboxWeb.ConnCase
+
+  import Phoenix.LiveViewTest
+  import Snippetbox.SnippetsFixtures
+
+  describe "new snippet" do
+    setup [:register_and_log_in_user]
+
+    test "renders form", %{conn: conn} do
+      {:ok, view, html} = live(conn, ~p"/snippets/new")
+
+      assert html =~ "New Snippet"
+      assert has_element?(view, "form#snippet-form")
+    end
+
+    test "saves new snippet", %{conn: conn} do
+      {:ok, view, _html} = live(conn, ~p"/snippets/new")
+
+      {:ok, conn} =
+        view
+        |> form("#snippet-form", snippet: %{
+          title: "Test Snippet",
+          content: "code",
+          language: "elixir"
+        })
+        |> render_submit()
+        |> follow_redirect(conn)
+
+      assert html_response(conn, 200) =~ "Snippet created"
+    end
+  end
+
+  describe "edit snippet" do
+    setup [:register_and_log_in_user]
+
+    test "updates snippet", %{conn: conn, user: user} do
+      snippet = snippet_fixture(%{user_id: user.id})
+      {:ok, view, _html} = live(conn, ~p"/snippets/#{snippet}/edit")
+
+      {:ok, conn} =
+        view
+        |> form("#snippet-form", snippet: %{title: "Updated"})
+        |> render_submit()
+        |> follow_redirect(conn)
+
+      assert html_response(conn, 200) =~ "Updated"
+    end
+  end
+end
@@ -0,0 +1,34 @@
+
+defmodule SnippetboxWeb.CounterLiveTest do
+  use SnippetboxWeb.ConnCase
+
+  import Phoenix.LiveViewTest
+
+  describe "counter" do
+    test "renders initial count", %{conn: conn} do
+      {:ok, view, html} = live(conn, ~p"/counter")
+
+      assert html =~ "0"
+    end
+
+    test "increments count", %{conn: conn} do
+      {:ok, view, _html} = live(conn, ~p"/counter")
+
+      assert view
+             |> element("button", "+")
+             |> render_click() =~ "1"
+    end
+
+    test "decrements count", %{conn: conn} do
+      {:ok, view, _html} = live(conn, ~p"/counter")
+
+      # First increment to 1
+      view |> element("button", "+") |> render_click()
+
+      # Then decrement
+      assert view
+             |> element("button", "-")
+             |> render_click() =~ "0"
+    end
+  end
+end
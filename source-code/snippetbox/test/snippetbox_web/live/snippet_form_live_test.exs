@@ -0,0 +1,13 @@
+
+defmodule SnippetboxWeb.SnippetFormLiveTest do
+  use SnippetboxWeb.ConnCase
+
+  import Phoenix.LiveViewTest
+
+  # Test:
+  # 1. Form rendering
+  # 2. Real-time validation
+  # 3. Successful submission
+  # 4. Error handling
+  # 5. Navigation after submit
+end
@@ -0,0 +1,53 @@
+
+defmodule SnippetboxWeb.Plugs.APIAuthTest do
+  use SnippetboxWeb.PlugCase, async: true
+  import Mox
+
+  alias SnippetboxWeb.Plugs.APIAuth
+
+  setup :verify_on_exit!
+
+  describe "fetch_api_user/2" do
+    test "authenticates valid token" do
+      user = %{id: 1, email: "test@example.com"}
+
+      # Mock token verification
+      expect(SnippetboxWeb.TokenMock, :verify, fn "valid-token" ->
+        {:ok, %{"sub" => user.id}}
+      end)
+
+      expect(Snippetbox.AccountsMock, :get_user, fn 1 -> user end)
+
+      conn =
+        build_conn(:get, "/api/test")
+        |> put_req_header("authorization", "Bearer valid-token")
+        |> APIAuth.fetch_api_user([])
+
+      refute conn.halted
+      assert conn.assigns.current_user == user
+    end
+
+    test "rejects invalid token" do
+      expect(SnippetboxWeb.TokenMock, :verify, fn "invalid-token" ->
+        {:error, :invalid}
+      end)
+
+      conn =
+        build_conn(:get, "/api/test")
+        |> put_req_header("authorization", "Bearer invalid-token")
+        |> APIAuth.fetch_api_user([])
+
+      assert conn.halted
+      assert conn.status == 401
+    end
+
+    test "rejects missing token" do
+      conn =
+        build_conn(:get, "/api/test")
+        |> APIAuth.fetch_api_user([])
+
+      assert conn.halted
+      assert conn.status == 401
+    end
+  end
+end
@@ -0,0 +1,68 @@
+
+defmodule SnippetboxWeb.Plugs.AuthTest do
+  use SnippetboxWeb.PlugCase, async: true
+
+  alias SnippetboxWeb.Plugs.Auth
+
+  describe "fetch_current_user/2" do
+    test "assigns nil when no user in session" do
+      conn = conn_with_session()
+      conn = Auth.fetch_current_user(conn, [])
+
+      assert conn.assigns.current_user == nil
+    end
+
+    test "assigns user when user_id in session" do
+      user = user_fixture()
+
+      conn =
+        conn_with_session()
+        |> put_session(:user_id, user.id)
+        |> Auth.fetch_current_user([])
+
+      assert conn.assigns.current_user.id == user.id
+    end
+
+    test "assigns nil when user_id is invalid" do
+      conn =
+        conn_with_session()
+        |> put_session(:user_id, -1)
+        |> Auth.fetch_current_user([])
+
+      assert conn.assigns.current_user == nil
+    end
+  end
+
+  describe "require_authenticated_user/2" do
+    test "continues when user is logged in" do
+      user = user_fixture()
+      conn = conn_with_user(user)
+
+      result = Auth.require_authenticated_user(conn, [])
+
+      refute result.halted
+    end
+
+    test "redirects when no user" do
+      conn =
+        conn_with_session()
+        |> assign(:current_user, nil)
+        |> Auth.require_authenticated_user([])
+
+      assert conn.halted
+      assert redirected_to(conn) == "/login"
+      assert Phoenix.Flash.get(conn.assigns.flash, :error) =~ "must log in"
+    end
+
+    test "stores return path for GET requests" do
+      conn =
+        conn_with_session()
+        |> Map.put(:method, "GET")
+        |> Map.put(:request_path, "/snippets/123")
+        |> assign(:current_user, nil)
+        |> Auth.require_authenticated_user([])
+
+      assert get_session(conn, :return_to) == "/snippets/123"
+    end
+  end
+end
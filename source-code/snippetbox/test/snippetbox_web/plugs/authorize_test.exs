@@ -0,0 +1,45 @@
+
+defmodule SnippetboxWeb.Plugs.AuthorizeTest do
+  use SnippetboxWeb.PlugCase, async: true
+
+  alias SnippetboxWeb.Plugs.Authorize
+
+  describe "require_role/2" do
+    test "allows user with matching role" do
+      user = %{id: 1, role: :admin}
+      conn = conn_with_user(user)
+
+      result = Authorize.require_role(conn, [:admin])
+
+      refute result.halted
+    end
+
+    test "allows user with one of multiple roles" do
+      user = %{id: 1, role: :moderator}
+      conn = conn_with_user(user)
+
+      result = Authorize.require_role(conn, [:admin, :moderator])
+
+      refute result.halted
+    end
+
+    test "blocks user without matching role" do
+      user = %{id: 1, role: :user}
+      conn = conn_with_user(user)
+
+      result = Authorize.require_role(conn, [:admin])
+
+      assert result.halted
+      assert result.status == 403
+    end
+
+    test "blocks when no user" do
+      conn = conn_with_session() |> assign(:current_user, nil)
+
+      result = Authorize.require_role(conn, [:admin])
+
+      assert result.halted
+      assert result.status == 403
+    end
+  end
+end
@@ -0,0 +1,43 @@
+
+defmodule SnippetboxWeb.Plugs.CORSTest do
+  use SnippetboxWeb.PlugCase, async: true
+
+  alias SnippetboxWeb.Plugs.CORS
+
+  describe "call/2" do
+    test "sets CORS headers for allowed origin" do
+      opts = CORS.init(origins: ["http://localhost:3000"])
+
+      conn =
+        build_conn(:get, "/api/test")
+        |> put_req_header("origin", "http://localhost:3000")
+        |> CORS.call(opts)
+
+      assert get_resp_header(conn, "access-control-allow-origin") == ["http://localhost:3000"]
+    end
+
+    test "does not set CORS headers for disallowed origin" do
+      opts = CORS.init(origins: ["http://localhost:3000"])
+
+      conn =
+        build_conn(:get, "/api/test")
+        |> put_req_header("origin", "http://evil.com")
+        |> CORS.call(opts)
+
+      assert get_resp_header(conn, "access-control-allow-origin") == []
+    end
+
+    test "handles preflight OPTIONS request" do
+      opts = CORS.init(origins: ["*"])
+
+      conn =
+        build_conn(:options, "/api/test")
+        |> put_req_header("origin", "http://localhost:3000")
+        |> CORS.call(opts)
+
+      assert conn.status == 204
+      assert conn.halted
+      assert get_resp_header(conn, "access-control-max-age") == ["86400"]
+    end
+  end
+end
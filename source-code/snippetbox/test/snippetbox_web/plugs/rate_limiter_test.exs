@@ -0,0 +1,47 @@
+
+defmodule SnippetboxWeb.Plugs.RateLimiterTest do
+  use SnippetboxWeb.PlugCase, async: false  # Not async due to shared state
+
+  alias SnippetboxWeb.Plugs.RateLimiter
+
+  setup do
+    # Reset rate limit state before each test
+    :ets.delete_all_objects(:rate_limits)
+    :ok
+  end
+
+  describe "call/2" do
+    test "allows requests within limit" do
+      opts = RateLimiter.init(max_requests: 5, window_ms: 60_000)
+
+      conn = build_conn(:get, "/api/test")
+      conn = RateLimiter.call(conn, opts)
+
+      refute conn.halted
+      assert get_resp_header(conn, "x-ratelimit-remaining") == ["4"]
+    end
+
+    test "blocks requests over limit" do
+      opts = RateLimiter.init(max_requests: 2, window_ms: 60_000)
+
+      # Make 3 requests
+      conn1 = build_conn(:get, "/api/test") |> RateLimiter.call(opts)
+      conn2 = build_conn(:get, "/api/test") |> RateLimiter.call(opts)
+      conn3 = build_conn(:get, "/api/test") |> RateLimiter.call(opts)
+
+      refute conn1.halted
+      refute conn2.halted
+      assert conn3.halted
+      assert conn3.status == 429
+    end
+
+    test "sets retry-after header when rate limited" do
+      opts = RateLimiter.init(max_requests: 1, window_ms: 60_000)
+
+      build_conn(:get, "/api/test") |> RateLimiter.call(opts)
+      conn = build_conn(:get, "/api/test") |> RateLimiter.call(opts)
+
+      assert get_resp_header(conn, "retry-after") == ["60"]
+    end
+  end
+end
@@ -0,0 +1,36 @@
+
+defmodule SnippetboxWeb.Plugs.RequestLoggerTest do
+  use SnippetboxWeb.PlugCase, async: true
+
+  import ExUnit.CaptureLog
+
+  alias SnippetboxWeb.Plugs.RequestLogger
+
+  describe "init/1" do
+    test "sets default log level to :info" do
+      opts = RequestLogger.init([])
+      assert opts.level == :info
+    end
+
+    test "accepts custom log level" do
+      opts = RequestLogger.init(level: :debug)
+      assert opts.level == :debug
+    end
+  end
+
+  describe "call/2" do
+    test "logs request after response is sent" do
+      opts = RequestLogger.init(level: :info)
+
+      log =
+        capture_log(fn ->
+          build_conn(:get, "/test")
+          |> RequestLogger.call(opts)
+          |> send_resp(200, "OK")
+        end)
+
+      assert log =~ "GET /test"
+      assert log =~ "200"
+    end
+  end
+end
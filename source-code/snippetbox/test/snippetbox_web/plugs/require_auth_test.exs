@@ -0,0 +1,36 @@
+
+defmodule SnippetboxWeb.Plugs.RequireAuthTest do
+  use SnippetboxWeb.ConnCase
+
+  alias SnippetboxWeb.Plugs.RequireAuth
+
+  describe "call/2" do
+    test "passes through authenticated user", %{conn: conn} do
+      user = Snippetbox.AccountsFixtures.user_fixture()
+      conn = conn |> log_in_user(user) |> RequireAuth.call([])
+
+      assert conn.assigns.current_user == user
+      refute conn.halted
+    end
+
+    test "redirects unauthenticated user", %{conn: conn} do
+      conn =
+        conn
+        |> fetch_flash()
+        |> RequireAuth.call([])
+
+      assert conn.halted
+      assert redirected_to(conn) == ~p"/login"
+    end
+
+    test "returns 401 for API requests", %{conn: conn} do
+      conn =
+        conn
+        |> put_req_header("accept", "application/json")
+        |> RequireAuth.call([])
+
+      assert conn.halted
+      assert json_response(conn, 401)["errors"]["detail"] =~ "unauthenticated"
+    end
+  end
+end
@@ -0,0 +1,35 @@
+
+defmodule SnippetboxWeb.Plugs.SecurityHeadersTest do
+  use SnippetboxWeb.ConnCase
+
+  describe "security headers" do
+    test "includes Content-Security-Policy", %{conn: conn} do
+      conn = get(conn, ~p"/")
+
+      csp = get_resp_header(conn, "content-security-policy") |> List.first()
+
+      assert csp =~ "default-src"
+      assert csp =~ "script-src"
+      assert csp =~ "frame-ancestors 'none'"
+    end
+
+    test "includes X-Frame-Options", %{conn: conn} do
+      conn = get(conn, ~p"/")
+
+      assert get_resp_header(conn, "x-frame-options") == ["DENY"]
+    end
+
+    test "includes X-Content-Type-Options", %{conn: conn} do
+      conn = get(conn, ~p"/")
+
+      assert get_resp_header(conn, "x-content-type-options") == ["nosniff"]
+    end
+
+    test "includes Referrer-Policy", %{conn: conn} do
+      conn = get(conn, ~p"/")
+
+      policy = get_resp_header(conn, "referrer-policy") |> List.first()
+      assert policy =~ "strict-origin"
+    end
+  end
+end
@@ -0,0 +1,54 @@
+
+describe "remember me" do
+  test "stores token in cookie when remember_me is true", %{conn: conn} do
+    user = user_fixture()
+
+    conn =
+      post(conn, ~p"/login", %{
+        "user" => %{
+          "email" => user.email,
+          "password" => valid_user_password(),
+          "remember_me" => "true"
+        }
+      })
+
+    assert conn.resp_cookies["_snippetbox_remember_me"]
+  end
+
+  test "does not store token when remember_me is false", %{conn: conn} do
+    user = user_fixture()
+
+    conn =
+      post(conn, ~p"/login", %{
+        "user" => %{
+          "email" => user.email,
+          "password" => valid_user_password()
+        }
+      })
+
+    refute conn.resp_cookies["_snippetbox_remember_me"]
+  end
+
+  test "restores session from remember me cookie", %{conn: conn} do
+    user = user_fixture()
+    token = Accounts.generate_user_session_token(user)
+
+    conn =
+      conn
+      |> put_req_cookie("_snippetbox_remember_me", token)
+      |> get(~p"/")
+
+    assert conn.assigns.current_user.id == user.id
+  end
+
+  test "clears remember me cookie on logout", %{conn: conn} do
+    user = user_fixture()
+
+    conn =
+      conn
+      |> log_in_user(user, %{"remember_me" => "true"})
+      |> delete(~p"/logout")
+
+    assert conn.resp_cookies["_snippetbox_remember_me"].max_age == 0
+  end
+end
@@ -0,0 +1,34 @@
+
+defmodule Snippetbox.TestAssertions do
+  import ExUnit.Assertions
+
+  def assert_valid_changeset(changeset) do
+    assert changeset.valid?, "Expected changeset to be valid, got errors: #{inspect(errors_on(changeset))}"
+  end
+
+  def assert_invalid_changeset(changeset) do
+    refute changeset.valid?, "Expected changeset to be invalid"
+  end
+
+  def assert_error_on(changeset, field, message) do
+    errors = errors_on(changeset)
+    assert message in Map.get(errors, field, []),
+           "Expected error '#{message}' on #{field}, got: #{inspect(errors)}"
+  end
+
+  defp errors_on(changeset) do
+    Ecto.Changeset.traverse_errors(changeset, fn {msg, opts} ->
+      Regex.replace(~r"%{(\w+)}", msg, fn _, key ->
+        opts |> Keyword.get(String.to_existing_atom(key), key) |> to_string()
+      end)
+    end)
+  end
+end
+
+# Usage
+import Snippetbox.TestAssertions
+
+test "validates email format" do
+  changeset = User.changeset(%User{}, %{email: "invalid"})
+  assert_error_on(changeset, :email, "must have the @ sign and no spaces")
+end
@@ -0,0 +1,19 @@
+
+defmodule SnippetboxWeb.ConnCase do
+  use ExUnit.CaseTemplate
+
+  using do
+    quote do
+      @endpoint SnippetboxWeb.Endpoint
+
+      use SnippetboxWeb, :verified_routes
+
+      import Plug.Conn
+      import Phoenix.ConnTest
+      import Phoenix.LiveViewTest
+      import SnippetboxWeb.ConnCase
+    end
+  end
+
+  # ... rest of setup
+end
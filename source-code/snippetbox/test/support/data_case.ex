@@ -0,0 +1,25 @@
+
+defmodule Snippetbox.DataCase do
+  use ExUnit.CaseTemplate
+
+  using do
+    quote do
+      alias Snippetbox.Repo
+
+      import Ecto
+      import Ecto.Changeset
+      import Ecto.Query
+      import Snippetbox.DataCase
+    end
+  end
+
+  setup tags do
+    Snippetbox.DataCase.setup_sandbox(tags)
+    :ok
+  end
+
+  def setup_sandbox(tags) do
+    pid = Ecto.Adapters.SQL.Sandbox.start_owner!(Snippetbox.Repo, shared: not tags[:async])
+    on_exit(fn -> Ecto.Adapters.SQL.Sandbox.stop_owner(pid) end)
+  end
+end
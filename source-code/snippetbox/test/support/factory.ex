@@ -0,0 +1,10 @@
+
+defmodule Snippetbox.Factory do
+  use ExMachina.Ecto, repo: Snippetbox.Repo
+
+  # Create factories for:
+  # - User (with traits: admin, confirmed, unconfirmed)
+  # - Snippet (with associations)
+  # - Comment
+  # - Tag
+end
@@ -0,0 +1,27 @@
+
+defmodule SnippetboxWeb.FeatureCase do
+  use ExUnit.CaseTemplate
+
+  using do
+    quote do
+      use Wallaby.Feature
+
+      alias SnippetboxWeb.Router.Helpers, as: Routes
+      import Snippetbox.AccountsFixtures
+      import Snippetbox.SnippetsFixtures
+    end
+  end
+
+  setup tags do
+    :ok = Ecto.Adapters.SQL.Sandbox.checkout(Snippetbox.Repo)
+
+    unless tags[:async] do
+      Ecto.Adapters.SQL.Sandbox.mode(Snippetbox.Repo, {:shared, self()})
+    end
+
+    metadata = Phoenix.Ecto.SQL.Sandbox.metadata_for(Snippetbox.Repo, self())
+    {:ok, session} = Wallaby.start_session(metadata: metadata)
+
+    {:ok, session: session}
+  end
+end
@@ -0,0 +1,26 @@
+
+defmodule Snippetbox.SnippetsFixtures do
+  alias Snippetbox.Snippets
+
+  def unique_snippet_title, do: "snippet#{System.unique_integer()}"
+
+  def valid_snippet_attributes(attrs \\ %{}) do
+    Enum.into(attrs, %{
+      title: unique_snippet_title(),
+      content: "defmodule Test do\nend",
+      language: "elixir"
+    })
+  end
+
+  def snippet_fixture(attrs \\ %{}) do
+    user_id = attrs[:user_id] || Snippetbox.AccountsFixtures.user_fixture().id
+
+    {:ok, snippet} =
+      attrs
+      |> Enum.into(%{user_id: user_id})
+      |> valid_snippet_attributes()
+      |> Snippets.create_snippet()
+
+    snippet
+  end
+end
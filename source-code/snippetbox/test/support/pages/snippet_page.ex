@@ -0,0 +1,65 @@
+
+defmodule SnippetboxWeb.Pages.SnippetPage do
+  use Wallaby.DSL
+
+  def visit_index(session) do
+    visit(session, "/snippets")
+  end
+
+  def visit_new(session) do
+    visit(session, "/snippets/new")
+  end
+
+  def visit_show(session, snippet) do
+    visit(session, "/snippets/#{snippet.id}")
+  end
+
+  def fill_form(session, attrs) do
+    session
+    |> fill_in(Query.text_field("Title"), with: attrs[:title] || "")
+    |> fill_in(Query.css("textarea[name='snippet[content]']"), with: attrs[:content] || "")
+    |> select(Query.select("Language"), option: attrs[:language] || "elixir")
+  end
+
+  def submit_form(session) do
+    click(session, Query.button("Save Snippet"))
+  end
+
+  def assert_snippet_displayed(session, snippet) do
+    session
+    |> assert_has(Query.css("h1", text: snippet.title))
+    |> assert_has(Query.css("code", text: snippet.content))
+  end
+
+  def click_edit(session) do
+    click(session, Query.link("Edit"))
+  end
+
+  def click_delete(session) do
+    accept_confirm(session, fn s ->
+      click(s, Query.button("Delete"))
+    end)
+  end
+end
+
+# Usage
+defmodule SnippetboxWeb.Features.SnippetPageObjectTest do
+  use SnippetboxWeb.FeatureCase
+
+  alias SnippetboxWeb.Pages.SnippetPage
+
+  feature "creates snippet using page object", %{session: session} do
+    user = user_fixture()
+
+    session
+    |> login(user)
+    |> SnippetPage.visit_new()
+    |> SnippetPage.fill_form(%{
+      title: "Page Object Test",
+      content: "defmodule Test do\nend",
+      language: "elixir"
+    })
+    |> SnippetPage.submit_form()
+    |> assert_has(Query.css(".alert-info", text: "created"))
+  end
+end
@@ -0,0 +1,24 @@
+
+defmodule SnippetboxWeb.PlugCase do
+  use ExUnit.CaseTemplate
+
+  using do
+    quote do
+      import Plug.Conn
+      import Phoenix.ConnTest
+      import SnippetboxWeb.PlugCase
+
+      @endpoint SnippetboxWeb.Endpoint
+    end
+  end
+
+  def conn_with_session do
+    Phoenix.ConnTest.build_conn()
+    |> Plug.Test.init_test_session(%{})
+  end
+
+  def conn_with_user(user) do
+    conn_with_session()
+    |> Plug.Conn.assign(:current_user, user)
+  end
+end
@@ -0,0 +1,53 @@
+
+defmodule Snippetbox.TestSeeds do
+  alias Snippetbox.Repo
+  alias Snippetbox.Accounts.User
+  alias Snippetbox.Snippets.Snippet
+
+  def seed_users(count \\ 5) do
+    for i <- 1..count do
+      %User{}
+      |> User.registration_changeset(%{
+        email: "user#{i}@test.com",
+        password: "password123456"
+      })
+      |> Repo.insert!()
+    end
+  end
+
+  def seed_snippets(user, count \\ 10) do
+    for i <- 1..count do
+      %Snippet{}
+      |> Snippet.changeset(%{
+        title: "Snippet #{i}",
+        content: "Code #{i}",
+        language: Enum.random(~w(elixir python javascript)),
+        user_id: user.id
+      })
+      |> Repo.insert!()
+    end
+  end
+end
+
+# Usage in tests
+defmodule Snippetbox.PaginationTest do
+  use Snippetbox.DataCase
+
+  alias Snippetbox.TestSeeds
+
+  setup do
+    [user | _] = TestSeeds.seed_users(1)
+    TestSeeds.seed_snippets(user, 50)
+    %{user: user}
+  end
+
+  test "paginates through all snippets" do
+    page1 = Snippets.list_snippets(page: 1, per_page: 20)
+    page2 = Snippets.list_snippets(page: 2, per_page: 20)
+    page3 = Snippets.list_snippets(page: 3, per_page: 20)
+
+    assert length(page1) == 20
+    assert length(page2) == 20
+    assert length(page3) == 10
+  end
+end
@@ -0,0 +1,32 @@
+
+defmodule Snippetbox.TestHelpers do
+  @doc """
+  Waits for a condition to be true.
+  """
+  def eventually(func, timeout \\ 1000) do
+    end_time = System.monotonic_time(:millisecond) + timeout
+    do_eventually(func, end_time)
+  end
+
+  defp do_eventually(func, end_time) do
+    if func.() do
+      :ok
+    else
+      if System.monotonic_time(:millisecond) < end_time do
+        Process.sleep(10)
+        do_eventually(func, end_time)
+      else
+        raise "Condition not met within timeout"
+      end
+    end
+  end
+
+  @doc """
+  Asserts that a function eventually returns true.
+  """
+  defmacro assert_eventually(expr, timeout \\ 1000) do
+    quote do
+      Snippetbox.TestHelpers.eventually(fn -> unquote(expr) end, unquote(timeout))
+    end
+  end
+end
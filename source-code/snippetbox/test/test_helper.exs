@@ -0,0 +1,3 @@
+
+ExUnit.start()
+Ecto.Adapters.SQL.Sandbox.mode(Snippetbox.Repo, :manual)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Builds of the guide with the basic converter
+
+The guide is built with the basic converter when the markdown library is
+missing, and with --basic when it is installed; the two must not drift
+apart. This builds a copy of the guide, with the golden fixtures of
+test_basic_markdown.py added as chapters, both ways: once with the markdown
+library hidden (sys.modules["markdown"] = None) and once with --basic.
+Both builds must write the same files, and each fixture chapter's page
+must hold exactly its expected HTML, with chapter links pointed at the
+generated pages. Pygments is hidden in both builds, as it is for the
+golden tests.
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent
+BASE_DIR = TESTS_DIR.parent
+FIXTURES_DIR = TESTS_DIR / "fixtures" / "basic"
+sys.path.insert(0, str(BASE_DIR))
+
+from convert_guide import load_chapter_index
+from link_graph import rewrite_links
+
+# Files copied into the throwaway repo each build runs in
+REPO_FILES = ["*.py", "guide", "html/index.html", "html/assets"]
+
+# Fixture chapters are numbered after the guide's own
+FIXTURE_PART = 90
+
+# Runs convert_guide.main() with the modules named in argv[1] (comma-separated) hidden
+BUILD_SCRIPT = """
+import sys
+for name in filter(None, sys.argv[1].split(",")):
+    sys.modules[name] = None
+import convert_guide
+convert_guide.main(sys.argv[2:])
+"""
+
+# Generated files, relative to the repo, that a build writes
+OUTPUT_DIRS = ["html", "source-code"]
+
+# Where a page's chapter body starts and ends
+BODY_START = '<main class="wrapper text">\n'
+BODY_END = '\n    </main>'
+
+def make_repo_copy(repo_dir):
+    """A copy of the converter and the guide, with the fixtures added as chapters"""
+
+    for pattern in REPO_FILES:
+        for path in BASE_DIR.glob(pattern):
+            target = repo_dir / path.relative_to(BASE_DIR)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if path.is_dir():
+                shutil.copytree(path, target)
+            else:
+                shutil.copy2(path, target)
+    for number, md_file in enumerate(sorted(FIXTURES_DIR.glob("*.md")), 1):
+        shutil.copy2(md_file, repo_dir / "guide" / fixture_slug(number, md_file))
+
+def fixture_slug(number, md_file):
+    """Chapter file name the number'th fixture is built under"""
+    return f"{FIXTURE_PART}.{number:02d}-{md_file.name}"
+
+def build(repo_dir, hidden, options):
+    """Build the guide in repo_dir with the modules in hidden unimportable"""
+
+    result = subprocess.run([sys.executable, "-c", BUILD_SCRIPT, ",".join(hidden), "--jobs", "1"] + options,
+                            cwd=repo_dir, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise AssertionError(f"build failed:\n{result.stdout}{result.stderr}")
+
+def output_files(repo_dir):
+    """{path relative to repo_dir: bytes} of every file the build generated"""
+
+    return {str(path.relative_to(repo_dir)): path.read_bytes()
+            for output_dir in OUTPUT_DIRS
+            for path in sorted((repo_dir / output_dir).rglob("*")) if path.is_file()}
+
+def page_body(page):
+    """The chapter body of a generated page"""
+
+    start = page.index(BODY_START) + len(BODY_START)
+    return page[start:page.index(BODY_END, start)].strip() + "\n"
+
+class BasicBuildTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory(prefix="test-basic-build-")
+        tmp = Path(cls.tmp.name)
+        cls.without_markdown = tmp / "without-markdown"
+        cls.with_basic = tmp / "with-basic"
+        for repo_dir in (cls.without_markdown, cls.with_basic):
+            make_repo_copy(repo_dir)
+        build(cls.without_markdown, ["markdown", "pygments"], [])
+        build(cls.with_basic, ["pygments"], ["--basic"])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_same_output(self):
+        expected = output_files(self.without_markdown)
+        got = output_files(self.with_basic)
+        self.assertEqual(sorted(got), sorted(expected))
+        differences = [name for name in expected if got[name] != expected[name]]
+        self.assertEqual(differences, [], "files differ between the two builds")
+
+    def test_fixture_pages(self):
+        fixtures = sorted(FIXTURES_DIR.glob("*.md"))
+        self.assertTrue(fixtures, f"no fixtures in {FIXTURES_DIR}")
+        index = load_chapter_index(self.with_basic)
+        for number, md_file in enumerate(fixtures, 1):
+            with self.subTest(fixture=md_file.name):
+                page_name = Path(fixture_slug(number, md_file)).with_suffix(".html").name
+                expected = rewrite_links(md_file.with_suffix(".html").read_text(encoding='utf-8'), index)
+                for repo_dir in (self.without_markdown, self.with_basic):
+                    page = (repo_dir / "html" / page_name).read_text(encoding='utf-8')
+                    self.assertEqual(page_body(page), expected.strip() + "\n")
+
+if __name__ == "__main__":
+    unittest.main()
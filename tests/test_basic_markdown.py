@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Golden-output tests for the basic markdown converter
+
+Each fixtures/basic/<name>.md is converted with basic_markdown_to_html()
+and compared with fixtures/basic/<name>.html. Highlighting is switched off,
+so the expected output does not depend on whether pygments is installed.
+After an intended change to the converter, rewrite the expected files with
+
+  UPDATE_GOLDEN=1 ./run_tests.sh
+
+and review the diff before committing it.
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent
+FIXTURES_DIR = TESTS_DIR / "fixtures" / "basic"
+sys.path.insert(0, str(TESTS_DIR.parent))
+
+import convert_guide
+
+class BasicMarkdownGoldenTest(unittest.TestCase):
+    def setUp(self):
+        use_pygments = convert_guide.USE_PYGMENTS
+        convert_guide.USE_PYGMENTS = False
+        self.addCleanup(setattr, convert_guide, 'USE_PYGMENTS', use_pygments)
+
+    def test_fixtures(self):
+        fixtures = sorted(FIXTURES_DIR.glob("*.md"))
+        self.assertTrue(fixtures, f"no fixtures in {FIXTURES_DIR}")
+        for md_file in fixtures:
+            with self.subTest(fixture=md_file.name):
+                html = convert_guide.basic_markdown_to_html(md_file.read_text(encoding='utf-8')) + "\n"
+                expected_file = md_file.with_suffix(".html")
+                if os.environ.get("UPDATE_GOLDEN"):
+                    expected_file.write_text(html, encoding='utf-8')
+                self.assertEqual(html, expected_file.read_text(encoding='utf-8'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming search indexer
+
+A page is indexed chunk by chunk as it is written, so the terms found must
+not depend on where the chunks are cut, and the memory the indexer holds
+must grow with its postings rather than with the page.
+"""
+
+import json
+import sys
+import tracemalloc
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from search_index import SearchIndexer
+
+PAGE = (
+    '<h1 id="routing">Routing &amp; Requests</h1>\n'
+    '<p>The router matches each <code>conn</code> against the routes, then calls '
+    'the controller&#x27;s action.</p>\n'
+    '<figure class="code"><pre><code>ignored &lt;markup&gt;</code></pre></figure>\n'
+    '<h2 id="scopes">Scopes and <em>pipelines</em></h2>\n'
+    '<p>Pipelines run plugs before the controller; scopes group routes under a path.</p>\n'
+)
+CODE_BLOCKS = [[None, "get \"/\", PageController, :home"]]
+
+def index_chunks(chunks, code_blocks=None):
+    indexer = SearchIndexer(code_blocks)
+    for _ in indexer.observe(chunks):
+        pass
+    return json.loads(json.dumps(indexer.result(), default=list))
+
+def large_page(sections, paragraphs):
+    """Chunks of a generated page, produced one at a time"""
+
+    for section in range(sections):
+        yield f'<h2 id="section-{section}">Section {section}</h2>\n'
+        for paragraph in range(paragraphs):
+            yield (f'<p>Paragraph {paragraph} explains how plug pipelines transform the connection '
+                   f'before controller actions render templates with assigns number {paragraph % 97}.</p>\n')
+
+class SearchIndexerTest(unittest.TestCase):
+    def test_chunk_boundaries(self):
+        whole = index_chunks([PAGE], CODE_BLOCKS)
+        self.assertIn("routing", whole["postings"])
+        self.assertIn("home", whole["postings"])
+        self.assertNotIn("ignored", whole["postings"])
+        self.assertEqual(whole["sections"][2], ["scopes", "Scopes and pipelines"])
+
+        # Cut the page everywhere outside a tag, including inside words and
+        # entities, but not inside the code figure, which is one chunk as written
+        figure = range(PAGE.index('<figure'), PAGE.index('</figure>'))
+        cuts = [i for i in range(1, len(PAGE))
+                if PAGE.rfind('<', 0, i) <= PAGE.rfind('>', 0, i) and i not in figure]
+        for size in (1, 2, 3, 7):
+            with self.subTest(size=size):
+                points = [0] + cuts[::size] + [len(PAGE)]
+                chunks = [PAGE[start:end] for start, end in zip(points, points[1:])]
+                self.assertEqual(index_chunks(chunks, CODE_BLOCKS), whole)
+
+    def test_memory_bounded(self):
+        sections, paragraphs = 100, 200
+        page_bytes = sum(len(chunk) for chunk in large_page(sections, paragraphs))
+
+        tracemalloc.start()
+        try:
+            indexer = SearchIndexer()
+            for _ in indexer.observe(large_page(sections, paragraphs)):
+                pass
+            indexer.result()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        # The postings take about 4 bytes a word; keeping the chunks alone
+        # would take the size of the page, and a list of its words far more
+        self.assertLess(peak, page_bytes * 3 // 4, f"{peak} bytes held while indexing {page_bytes} bytes")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Watch the guide sources, rebuild changed chapters and live-reload the browser
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import mimetypes
+import os
+import struct
+import time
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import convert_guide
+
+# inotify event bits (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY
+EVENT_HEADER = struct.Struct('iIII')
+
+# Editors often write a file in several steps; wait this long for them to settle
+DEBOUNCE_SECONDS = 0.02
+POLL_INTERVAL = 0.25
+
+RELOAD_PATH = "/__livereload"
+RELOAD_SCRIPT = (f'<script>new EventSource("{RELOAD_PATH}")'
+                 '.onmessage = function () { location.reload(); };</script>')
+
+class InotifyWatcher:
+    """Report changed file names in a set of directories using Linux inotify"""
+
+    def __init__(self, directories):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify is not available")
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.directories = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self.directories[wd] = Path(directory)
+
+    def read_changes(self):
+        """Paths touched since the last call"""
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name and wd in self.directories:
+                    changed.add(self.directories[wd] / os.fsdecode(name))
+
+    def attach(self, loop, callback):
+        """Call callback(paths) from the event loop whenever files change"""
+        loop.add_reader(self.fd, lambda: callback(self.read_changes()))
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Report changed file names by comparing mtimes and sizes periodically"""
+
+    def __init__(self, directories):
+        self.directories = [Path(directory) for directory in directories]
+        self.snapshot = self.scan()
+        self.task = None
+
+    def scan(self):
+        """Current (mtime, size) of every file in the watched directories"""
+
+        snapshot = {}
+        for directory in self.directories:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read_changes(self):
+        """Paths added, removed or modified since the last call"""
+
+        snapshot = self.scan()
+        changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                   if snapshot.get(path) != self.snapshot.get(path)}
+        self.snapshot = snapshot
+        return changed
+
+    def attach(self, loop, callback):
+        """Call callback(paths) from the event loop whenever files change"""
+
+        async def poll():
+            while True:
+                await asyncio.sleep(POLL_INTERVAL)
+                changed = self.read_changes()
+                if changed:
+                    callback(changed)
+
+        self.task = loop.create_task(poll())
+
+    def close(self):
+        if self.task:
+            self.task.cancel()
+
+def make_watcher(directories):
+    """Prefer inotify, falling back to polling where it is unavailable"""
+
+    try:
+        return InotifyWatcher(directories)
+    except (OSError, AttributeError) as e:
+        print(f"Note: inotify unavailable ({e}), polling for changes")
+        return PollingWatcher(directories)
+
+def chapters_to_rebuild(changed_slugs, old_index, new_index):
+    """Changed chapters plus their old and new neighbours
+
+    Neighbours only matter when chapters are added or removed; the build
+    manifest skips any of them whose navigation did not actually change.
+    """
+
+    slugs = set(changed_slugs)
+    for slug in changed_slugs:
+        for index in (old_index, new_index):
+            for neighbour in (index.prev(slug), index.next(slug)):
+                if neighbour:
+                    slugs.add(neighbour)
+    return slugs & set(new_index.by_slug)
+
+class LiveReloadServer:
+    """Serve html/ over HTTP and push reload events over Server-Sent Events"""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self.clients = set()
+
+    def reload(self):
+        """Tell every connected browser to reload"""
+        for queue in self.clients:
+            queue.put_nowait("reload")
+
+    async def handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+
+            parts = request_line.decode('latin-1').split()
+            if len(parts) < 2 or parts[0] not in ('GET', 'HEAD'):
+                await self.respond(writer, 405, b'Method Not Allowed', 'text/plain')
+                return
+
+            path = unquote(urlsplit(parts[1]).path)
+            if path == RELOAD_PATH:
+                await self.stream_events(writer)
+                return
+
+            await self.serve_file(writer, path, head_only=parts[0] == 'HEAD')
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, body, content_type, head_only=False):
+        reason = {200: 'OK', 404: 'Not Found', 405: 'Method Not Allowed'}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\n"
+                     f"Content-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     "Cache-Control: no-store\r\n"
+                     "Connection: close\r\n\r\n".encode('latin-1'))
+        if not head_only:
+            writer.write(body)
+        await writer.drain()
+
+    async def serve_file(self, writer, path, head_only=False):
+        target = (self.root / path.lstrip('/')).resolve()
+        if target.is_dir():
+            target = target / "index.html"
+        if self.root not in target.parents or not target.is_file():
+            await self.respond(writer, 404, b'Not Found', 'text/plain', head_only)
+            return
+
+        body = target.read_bytes()
+        content_type = mimetypes.guess_type(target.name)[0] or 'application/octet-stream'
+        if content_type == 'text/html':
+            body = body.replace(b'</body>', RELOAD_SCRIPT.encode('utf-8') + b'\n</body>', 1)
+            content_type = 'text/html; charset=utf-8'
+        await self.respond(writer, 200, body, content_type, head_only)
+
+    async def stream_events(self, writer):
+        queue = asyncio.Queue()
+        self.clients.add(queue)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\n"
+                         b"Content-Type: text/event-stream\r\n"
+                         b"Cache-Control: no-store\r\n"
+                         b"Connection: keep-alive\r\n\r\n")
+            await writer.drain()
+            while True:
+                event = await queue.get()
+                writer.write(f"data: {event}\n\n".encode('utf-8'))
+                await writer.drain()
+        finally:
+            self.clients.discard(queue)
+
+async def watch_async(base_dir, host, port, jobs, minify=False):
+    """Serve the guide and rebuild/reload on every change until cancelled"""
+
+    guide_dir = base_dir / "guide"
+    css_file = base_dir / "html" / "assets" / "css" / "main.css"
+    watched = [guide_dir] + ([css_file.parent] if css_file.parent.is_dir() else [])
+
+    server = LiveReloadServer(base_dir / "html")
+    http = await asyncio.start_server(server.handle, host, port)
+    print(f"Serving html/ at http://{host}:{port}/ (Ctrl+C to stop)")
+
+    loop = asyncio.get_running_loop()
+    pending = set()
+    flush_handle = None
+    build_lock = asyncio.Lock()
+
+    async def rebuild(paths):
+        async with build_lock:
+            await rebuild_locked(paths)
+
+    async def rebuild_locked(paths):
+        start = time.perf_counter()
+        slugs = {path.stem for path in paths
+                 if path.parent == guide_dir and convert_guide.CHAPTER_FILE_RE.match(path.name)}
+        overrides_changed = guide_dir / convert_guide.TITLE_OVERRIDES_NAME in paths
+        # Pages link the stylesheet by a hash of its content, so a change rebuilds them all
+        css_changed = css_file in paths
+
+        if slugs or overrides_changed or css_changed:
+            old_index = convert_guide.get_chapter_index()
+            new_index = await loop.run_in_executor(None, convert_guide.load_chapter_index, base_dir)
+            if overrides_changed or css_changed:
+                only = None
+            else:
+                only = chapters_to_rebuild(slugs, old_index, new_index)
+            converted, _, written = await loop.run_in_executor(
+                None, lambda: convert_guide.build(base_dir, False, jobs, only, minify=minify))
+            if not written:
+                return
+        else:
+            return
+
+        server.reload()
+        print(f"↻ Reloaded in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    # Rebuilds in progress, kept so they are not garbage collected before they finish
+    rebuilds = set()
+
+    def rebuild_done(task):
+        rebuilds.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            print(f"✗ Rebuild failed: {type(error).__name__}: {error}")
+
+    def flush():
+        nonlocal flush_handle
+        flush_handle = None
+        paths = set(pending)
+        pending.clear()
+        task = loop.create_task(rebuild(paths))
+        rebuilds.add(task)
+        task.add_done_callback(rebuild_done)
+
+    def on_change(paths):
+        nonlocal flush_handle
+        pending.update(paths)
+        if flush_handle is None:
+            flush_handle = loop.call_later(DEBOUNCE_SECONDS, flush)
+
+    watcher = make_watcher(watched)
+    watcher.attach(loop, on_change)
+    try:
+        async with http:
+            await http.serve_forever()
+    finally:
+        watcher.close()
+
+def watch(base_dir, host="127.0.0.1", port=8000, jobs=1, minify=False):
+    """Blocking entry point for convert_guide.py --watch"""
+
+    try:
+        asyncio.run(watch_async(Path(base_dir), host, port, jobs, minify))
+    except KeyboardInterrupt:
+        print()
+        print("Stopped watching.")
+
+if __name__ == "__main__":
+    base_dir = Path(__file__).parent
+    convert_guide.build(base_dir)
+    watch(base_dir)